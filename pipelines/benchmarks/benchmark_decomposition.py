@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+BB-1 Decomposition Micro-Benchmark
+
+Times decompose_multi_person() in transform_black_book_l1.py against the
+original three-regex implementation (decompose_multi_person_legacy) on a
+synthetic black book name column:
+
+- legacy: original patterns, one call per row
+- cold:   compiled engine with an empty cache (first transform run)
+- warm:   compiled engine, cache already populated (repeat names)
+- batch:  decompose_multi_persons() over the whole column, cold cache
+
+Names mix single people, "&"/"and" couples in all three layouts, and
+"+"/comma lists of three or more. Each distinct name repeats --repeat times
+on average, mimicking recurring household entries. Two-person results must
+match the original implementation (check_decomposition_equivalence).
+
+No database needed.
+
+Usage:
+    python pipelines/benchmarks/benchmark_decomposition.py
+    python pipelines/benchmarks/benchmark_decomposition.py --rows 200000 --repeat 20
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "pipelines" / "processing"))
+
+import transform_black_book_l1 as black_book_l1  # noqa: E402
+
+SURNAMES = ["Smith", "Jones", "Brown", "Taylor", "Wilson", "Davies", "Evans", "Thomas",
+            "Johnson", "Roberts", "Walker", "Wright", "Robinson", "Thompson", "White"]
+FIRST_NAMES = ["John", "Mary", "Peter", "Anne", "David", "Sarah", "James", "Ann Marie",
+               "Robert", "Linda", "Michael", "Susan", "William", "Karen", "Richard"]
+
+
+def synthetic_names(rows: int, repeat: int, seed: int = 0) -> list[tuple[str, str, str]]:
+    """
+    Build (name, surname, first_name) rows with ~rows/repeat distinct names.
+    """
+    rng = random.Random(seed)
+    
+    def one():
+        surname = rng.choice(SURNAMES)
+        firsts = rng.sample(FIRST_NAMES, rng.choice((1, 1, 1, 2, 2, 3)))
+        if len(firsts) == 1:
+            return f"{surname}, {firsts[0]}", surname, firsts[0]
+        
+        sep = rng.choice((" & ", " and ", " + "))
+        joined = sep.join(firsts) if len(firsts) == 2 else ", ".join(firsts[:-1]) + sep + firsts[-1]
+        layout = rng.randrange(3)
+        if layout == 0 or len(firsts) > 2:
+            return f"{surname}, {joined}", surname, ""
+        if layout == 1:
+            return f"{surname} {joined}", surname, ""
+        return f"{joined} {surname}", surname, ""
+    
+    distinct = [one() for _ in range(max(1, rows // repeat))]
+    return [rng.choice(distinct) for _ in range(rows)]
+
+
+def timed(func) -> float:
+    t0 = time.perf_counter()
+    func()
+    return time.perf_counter() - t0
+
+
+def run_benchmark(rows: int, repeat: int) -> int:
+    """Run all variants; returns process exit code."""
+    data = synthetic_names(rows, repeat)
+    names, surnames, first_names = (list(col) for col in zip(*data))
+    distinct = len(set(data))
+    print(f"\n  {rows:,} rows, {distinct:,} distinct names")
+    
+    def per_row(func):
+        return lambda: [func(n, s, f) for n, s, f in data]
+    
+    results = []
+    
+    results.append(("legacy", timed(per_row(black_book_l1.decompose_multi_person_legacy))))
+    
+    black_book_l1._decompose.cache_clear()
+    results.append(("cold", timed(per_row(black_book_l1.decompose_multi_person))))
+    
+    results.append(("warm", timed(per_row(black_book_l1.decompose_multi_person))))
+    
+    black_book_l1._decompose.cache_clear()
+    results.append(("batch", timed(lambda: black_book_l1.decompose_multi_persons(names, surnames, first_names))))
+    
+    # Report
+    legacy_elapsed = results[0][1]
+    print("\n" + "=" * 60)
+    print(f"{'Variant':<10} {'Seconds':>10} {'Rows/s':>14} {'vs legacy':>12}")
+    print("-" * 60)
+    for variant, elapsed in results:
+        print(f"{variant:<10} {elapsed:>10.3f} {rows / elapsed:>14,.0f} {legacy_elapsed / elapsed:>11.1f}x")
+    print("=" * 60)
+    
+    print("\nTwo-person equivalence with the original patterns:")
+    mismatches = black_book_l1.check_decomposition_equivalence(
+        [{"name": n, "surname": s, "first_name": f} for n, s, f in set(data)]
+    )
+    if mismatches:
+        print(f"  ✗ {mismatches:,} distinct names differ")
+        return 1
+    print("  ✓ identical")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BB-1 multi-person decomposition")
+    parser.add_argument("--rows", type=int, default=100_000,
+                        help="Rows in the synthetic name column (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="Average occurrences of each distinct name (default: 10)")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Epstein Files ARD - BB-1 Decomposition Benchmark")
+    print("=" * 60)
+    
+    return run_benchmark(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Flight Logs L1 Transform Benchmark
+
+Times the transform engines in transform_flight_logs_l1.py side by side on a
+synthetic copy of core.flight_logs scaled N times (default 100x):
+
+- python: fetchall + client-side transform + COPY
+- stream: python engine over a server-side cursor (--stream)
+- sql:    set-based transform inside PostgreSQL (--engine sql)
+
+Each copy of the core table gets distinct L0 ids and tail numbers, so
+flights scale with passengers. After each engine the L1 tables are
+fingerprinted; every engine must produce identical rows.
+
+Everything runs in a single transaction that is rolled back, so core and
+L1 contents are unchanged afterwards. The L1 TRUNCATEs hold exclusive locks
+until then, so do not run this against a database serving L1 reads.
+
+Usage:
+    python pipelines/benchmarks/benchmark_flight_transform.py
+    python pipelines/benchmarks/benchmark_flight_transform.py --scale 10 --engines python sql
+
+Requirements:
+    pip install psycopg[binary] python-dotenv
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "pipelines" / "processing"))
+
+import transform_flight_logs_l1 as flight_l1  # noqa: E402
+from date_normalization import reset_date_cache  # noqa: E402
+
+BENCH_TABLE = "flight_logs_bench"
+
+ENGINES = {
+    "python": lambda conn: flight_l1.transform_flight_logs(conn=conn, source_table=BENCH_TABLE),
+    "stream": lambda conn: flight_l1.transform_flight_logs_streaming(conn=conn, source_table=BENCH_TABLE),
+    "sql": lambda conn: flight_l1.transform_flight_logs_sql(conn=conn, source_table=BENCH_TABLE),
+}
+
+
+def create_synthetic_table(cur, scale: int) -> int:
+    """
+    Build a temp table holding `scale` copies of core.flight_logs.
+    
+    Returns:
+        int: Row count
+    """
+    select_cols = []
+    for col in flight_l1.L0_COLUMNS:
+        if col == "id":
+            select_cols.append("fl.id + copy.n * max_id.v AS id")
+        elif col == "aircraft_tail":
+            # Distinct tails per copy -> distinct flight_ids per copy
+            select_cols.append(
+                "CASE WHEN copy.n = 0 THEN fl.aircraft_tail "
+                "ELSE fl.aircraft_tail || '-' || copy.n END AS aircraft_tail"
+            )
+        else:
+            select_cols.append(f"fl.{col}")
+    
+    cur.execute(f"""
+        CREATE TEMP TABLE {BENCH_TABLE} ON COMMIT DROP AS
+        SELECT {", ".join(select_cols)}
+        FROM core.flight_logs fl
+        CROSS JOIN generate_series(0, %s) AS copy(n)
+        CROSS JOIN (SELECT MAX(id) FROM core.flight_logs) AS max_id(v)
+    """, (scale - 1,))
+    cur.execute(f"ALTER TABLE {BENCH_TABLE} ADD PRIMARY KEY (id)")
+    cur.execute(f"ANALYZE {BENCH_TABLE}")
+    
+    cur.execute(f"SELECT COUNT(*) FROM {BENCH_TABLE}")
+    return cur.fetchone()[0]
+
+
+def l1_fingerprint(cur) -> tuple[int, int, str]:
+    """
+    Fingerprint the transform-owned L1 columns (created_at excluded).
+    
+    Returns:
+        (flight_count, passenger_count, md5 over both tables)
+    """
+    digests = []
+    counts = []
+    for table, cols, key in (
+        ("l1.flight_events", flight_l1.FLIGHT_COLS, "flight_id"),
+        ("l1.flight_passengers", flight_l1.PASSENGER_COLS, "passenger_id"),
+    ):
+        cur.execute(f"""
+            SELECT COUNT(*), md5(string_agg(md5(ROW({", ".join(cols)})::text), '' ORDER BY {key}))
+            FROM {table}
+        """)
+        count, digest = cur.fetchone()
+        counts.append(count)
+        digests.append(digest or "")
+    
+    return counts[0], counts[1], "".join(digests)
+
+
+def run_benchmark(scale: int, engines: list[str], verbose: bool = False) -> int:
+    """Run the engines on the synthetic table; returns process exit code."""
+    with flight_l1.get_connection() as conn:
+        flight_l1.create_tables(conn)
+        
+        try:
+            with conn.cursor() as cur:
+                print(f"\nBuilding synthetic core table ({scale}x)...")
+                t0 = time.perf_counter()
+                row_count = create_synthetic_table(cur, scale)
+                print(f"  {row_count:,} rows in {time.perf_counter() - t0:.1f}s")
+                
+                results = []
+                for engine in engines:
+                    # Cold caches so every engine starts from the same state
+                    flight_l1.score_passenger.cache_clear()
+                    reset_date_cache()
+                    
+                    print(f"\nRunning engine: {engine}...")
+                    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+                    t0 = time.perf_counter()
+                    with output:
+                        ENGINES[engine](conn)
+                    elapsed = time.perf_counter() - t0
+                    
+                    flights, passengers, fingerprint = l1_fingerprint(cur)
+                    results.append((engine, elapsed, flights, passengers, fingerprint))
+                    print(f"  {elapsed:.2f}s ({row_count / elapsed:,.0f} rows/s)")
+        finally:
+            # Leave core and L1 exactly as they were
+            conn.rollback()
+    
+    # Report
+    print("\n" + "=" * 70)
+    print(f"{'Engine':<10} {'Seconds':>10} {'Rows/s':>12} {'Flights':>10} {'Passengers':>12}  Output")
+    print("-" * 70)
+    reference = results[0][4] if results else None
+    mismatched = False
+    for engine, elapsed, flights, passengers, fingerprint in results:
+        matches = fingerprint == reference
+        mismatched |= not matches
+        print(f"{engine:<10} {elapsed:>10.2f} {row_count / elapsed:>12,.0f} {flights:>10,} {passengers:>12,}  "
+              f"{'✓ identical' if matches else '✗ differs'}")
+    print("=" * 70)
+    
+    if len(results) > 1:
+        fastest = min(results, key=lambda r: r[1])
+        slowest = max(results, key=lambda r: r[1])
+        print(f"{fastest[0]} is {slowest[1] / fastest[1]:.1f}x faster than {slowest[0]}")
+    
+    return 1 if mismatched else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark flight log L1 transform engines")
+    parser.add_argument("--scale", type=int, default=100,
+                        help="Copies of core.flight_logs in the synthetic table (default: 100)")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES),
+                        help="Engines to run, in order (default: all)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show each engine's own output")
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print("Epstein Files ARD - Flight Logs L1 Transform Benchmark")
+    print("=" * 70)
+    
+    try:
+        return run_benchmark(args.scale, args.engines, args.verbose)
+    except Exception as e:
+        print(f"\nERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Candidate Pair Similarity Benchmark
+
+Times score_name_pairs() in string_similarity.py (all SCORE_COLUMNS for a
+batch of (first, last) name pairs) against a naive per-pair Python loop on
+synthetic candidate pairs:
+
+- naive:     one Python call per pair and score, no reuse of repeated pairs
+- python:    batch scorer, pure-Python kernels (distinct pairs scored once)
+- rapidfuzz: batch scorer, rapidfuzz C++ kernels via process.cpdist
+             (skipped when rapidfuzz is not installed)
+
+Pairs are drawn from a pool of surnames and first names with random
+spelling variants (dropped, doubled or swapped letters), some missing first
+names, and swapped first/last order, so scores span the whole 0-1 range.
+Every variant must match the naive loop's scores.
+
+No database needed.
+
+Usage:
+    python pipelines/benchmarks/benchmark_similarity.py
+    python pipelines/benchmarks/benchmark_similarity.py --pairs 500000 --workers 8
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "pipelines" / "processing"))
+
+import string_similarity as similarity  # noqa: E402
+
+SURNAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+            "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas",
+            "Taylor", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris",
+            "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", "King", "O'Brien"]
+FIRST_NAMES = ["John", "Mary", "Michael", "Patricia", "Robert", "Jennifer", "William",
+               "Linda", "David", "Elizabeth", "Richard", "Barbara", "Joseph", "Susan",
+               "Thomas", "Jessica", "Charles", "Sarah", "Christopher", "Karen", "José",
+               "Ann Marie", "Jean-Luc"]
+
+# Allowed score difference (rapidfuzz and Python may round differently)
+TOLERANCE = 1e-9
+
+
+def variant(rng: random.Random, name: str) -> str:
+    """name, or a one-letter spelling variant of it."""
+    if len(name) < 3 or rng.random() < 0.6:
+        return name
+    i = rng.randrange(1, len(name) - 1)
+    edit = rng.randrange(3)
+    if edit == 0:
+        return name[:i] + name[i + 1:]
+    if edit == 1:
+        return name[:i] + name[i] + name[i:]
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def synthetic_pairs(pairs: int, seed: int = 0) -> tuple[list[tuple], list[tuple]]:
+    """
+    Build `pairs` candidate (first, last) name pairs.
+    
+    Returns:
+        (names_a, names_b)
+    """
+    rng = random.Random(seed)
+    
+    def one(surname):
+        first = variant(rng, rng.choice(FIRST_NAMES)) if rng.random() > 0.1 else None
+        last = variant(rng, surname)
+        if rng.random() < 0.05:
+            return last, first
+        return first, last
+    
+    names_a = []
+    names_b = []
+    for _ in range(pairs):
+        # Candidates mostly share a surname, like blocked pairs do
+        surname = rng.choice(SURNAMES)
+        names_a.append(one(surname))
+        names_b.append(one(surname if rng.random() < 0.8 else rng.choice(SURNAMES)))
+    return names_a, names_b
+
+
+def naive_scores(names_a: list[tuple], names_b: list[tuple]) -> dict[str, list]:
+    """SCORE_COLUMNS with one kernel call per pair and score."""
+    def score(kernel, a, b):
+        if not a or not b:
+            return None
+        a = similarity.normalize_value(a)
+        b = similarity.normalize_value(b)
+        return kernel(a, b) if a and b else None
+    
+    scores = {col: [] for col in similarity.SCORE_COLUMNS}
+    for (first_a, last_a), (first_b, last_b) in zip(names_a, names_b):
+        scores["first_jaro_winkler"].append(score(similarity.jaro_winkler, first_a, first_b))
+        scores["last_jaro_winkler"].append(score(similarity.jaro_winkler, last_a, last_b))
+        scores["first_levenshtein"].append(score(similarity.levenshtein, first_a, first_b))
+        scores["last_levenshtein"].append(score(similarity.levenshtein, last_a, last_b))
+        scores["name_token_set"].append(score(
+            similarity.token_set,
+            similarity.full_name(first_a, last_a),
+            similarity.full_name(first_b, last_b),
+        ))
+    return scores
+
+
+def count_mismatches(scores: dict, reference: dict) -> int:
+    mismatches = 0
+    for col in similarity.SCORE_COLUMNS:
+        for value, expected in zip(scores[col], reference[col]):
+            if (value is None) != (expected is None):
+                mismatches += 1
+            elif value is not None and abs(value - expected) > TOLERANCE:
+                mismatches += 1
+    return mismatches
+
+
+def run_benchmark(pairs: int, workers: int) -> int:
+    """Run all variants; returns process exit code."""
+    names_a, names_b = synthetic_pairs(pairs)
+    distinct = len(set(zip(names_a, names_b)))
+    print(f"\n  {pairs:,} candidate pairs, {distinct:,} distinct name pairs")
+    
+    variants = {
+        "naive": lambda: naive_scores(names_a, names_b),
+        "python": lambda: similarity.score_name_pairs(names_a, names_b, backend="python"),
+    }
+    if similarity.RAPIDFUZZ_AVAILABLE:
+        variants["rapidfuzz"] = lambda: similarity.score_name_pairs(
+            names_a, names_b, backend="rapidfuzz", workers=workers
+        )
+    else:
+        print("  ⚠ rapidfuzz not installed, skipping the rapidfuzz variant (pip install rapidfuzz)")
+    
+    results = []
+    for name, func in variants.items():
+        # Same normalization cache state for every variant
+        similarity.normalize_value.cache_clear()
+        t0 = time.perf_counter()
+        scores = func()
+        results.append((name, time.perf_counter() - t0, scores))
+    
+    # Report
+    reference = results[0][2]
+    naive_elapsed = results[0][1]
+    mismatched = False
+    print("\n" + "=" * 70)
+    print(f"{'Variant':<10} {'Seconds':>10} {'Pairs/s':>14} {'vs naive':>10}  Output")
+    print("-" * 70)
+    for name, elapsed, scores in results:
+        mismatches = count_mismatches(scores, reference)
+        mismatched |= bool(mismatches)
+        print(f"{name:<10} {elapsed:>10.3f} {pairs / elapsed:>14,.0f} {naive_elapsed / elapsed:>9.1f}x  "
+              f"{'✓ identical' if not mismatches else f'✗ {mismatches:,} scores differ'}")
+    print("=" * 70)
+    
+    return 1 if mismatched else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark candidate pair name similarity scoring")
+    parser.add_argument("--pairs", type=int, default=200_000,
+                        help="Synthetic candidate pairs (default: 200000)")
+    parser.add_argument("--workers", type=int, default=-1,
+                        help="rapidfuzz scoring threads (default: -1, all cores)")
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print("Epstein Files ARD - Candidate Pair Similarity Benchmark")
+    print("=" * 70)
+    
+    return run_benchmark(args.pairs, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,6 +82,30 @@ CREATE TABLE IF NOT EXISTS core.black_book (
     imported_at TIMESTAMP DEFAULT NOW()
 );
 
+-- ============================================================================
+-- INGEST SCHEMA (Staging)
+-- ============================================================================
+
+-- ----------------------------------------------------------------------------
+-- L0 Change Manifest (written by import_l0_to_postgres.py --strategy upsert)
+-- ----------------------------------------------------------------------------
+
+-- Contract between upsert imports and the incremental L1 transforms: one row
+-- per changed L0 key per run, never updated
+CREATE TABLE IF NOT EXISTS ingest.l0_change_manifest (
+    run_id UUID NOT NULL,
+    table_name TEXT NOT NULL,            -- e.g. 'core.flight_logs'
+    record_key TEXT NOT NULL,            -- Primary key value as text
+    change_type VARCHAR(10) NOT NULL CHECK (change_type IN ('insert', 'update', 'delete')),
+    row_hash TEXT,                       -- md5 of the new row (NULL for deletes)
+    recorded_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_l0_change_manifest_run
+    ON ingest.l0_change_manifest(run_id);
+CREATE INDEX IF NOT EXISTS idx_l0_change_manifest_table
+    ON ingest.l0_change_manifest(table_name, recorded_at);
+
 -- ============================================================================
 -- L1 SCHEMA (Layer 1: Scalars)
 -- ============================================================================
@@ -150,6 +174,7 @@ CREATE TABLE IF NOT EXISTS l1.flight_passengers (
     suppress_from_public BOOLEAN DEFAULT FALSE,
     
     -- Metadata
+    l0_row_hash TEXT,  -- md5 of the core row this was built from (incremental mode)
     created_at TIMESTAMP DEFAULT NOW()
 );
 
@@ -175,6 +200,30 @@ SELECT
 FROM l1.flight_passengers
 WHERE suppress_from_public = FALSE;
 
+-- ----------------------------------------------------------------------------
+-- Flight Date Parser (used by transform_flight_logs_l1.py --engine sql)
+-- ----------------------------------------------------------------------------
+
+-- Mirrors date_normalization.parse_flight_date(): strptime("%m/%d/%Y") field
+-- rules, NULL instead of ValueError. Keep in sync with PARSE_FLIGHT_DATE_DDL.
+CREATE OR REPLACE FUNCTION l1.parse_flight_date(value TEXT) RETURNS DATE
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    parts TEXT[];
+BEGIN
+    parts := regexp_match(
+        regexp_replace(value, '^\s+|\s+$', '', 'g'),
+        '^(1[0-2]|0?[1-9])/(3[01]|[12][0-9]|0?[1-9]| [1-9])/([0-9]{4})$'
+    );
+    IF parts IS NULL THEN
+        RETURN NULL;
+    END IF;
+    RETURN make_date(parts[3]::INTEGER, parts[1]::INTEGER, btrim(parts[2])::INTEGER);
+EXCEPTION WHEN datetime_field_overflow THEN
+    RETURN NULL;  -- e.g. 2/30/1999, year 0000
+END;
+$$;
+
 -- ----------------------------------------------------------------------------
 -- Contacts (one per L0 black book record)
 -- ----------------------------------------------------------------------------
@@ -206,6 +255,7 @@ CREATE TABLE IF NOT EXISTS l1.contacts (
     email TEXT,
     
     -- Metadata
+    l0_row_hash TEXT,  -- md5 of the core row this was built from (incremental mode)
     created_at TIMESTAMP DEFAULT NOW()
 );
 
@@ -237,6 +287,7 @@ CREATE TABLE IF NOT EXISTS l1.contact_persons (
 );
 
 CREATE INDEX IF NOT EXISTS idx_contact_persons_contact ON l1.contact_persons(contact_id);
+CREATE INDEX IF NOT EXISTS idx_contact_persons_l0 ON l1.contact_persons(l0_record_id);
 CREATE INDEX IF NOT EXISTS idx_contact_persons_household ON l1.contact_persons(household_id);
 CREATE INDEX IF NOT EXISTS idx_contact_persons_name ON l1.contact_persons(extracted_last, extracted_first);
 
@@ -265,6 +316,7 @@ CREATE TABLE IF NOT EXISTS l1.phone_numbers (
 );
 
 CREATE INDEX IF NOT EXISTS idx_phone_numbers_contact ON l1.phone_numbers(contact_id);
+CREATE INDEX IF NOT EXISTS idx_phone_numbers_l0 ON l1.phone_numbers(l0_record_id);
 CREATE INDEX IF NOT EXISTS idx_phone_numbers_e164 ON l1.phone_numbers(e164_format) WHERE e164_format IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_phone_numbers_valid ON l1.phone_numbers(is_valid);
 
@@ -296,9 +348,15 @@ CREATE TABLE IF NOT EXISTS l1.identity_mentions (
     parse_type VARCHAR(20) CHECK (parse_type IN ('Person', 'Corporation', 'Household', 'Unknown')),
     parse_confidence DECIMAL(3,2),
     
-    -- Blocking codes (for entity resolution)
+    -- Blocking codes (for entity resolution, see blocking_keys.py)
     soundex_first VARCHAR(4),
     soundex_last VARCHAR(4),
+    nysiis_first VARCHAR(6),
+    nysiis_last VARCHAR(6),
+    dmetaphone_first VARCHAR(4),
+    dmetaphone_last VARCHAR(4),
+    dmetaphone_last_alt VARCHAR(4),
+    initial_last_key VARCHAR(4),
     
     -- Placeholder for M06 embeddings
     name_embedding vector(384),   -- Will be populated in M06
@@ -311,6 +369,18 @@ CREATE TABLE IF NOT EXISTS l1.identity_mentions (
 CREATE INDEX IF NOT EXISTS idx_identity_mentions_soundex 
     ON l1.identity_mentions(soundex_last, soundex_first);
 
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_nysiis 
+    ON l1.identity_mentions(nysiis_last, nysiis_first);
+
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_dmetaphone 
+    ON l1.identity_mentions(dmetaphone_last, dmetaphone_first);
+
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_dmetaphone_alt 
+    ON l1.identity_mentions(dmetaphone_last_alt) WHERE dmetaphone_last_alt IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_initial_last 
+    ON l1.identity_mentions(initial_last_key);
+
 CREATE INDEX IF NOT EXISTS idx_identity_mentions_source 
     ON l1.identity_mentions(source_table, source_id);
 
@@ -325,6 +395,62 @@ CREATE INDEX IF NOT EXISTS idx_identity_mentions_confidence
 --     ON l1.identity_mentions USING ivfflat (name_embedding vector_cosine_ops)
 --     WITH (lists = 100);
 
+-- ----------------------------------------------------------------------------
+-- Mention Candidates (entity resolution candidate pairs, build_mention_candidates.py)
+-- ----------------------------------------------------------------------------
+
+-- No foreign keys to l1.identity_mentions: build_identity_mentions.py
+-- TRUNCATEs that table on every build, which a referencing table would block
+CREATE TABLE IF NOT EXISTS l1.mention_candidates (
+    -- Ordered pair (mention_id_a < mention_id_b), one row per pair
+    mention_id_a UUID NOT NULL,
+    mention_id_b UUID NOT NULL,
+    
+    -- Blocking schemes that put both mentions in one block
+    blocking_schemes TEXT[] NOT NULL,
+    scheme_count INTEGER NOT NULL,
+    
+    -- Flight passenger x contact person pair
+    cross_source BOOLEAN NOT NULL,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (mention_id_a, mention_id_b),
+    CHECK (mention_id_a < mention_id_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_mention_candidates_b ON l1.mention_candidates(mention_id_b);
+CREATE INDEX IF NOT EXISTS idx_mention_candidates_schemes ON l1.mention_candidates(scheme_count);
+CREATE INDEX IF NOT EXISTS idx_mention_candidates_cross ON l1.mention_candidates(cross_source) WHERE cross_source;
+
+-- ----------------------------------------------------------------------------
+-- Mention Candidate Scores (name similarity per candidate pair, score_mention_candidates.py)
+-- ----------------------------------------------------------------------------
+
+-- REAL scores (compared against thresholds only); no foreign keys, as above
+CREATE TABLE IF NOT EXISTS l1.mention_candidate_scores (
+    -- Pair from l1.mention_candidates (mention_id_a < mention_id_b)
+    mention_id_a UUID NOT NULL,
+    mention_id_b UUID NOT NULL,
+    
+    -- Similarity 0-1 (see string_similarity.py); NULL where a name part is missing
+    first_jaro_winkler REAL,
+    last_jaro_winkler REAL,
+    first_levenshtein REAL,
+    last_levenshtein REAL,
+    name_token_set REAL,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (mention_id_a, mention_id_b),
+    CHECK (mention_id_a < mention_id_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_mention_candidate_scores_b ON l1.mention_candidate_scores(mention_id_b);
+CREATE INDEX IF NOT EXISTS idx_mention_candidate_scores_token_set ON l1.mention_candidate_scores(name_token_set);
+
 -- ============================================================================
 -- L2 SCHEMA (Layer 2: Vectors) - Placeholder for M06
 -- ============================================================================
@@ -6,7 +6,20 @@ Creates the epsteinfiles_ard database, schemas, and tables,
 then imports flight-logs.csv and black-book.csv into core schema.
 
 Usage:
-    python import_l0_to_postgres.py [--create-db] [--skip-import]
+    python import_l0_to_postgres.py [--create-db] [--skip-import] [--loader copy|insert]
+                                    [--strategy replace|upsert|swap] [--parallel]
+
+Loaders:
+    copy   - Stream rows through COPY FROM STDIN (default)
+    insert - Batched executemany INSERTs of BATCH_SIZE rows
+
+Strategies:
+    replace - TRUNCATE core tables and reload them (default)
+    upsert  - Load ingest.* staging tables, diff against core.* by primary key
+              and row hash, apply only inserts/updates/deletes, and record the
+              changed keys in ingest.l0_change_manifest for incremental L1 runs
+    swap    - Load and index a fresh table in ingest.*, then swap it into
+              core.* in one short transaction (readers never see partial data)
 
 Requirements:
     pip install psycopg[binary] python-dotenv
@@ -16,6 +29,9 @@ import argparse
 import csv
 import os
 import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import psycopg
@@ -39,6 +55,86 @@ DATA_DIR = PROJECT_ROOT / "data" / "layer-0-canonical"
 FLIGHT_LOGS_CSV = DATA_DIR / "flight-logs.csv"
 BLACK_BOOK_CSV = DATA_DIR / "black-book.csv"
 
+# Column mapping: CSV header -> DB column
+FLIGHT_LOGS_COLUMN_MAP = {
+    "ID": "id",
+    "Date": "date",
+    "Year": "year",
+    "Aircraft Model": "aircraft_model",
+    "Aircraft Tail #": "aircraft_tail",
+    "Aircraft Type": "aircraft_type",
+    "# of Seats": "num_seats",
+    "DEP: Code": "dep_code",
+    "ARR: Code": "arr_code",
+    "DEP": "dep_location",
+    "ARR": "arr_location",
+    "Flight_No.": "flight_no",
+    "Pass #": "pass_position",
+    "Unique ID": "unique_id",
+    "First Name": "first_name",
+    "Last Name": "last_name",
+    "Last, First": "last_first",
+    "First Last": "first_last",
+    "Comment": "comment",
+    "Initials": "initials",
+    "Known": "known",
+    "Data Source": "data_source"
+}
+FLIGHT_LOGS_INT_COLUMNS = ("id", "year", "num_seats")
+
+BLACK_BOOK_COLUMN_MAP = {
+    "record_id": "record_id",
+    "Page": "page",
+    "Page-Link": "page_link",
+    "Name": "name",
+    "Company/Add. Text": "company_text",
+    "Surname": "surname",
+    "First Name": "first_name",
+    "Address-Type": "address_type",
+    "Address": "address",
+    "Zip": "zip",
+    "City": "city",
+    "Country": "country",
+    "Phone (no specifics)": "phone_general",
+    "Phone (w) – work": "phone_work",
+    "Phone (h) – home": "phone_home",
+    "Phone (p) – portable/mobile": "phone_mobile",
+    "Email": "email"
+}
+BLACK_BOOK_INT_COLUMNS = ("page",)
+
+LOADERS = ("copy", "insert")
+
+# replace - TRUNCATE core table and reload it
+# upsert  - Load ingest.* staging table, apply only the diff to core.*
+# swap    - Build a complete copy in ingest.*, then swap it into core.*
+STRATEGIES = ("replace", "upsert", "swap")
+
+# Max wait for the ACCESS EXCLUSIVE lock during a swap before giving up
+SWAP_LOCK_TIMEOUT = os.getenv("SWAP_LOCK_TIMEOUT", "5s")
+
+# AI NOTE: Every L0 table loaded by this script. Tables must be independent of
+# each other (no cross-table FKs) because --parallel loads them concurrently.
+# Adding an L0 source means adding an entry here.
+L0_TABLES = {
+    "core.flight_logs": {
+        "label": "flight logs",
+        "csv": FLIGHT_LOGS_CSV,
+        "column_map": FLIGHT_LOGS_COLUMN_MAP,
+        "int_columns": FLIGHT_LOGS_INT_COLUMNS,
+        "key": "id",
+        "expected_count": 5001,
+    },
+    "core.black_book": {
+        "label": "black book",
+        "csv": BLACK_BOOK_CSV,
+        "column_map": BLACK_BOOK_COLUMN_MAP,
+        "int_columns": BLACK_BOOK_INT_COLUMNS,
+        "key": "record_id",
+        "expected_count": 2324,
+    },
+}
+
 
 def get_admin_connection():
     """Connect to postgres database (for admin operations)."""
@@ -110,6 +206,27 @@ def setup_schemas_and_extensions():
         conn.commit()
 
 
+# AI NOTE: The change manifest is the contract between upsert imports and the
+# incremental L1 transforms. One row per changed L0 key per run; record_key is
+# the table's primary key cast to text. Rows are never updated, so consumers
+# can track what they have processed by run_id or recorded_at.
+CHANGE_MANIFEST_DDL = """
+CREATE TABLE IF NOT EXISTS ingest.l0_change_manifest (
+    run_id UUID NOT NULL,
+    table_name TEXT NOT NULL,            -- e.g. 'core.flight_logs'
+    record_key TEXT NOT NULL,            -- Primary key value as text
+    change_type VARCHAR(10) NOT NULL CHECK (change_type IN ('insert', 'update', 'delete')),
+    row_hash TEXT,                       -- md5 of the new row (NULL for deletes)
+    recorded_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_l0_change_manifest_run
+    ON ingest.l0_change_manifest(run_id);
+CREATE INDEX IF NOT EXISTS idx_l0_change_manifest_table
+    ON ingest.l0_change_manifest(table_name, recorded_at);
+"""
+
+
 def create_tables():
     """Create L0 tables in core schema."""
     print("Creating L0 tables...")
@@ -178,155 +295,320 @@ def create_tables():
             
             cur.execute(black_book_ddl)
             print("  Created core.black_book")
+            
+            cur.execute(CHANGE_MANIFEST_DDL)
+            print("  Created ingest.l0_change_manifest")
         
         conn.commit()
 
 
-def import_flight_logs():
-    """Import flight-logs.csv to core.flight_logs."""
-    print(f"Importing flight logs from {FLIGHT_LOGS_CSV}")
+def import_table(
+    table: str,
+    loader: str = "copy",
+    strategy: str = "replace",
+    run_id: str | None = None,
+) -> int:
+    """Load one L0 table from its CSV (see L0_TABLES) using the given strategy."""
+    spec = L0_TABLES[table]
+    print(f"Importing {spec['label']} from {spec['csv']}")
     
-    if not FLIGHT_LOGS_CSV.exists():
-        print(f"  ERROR: File not found: {FLIGHT_LOGS_CSV}")
+    if not spec["csv"].exists():
+        print(f"  ERROR: File not found: {spec['csv']}")
         return 0
     
-    # Column mapping: CSV header -> DB column
-    column_map = {
-        "ID": "id",
-        "Date": "date",
-        "Year": "year",
-        "Aircraft Model": "aircraft_model",
-        "Aircraft Tail #": "aircraft_tail",
-        "Aircraft Type": "aircraft_type",
-        "# of Seats": "num_seats",
-        "DEP: Code": "dep_code",
-        "ARR: Code": "arr_code",
-        "DEP": "dep_location",
-        "ARR": "arr_location",
-        "Flight_No.": "flight_no",
-        "Pass #": "pass_position",
-        "Unique ID": "unique_id",
-        "First Name": "first_name",
-        "Last Name": "last_name",
-        "Last, First": "last_first",
-        "First Last": "first_last",
-        "Comment": "comment",
-        "Initials": "initials",
-        "Known": "known",
-        "Data Source": "data_source"
-    }
-    
-    db_columns = list(column_map.values())
+    db_columns = list(spec["column_map"].values())
     
     with get_connection() as conn:
         with conn.cursor() as cur:
-            # Clear existing data
-            cur.execute("TRUNCATE core.flight_logs")
+            rows = _iter_csv_rows(spec["csv"], spec["column_map"], spec["int_columns"])
             
-            # Read and insert
-            with open(FLIGHT_LOGS_CSV, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                
-                batch = []
-                total = 0
-                
-                for row in reader:
-                    values = []
-                    for csv_col, db_col in column_map.items():
-                        val = row.get(csv_col, "")
-                        # Handle nulls and type conversions
-                        if val == "":
-                            val = None
-                        elif db_col in ("id", "year", "num_seats"):
-                            val = int(val) if val else None
-                        values.append(val)
-                    
-                    batch.append(tuple(values))
-                    
-                    if len(batch) >= BATCH_SIZE:
-                        _insert_batch(cur, "core.flight_logs", db_columns, batch)
-                        total += len(batch)
-                        batch = []
-                
-                # Insert remaining
-                if batch:
-                    _insert_batch(cur, "core.flight_logs", db_columns, batch)
-                    total += len(batch)
+            if strategy == "upsert":
+                total = _upsert_table(cur, table, spec, db_columns, rows, loader, run_id)
+            elif strategy == "swap":
+                total = _swap_table(conn, cur, table, spec, db_columns, rows, loader)
+            else:
+                # Clear existing data
+                cur.execute(f"TRUNCATE {table}")  # type: ignore[arg-type]
+                total = _load_rows(cur, table, db_columns, rows, loader)
             
             conn.commit()
-            print(f"  Imported {total} flight log records")
+            print(f"  Imported {total} records into {table}")
             return total
 
 
-def import_black_book():
+def _upsert_table(cursor, table: str, spec: dict, columns: list, rows, loader: str, run_id) -> int:
+    """
+    Apply only the difference between a CSV and its core table.
+    
+    1. Load the CSV into ingest.<name> (same shape as core.<name>)
+    2. Diff staging vs core by primary key and md5 row hash
+    3. Delete vanished keys, INSERT ... ON CONFLICT DO UPDATE new/changed rows
+    4. Record every changed key in ingest.l0_change_manifest
+    
+    Unchanged rows are not touched, so their imported_at and any downstream
+    L1 rows derived from them stay valid.
+    
+    Returns:
+        int: Rows loaded from the CSV
+    """
+    schema, name = table.split(".")
+    core = sql.Identifier(schema, name)
+    staging = sql.Identifier("ingest", name)
+    key = sql.Identifier(spec["key"])
+    changes = sql.Identifier(f"{name}_changes")
+    col_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+    
+    def row_hash(alias: str):
+        return sql.SQL("md5(ROW({})::text)").format(
+            sql.SQL(", ").join(sql.Identifier(alias, c) for c in columns)
+        )
+    
+    # Stage
+    cursor.execute(sql.SQL(
+        "CREATE TABLE IF NOT EXISTS {} (LIKE {} INCLUDING DEFAULTS)"
+    ).format(staging, core))
+    cursor.execute(sql.SQL("TRUNCATE {}").format(staging))
+    total = _load_rows(cursor, f"ingest.{name}", columns, rows, loader)
+    
+    # Diff
+    cursor.execute(sql.SQL("""
+        CREATE TEMP TABLE {changes} ON COMMIT DROP AS
+        SELECT
+            COALESCE(s.{key}, c.{key}) AS record_key,
+            CASE
+                WHEN c.{key} IS NULL THEN 'insert'
+                WHEN s.{key} IS NULL THEN 'delete'
+                ELSE 'update'
+            END AS change_type,
+            s.row_hash
+        FROM (SELECT s.{key}, {s_hash} AS row_hash FROM {staging} s) s
+        FULL OUTER JOIN (SELECT c.{key}, {c_hash} AS row_hash FROM {core} c) c
+            ON s.{key} = c.{key}
+        WHERE s.{key} IS NULL
+           OR c.{key} IS NULL
+           OR s.row_hash <> c.row_hash
+    """).format(
+        changes=changes, key=key, staging=staging, core=core,
+        s_hash=row_hash("s"), c_hash=row_hash("c"),
+    ))
+    
+    cursor.execute(sql.SQL(
+        "SELECT change_type, COUNT(*) FROM {} GROUP BY change_type"
+    ).format(changes))
+    counts = dict(cursor.fetchall())
+    
+    # Apply
+    cursor.execute(sql.SQL("""
+        DELETE FROM {core}
+        WHERE {key} IN (SELECT record_key FROM {changes} WHERE change_type = 'delete')
+    """).format(core=core, key=key, changes=changes))
+    
+    updates = [
+        sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c))
+        for c in columns if c != spec["key"]
+    ]
+    updates.append(sql.SQL("imported_at = NOW()"))
+    
+    cursor.execute(sql.SQL("""
+        INSERT INTO {core} ({cols})
+        SELECT {s_cols}
+        FROM {staging} s
+        JOIN {changes} ch
+            ON ch.record_key = s.{key} AND ch.change_type IN ('insert', 'update')
+        ON CONFLICT ({key}) DO UPDATE SET {updates}
+    """).format(
+        core=core, cols=col_list, staging=staging, changes=changes, key=key,
+        s_cols=sql.SQL(", ").join(sql.Identifier("s", c) for c in columns),
+        updates=sql.SQL(", ").join(updates),
+    ))
+    
+    # Manifest
+    cursor.execute(sql.SQL("""
+        INSERT INTO ingest.l0_change_manifest
+            (run_id, table_name, record_key, change_type, row_hash)
+        SELECT %s, %s, record_key::text, change_type, row_hash
+        FROM {}
+    """).format(changes), (run_id, table))
+    
+    print(
+        f"  {table}: {counts.get('insert', 0)} inserted, "
+        f"{counts.get('update', 0)} updated, {counts.get('delete', 0)} deleted, "
+        f"{total - counts.get('insert', 0) - counts.get('update', 0)} unchanged"
+    )
+    
+    return total
+
+
+def _swap_table(conn, cursor, table: str, spec: dict, columns: list, rows, loader: str) -> int:
+    """
+    Reload a core table without exposing partial data to readers.
+    
+    The new data is loaded into ingest.<name>_swap and indexed there while
+    core.<name> keeps serving the old rows. A second, short transaction then
+    drops the old table and moves the new one into place, so readers only
+    ever wait for that metadata-only swap, and never see an empty or
+    half-filled table.
+    
+    AI NOTE: The swap drops core.<name> without CASCADE. If views or foreign
+    keys are ever added that depend on a core table, the DROP fails, the swap
+    transaction rolls back, and core.<name> is left untouched; such objects
+    would need to be recreated as part of the swap.
+    
+    Returns:
+        int: Rows loaded
+    """
+    schema, name = table.split(".")
+    core = sql.Identifier(schema, name)
+    swap_name = f"{name}_swap"
+    staging = sql.Identifier("ingest", swap_name)
+    
+    # Phase 1: build the replacement (long, no locks on core)
+    cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(staging))
+    cursor.execute(sql.SQL(
+        "CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ).format(staging, core))
+    total = _load_rows(cursor, f"ingest.{swap_name}", columns, rows, loader)
+    
+    # Indexes are built after the load; the primary key gets the same name
+    # core's original constraint has, so it is unchanged after the swap
+    cursor.execute(sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} PRIMARY KEY ({})").format(
+        staging, sql.Identifier(f"{name}_pkey"), sql.Identifier(spec["key"])
+    ))
+    cursor.execute(sql.SQL("ANALYZE {}").format(staging))
+    conn.commit()
+    print(f"  Built ingest.{swap_name} ({total} rows)")
+    
+    # Phase 2: swap (short, ACCESS EXCLUSIVE on core only for the renames)
+    cursor.execute(sql.SQL("SET LOCAL lock_timeout = {}").format(sql.Literal(SWAP_LOCK_TIMEOUT)))
+    cursor.execute(sql.SQL("DROP TABLE {}").format(core))
+    cursor.execute(sql.SQL("ALTER TABLE {} SET SCHEMA {}").format(staging, sql.Identifier(schema)))
+    cursor.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(
+        sql.Identifier(schema, swap_name), sql.Identifier(name)
+    ))
+    conn.commit()
+    print(f"  Swapped ingest.{swap_name} into {table}")
+    
+    return total
+
+
+def import_flight_logs(loader: str = "copy"):
+    """Import flight-logs.csv to core.flight_logs."""
+    return import_table("core.flight_logs", loader)
+
+
+def import_black_book(loader: str = "copy"):
     """Import black-book.csv to core.black_book."""
-    print(f"Importing black book from {BLACK_BOOK_CSV}")
+    return import_table("core.black_book", loader)
+
+
+def import_all(loader: str = "copy", parallel: bool = False, strategy: str = "replace") -> dict:
+    """
+    Import every table in L0_TABLES and report per-table timings.
     
-    if not BLACK_BOOK_CSV.exists():
-        print(f"  ERROR: File not found: {BLACK_BOOK_CSV}")
-        return 0
+    All tables share one run_id, which tags the rows an upsert import writes
+    to ingest.l0_change_manifest.
     
-    # Column mapping: CSV header -> DB column
-    column_map = {
-        "record_id": "record_id",
-        "Page": "page",
-        "Page-Link": "page_link",
-        "Name": "name",
-        "Company/Add. Text": "company_text",
-        "Surname": "surname",
-        "First Name": "first_name",
-        "Address-Type": "address_type",
-        "Address": "address",
-        "Zip": "zip",
-        "City": "city",
-        "Country": "country",
-        "Phone (no specifics)": "phone_general",
-        "Phone (w) – work": "phone_work",
-        "Phone (h) – home": "phone_home",
-        "Phone (p) – portable/mobile": "phone_mobile",
-        "Email": "email"
-    }
-    
-    db_columns = list(column_map.values())
+    With parallel=True each table is loaded on its own connection in a
+    thread pool, so wall time tracks the slowest table rather than the sum.
+    psycopg releases the GIL while waiting on the server, and the server
+    does the heavy lifting for COPY.
     
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            # Clear existing data
-            cur.execute("TRUNCATE core.black_book")
-            
-            # Read and insert
-            with open(BLACK_BOOK_CSV, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                
-                batch = []
-                total = 0
-                
-                for row in reader:
-                    values = []
-                    for csv_col, db_col in column_map.items():
-                        val = row.get(csv_col, "")
-                        # Handle nulls and type conversions
-                        if val == "":
-                            val = None
-                        elif db_col == "page":
-                            val = int(val) if val else None
-                        values.append(val)
-                    
-                    batch.append(tuple(values))
-                    
-                    if len(batch) >= BATCH_SIZE:
-                        _insert_batch(cur, "core.black_book", db_columns, batch)
-                        total += len(batch)
-                        batch = []
-                
-                # Insert remaining
-                if batch:
-                    _insert_batch(cur, "core.black_book", db_columns, batch)
-                    total += len(batch)
+    Returns:
+        dict: table -> {"rows": int, "seconds": float}
+    """
+    run_id = str(uuid.uuid4())
+    if strategy == "upsert":
+        print(f"Change manifest run_id: {run_id}")
+    
+    def timed_import(table: str) -> dict:
+        start = time.perf_counter()
+        rows = import_table(table, loader, strategy, run_id)
+        return {"rows": rows, "seconds": time.perf_counter() - start}
+    
+    wall_start = time.perf_counter()
+    
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(L0_TABLES)) as executor:
+            futures = {table: executor.submit(timed_import, table) for table in L0_TABLES}
+            results = {table: future.result() for table, future in futures.items()}
+    else:
+        results = {table: timed_import(table) for table in L0_TABLES}
+    
+    wall_time = time.perf_counter() - wall_start
+    
+    print("\nImport timings:")
+    for table, result in results.items():
+        print(f"  {table:20} {result['rows']:>8,} rows  {result['seconds']:7.2f}s")
+    print(f"  {'Sum of tables':20} {'':>13} {sum(r['seconds'] for r in results.values()):7.2f}s")
+    print(f"  {'Wall time':20} {'':>13} {wall_time:7.2f}s")
+    
+    return results
+
+
+def _iter_csv_rows(csv_path: Path, column_map: dict, int_columns: tuple):
+    """
+    Stream DB-ready tuples from an L0 CSV.
+    
+    Applies the CSV -> DB column mapping row by row: empty strings become
+    NULL and int_columns are coerced to int. Nothing is buffered, so the
+    same generator feeds both COPY and batched INSERTs.
+    """
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        
+        for row in reader:
+            values = []
+            for csv_col, db_col in column_map.items():
+                val = row.get(csv_col, "")
+                # Handle nulls and type conversions
+                if val == "":
+                    val = None
+                elif db_col in int_columns:
+                    val = int(val) if val else None
+                values.append(val)
             
-            conn.commit()
-            print(f"  Imported {total} black book records")
-            return total
+            yield tuple(values)
+
+
+def _load_rows(cursor, table: str, columns: list, rows, loader: str) -> int:
+    """Load rows into table with the selected loader; returns row count."""
+    if loader == "copy":
+        return _copy_rows(cursor, table, columns, rows)
+    
+    batch = []
+    total = 0
+    
+    for row in rows:
+        batch.append(row)
+        
+        if len(batch) >= BATCH_SIZE:
+            _insert_batch(cursor, table, columns, batch)
+            total += len(batch)
+            batch = []
+    
+    # Insert remaining
+    if batch:
+        _insert_batch(cursor, table, columns, batch)
+        total += len(batch)
+    
+    return total
+
+
+def _copy_rows(cursor, table: str, columns: list, rows) -> int:
+    """Stream rows into table with COPY FROM STDIN; returns row count."""
+    schema, name = table.split(".")
+    query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(schema, name),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
+    
+    total = 0
+    with cursor.copy(query) as copy:
+        for row in rows:
+            copy.write_row(row)
+            total += 1
+    
+    return total
 
 
 def _insert_batch(cursor, table: str, columns: list, rows: list):
@@ -342,10 +624,7 @@ def verify_counts():
     """Verify row counts match expected values."""
     print("Verifying import counts...")
     
-    expected = {
-        "core.flight_logs": 5001,
-        "core.black_book": 2324
-    }
+    expected = {table: spec["expected_count"] for table, spec in L0_TABLES.items()}
     
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -368,6 +647,14 @@ def main():
                         help="Create database (requires admin access)")
     parser.add_argument("--skip-import", action="store_true",
                         help="Skip CSV import (setup only)")
+    parser.add_argument("--loader", choices=LOADERS, default="copy",
+                        help="Row loader: COPY FROM STDIN or batched INSERT (default: copy)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="replace",
+                        help="replace: TRUNCATE and reload; upsert: apply only changed rows "
+                             "and record them in ingest.l0_change_manifest; swap: load into "
+                             "ingest and swap into core atomically (default: replace)")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Load independent L0 tables concurrently (one connection each)")
     args = parser.parse_args()
     
     print("=" * 60)
@@ -375,6 +662,9 @@ def main():
     print("=" * 60)
     print(f"Host: {PGSQL_HOST}:{PGSQL_PORT}")
     print(f"Database: {PGSQL_DATABASE}")
+    if not args.skip_import:
+        print(f"Loader: {args.loader}")
+        print(f"Strategy: {args.strategy}")
     print()
     
     try:
@@ -390,8 +680,7 @@ def main():
         
         # Step 4: Import data
         if not args.skip_import:
-            import_flight_logs()
-            import_black_book()
+            import_all(loader=args.loader, parallel=args.parallel, strategy=args.strategy)
             
             # Step 5: Verify
             if verify_counts():
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Blocking Keys
+
+Phonetic and prefix keys for entity-resolution blocking, computed in Python
+so build_identity_mentions.py can write them in the same COPY as the
+mention row (instead of a post-insert UPDATE over l1.identity_mentions).
+
+Keys per mention (BLOCKING_COLUMNS):
+- soundex_first / soundex_last: identical to PostgreSQL fuzzystrmatch
+  soundex(), so keys computed here and in SQL can be compared directly
+- nysiis_first / nysiis_last: NYSIIS, truncated to 6 characters
+- dmetaphone_first / dmetaphone_last / dmetaphone_last_alt: Double
+  Metaphone primary codes (plus the surname's alternate), truncated to 4
+  characters like fuzzystrmatch dmetaphone(). Needs the optional `metaphone`
+  package; NULL without it
+- initial_last_key: first initial + first 3 letters of the surname
+  ("JSMI"), catching spelling variants phonetic codes split apart
+
+Usage:
+    from blocking_keys import BLOCKING_COLUMNS, blocking_keys
+    
+    keys = blocking_keys("John", "Smith")  # {"soundex_first": "J500", ...}
+
+Requirements (optional):
+    pip install metaphone
+"""
+
+import unicodedata
+from functools import lru_cache
+
+try:
+    from metaphone import doublemetaphone
+    METAPHONE_AVAILABLE = True
+except ImportError:
+    METAPHONE_AVAILABLE = False
+
+BLOCKING_COLUMNS = [
+    "soundex_first", "soundex_last",
+    "nysiis_first", "nysiis_last",
+    "dmetaphone_first", "dmetaphone_last", "dmetaphone_last_alt",
+    "initial_last_key",
+]
+
+SOUNDEX_LENGTH = 4
+NYSIIS_LENGTH = 6
+DMETAPHONE_LENGTH = 4
+SURNAME_PREFIX_LENGTH = 3
+
+# Distinct (first, last) pairs kept by blocking_keys()
+BLOCKING_CACHE_SIZE = 65_536
+
+# fuzzystrmatch soundex_table: code per letter A-Z ('0' = not coded)
+SOUNDEX_TABLE = dict(zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "01230120022455012623010202"))
+
+VOWELS = frozenset("AEIOU")
+
+
+def _is_letter(ch: str) -> bool:
+    # fuzzystrmatch uses C isalpha() on bytes: ASCII letters only
+    return "A" <= ch <= "Z" or "a" <= ch <= "z"
+
+
+def _soundex_code(ch: str) -> str:
+    # Non-letters code as themselves, so they never equal a letter's code
+    return SOUNDEX_TABLE.get(ch.upper(), ch)
+
+
+def ascii_letters(value: str) -> str:
+    """Uppercase ASCII letters of value, accents folded ("Núñez" -> "NUNEZ")."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in decomposed.upper() if "A" <= ch <= "Z")
+
+
+# =============================================================================
+# Soundex (PostgreSQL fuzzystrmatch)
+# =============================================================================
+
+def soundex(value: str | None) -> str | None:
+    """
+    American Soundex exactly as fuzzystrmatch soundex() computes it.
+    
+    Leading non-letters are skipped and a value without letters gives "".
+    Each letter is compared only with the character right before it, so
+    unlike the NARA rules H and W separate equal codes the way vowels do
+    ("Ashcraft" -> A226).
+    """
+    if value is None:
+        return None
+    
+    start = 0
+    while start < len(value) and not _is_letter(value[start]):
+        start += 1
+    if start == len(value):
+        return ""
+    
+    code = [value[start].upper()]
+    for i in range(start + 1, len(value)):
+        if len(code) == SOUNDEX_LENGTH:
+            break
+        ch = value[i]
+        if _is_letter(ch):
+            digit = _soundex_code(ch)
+            if digit != _soundex_code(value[i - 1]) and digit != "0":
+                code.append(digit)
+    
+    return "".join(code).ljust(SOUNDEX_LENGTH, "0")
+
+
+# =============================================================================
+# NYSIIS
+# =============================================================================
+
+def nysiis(value: str | None) -> str | None:
+    """
+    New York State Identification and Intelligence System code.
+    
+    Letters only (accents folded); None if value has none.
+    """
+    name = ascii_letters(value) if value else ""
+    if not name:
+        return None
+    
+    # Prefixes
+    for prefix, replacement in (("MAC", "MCC"), ("KN", "NN"), ("K", "C"),
+                                ("PH", "FF"), ("PF", "FF"), ("SCH", "SSS")):
+        if name.startswith(prefix):
+            name = replacement + name[len(prefix):]
+            break
+    
+    # Suffixes
+    if name.endswith(("EE", "IE")):
+        name = name[:-2] + "Y"
+    elif name.endswith(("DT", "RT", "RD", "NT", "ND")):
+        name = name[:-2] + "D"
+    
+    key = name[0]
+    i = 1
+    while i < len(name):
+        ch = name[i]
+        nxt = name[i + 1] if i + 1 < len(name) else ""
+        prev = name[i - 1]
+        
+        if ch == "E" and nxt == "V":
+            out = "AF"
+            i += 1
+        elif ch in VOWELS:
+            out = "A"
+        elif ch == "Q":
+            out = "G"
+        elif ch == "Z":
+            out = "S"
+        elif ch == "M":
+            out = "N"
+        elif ch == "K":
+            out = "N" if nxt == "N" else "C"
+        elif ch == "S" and name[i + 1:i + 3] == "CH":
+            out = "SSS"
+            i += 2
+        elif ch == "P" and nxt == "H":
+            out = "FF"
+            i += 1
+        # AI NOTE: H and W repeat the previous *transformed* character
+        # (key[-1], already "A" for a vowel), never the raw letter, or
+        # "John" keeps its O (JAON) and stops blocking with "Jon" (JAN).
+        # A final H counts as followed by a non-vowel ("Yeh" -> Y)
+        elif ch == "H" and (prev not in VOWELS or nxt not in VOWELS):
+            out = key[-1]
+        elif ch == "W" and prev in VOWELS:
+            out = key[-1]
+        else:
+            out = ch
+        
+        # Skip a code equal to the last one written, letter by letter so
+        # multi-letter codes collapse too ("Stephen": PH -> FF -> F)
+        for code in out:
+            if code != key[-1]:
+                key += code
+        i += 1
+    
+    if len(key) > 1 and key.endswith("S"):
+        key = key[:-1]
+    if key.endswith("AY"):
+        key = key[:-2] + "Y"
+    if len(key) > 1 and key.endswith("A"):
+        key = key[:-1]
+    
+    return key[:NYSIIS_LENGTH]
+
+
+# Known answers checked by check_known_answers() (NYSIIS truncated to
+# NYSIIS_LENGTH, Soundex as fuzzystrmatch computes it)
+KNOWN_ANSWERS = {
+    "soundex": {
+        "Robert": "R163",
+        "Rupert": "R163",
+        "Ashcraft": "A226",
+        "Tymczak": "T522",
+    },
+    "nysiis": {
+        "John": "JAN",
+        "Jon": "JAN",
+        "Johnson": "JANSAN",
+        "Jonson": "JANSAN",
+        "Knight": "NAGT",
+        "MacDonald": "MCDANA",
+        "Kuhn": "CAN",
+        "Kun": "CAN",
+        "Bowman": "BANAN",
+        "Boman": "BANAN",
+        "Stephen": "STAFAN",
+        "Yeh": "Y",
+    },
+}
+
+
+def check_known_answers() -> list[str]:
+    """
+    Compare soundex() and nysiis() against KNOWN_ANSWERS.
+    
+    Returns:
+        list: One message per mismatch (empty if all match)
+    """
+    functions = {"soundex": soundex, "nysiis": nysiis}
+    failures = []
+    for name, answers in KNOWN_ANSWERS.items():
+        for value, expected in answers.items():
+            actual = functions[name](value)
+            if actual != expected:
+                failures.append(f"{name}({value!r}) = {actual!r}, expected {expected!r}")
+    return failures
+
+
+# =============================================================================
+# Double Metaphone / prefix keys
+# =============================================================================
+
+def double_metaphone(value: str | None) -> tuple[str | None, str | None]:
+    """
+    (primary, alternate) Double Metaphone codes; None for an empty code or
+    when the metaphone package is not installed.
+    """
+    if not value or not METAPHONE_AVAILABLE:
+        return None, None
+    
+    primary, alternate = doublemetaphone(value)
+    return primary[:DMETAPHONE_LENGTH] or None, alternate[:DMETAPHONE_LENGTH] or None
+
+
+def initial_last_key(first: str | None, last: str | None) -> str | None:
+    """First initial + surname prefix ("John", "Smith" -> "JSMI"); needs both."""
+    first_letters = ascii_letters(first) if first else ""
+    last_letters = ascii_letters(last) if last else ""
+    if not first_letters or not last_letters:
+        return None
+    return first_letters[0] + last_letters[:SURNAME_PREFIX_LENGTH]
+
+
+@lru_cache(maxsize=BLOCKING_CACHE_SIZE)
+def blocking_keys(first: str | None, last: str | None) -> dict:
+    """
+    All blocking keys for a parsed first/last name, memoized (the returned
+    dict is shared between calls; copy it before modifying).
+    
+    Returns:
+        dict: BLOCKING_COLUMNS -> key (None where not computable)
+    """
+    dm_first, _ = double_metaphone(first)
+    dm_last, dm_last_alt = double_metaphone(last)
+    
+    return {
+        "soundex_first": soundex(first),
+        "soundex_last": soundex(last),
+        "nysiis_first": nysiis(first),
+        "nysiis_last": nysiis(last),
+        "dmetaphone_first": dm_first,
+        "dmetaphone_last": dm_last,
+        "dmetaphone_last_alt": dm_last_alt,
+        "initial_last_key": initial_last_key(first, last),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    
+    failures = check_known_answers()
+    for failure in failures:
+        print(f"✗ {failure}")
+    if not failures:
+        print(f"✓ {sum(len(answers) for answers in KNOWN_ANSWERS.values())} known answers match")
+    sys.exit(1 if failures else 0)
@@ -8,25 +8,35 @@ Extracts names from:
 
 Parses with probablepeople and creates l1.identity_mentions with:
 - Parsed name components
-- Soundex codes for blocking
+- Blocking keys (Soundex, NYSIIS, Double Metaphone, initial + surname
+  prefix; see blocking_keys.py), written in the same COPY as the row
 - Placeholder vector column for M06 embeddings
 
 Usage:
     python build_identity_mentions.py [--dry-run]
+    python build_identity_mentions.py --no-name-cache   # don't persist name parses
+    python build_identity_mentions.py --workers 8       # parallel name parsing
 
 Requirements:
     pip install psycopg[binary] python-dotenv probablepeople
+    pip install metaphone  # optional, Double Metaphone keys
 """
 
 import argparse
 import os
 import sys
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
 from pathlib import Path
 
 import psycopg
 from dotenv import load_dotenv
 
+from blocking_keys import BLOCKING_COLUMNS, METAPHONE_AVAILABLE, blocking_keys, check_known_answers
+from l1_bulk_writer import copy_rows
+from memo_cache import MemoCache
+
 try:
     import probablepeople as pp
     PROBABLEPEOPLE_AVAILABLE = True
@@ -45,6 +55,19 @@ PGSQL_USER = os.getenv("PGSQL_USER")
 PGSQL_PASSWORD = os.getenv("PGSQL_PASSWORD")
 PGSQL_DATABASE = os.getenv("PGSQL_DATABASE")
 
+# Name parse cache: normalized raw name -> parse_name_with_probablepeople()
+# dict. Frequent flyers repeat the same first_last hundreds of times.
+NAME_CACHE_PATH = PROJECT_ROOT / "data" / "cache" / "l1-memo.sqlite"
+NAME_CACHE_SIZE = 50_000
+NAME_CACHE = MemoCache(maxsize=NAME_CACHE_SIZE)
+
+# Bump when the tag -> parsed_* mapping below changes, so persisted parses
+# from older code are ignored
+NAME_PARSE_VERSION = "1"
+
+# Distinct names per process-pool task with --workers
+NAME_CHUNK_SIZE = 500
+
 
 def get_connection():
     """Connect to the project database."""
@@ -61,10 +84,33 @@ def get_connection():
 # Name Parsing
 # =============================================================================
 
+def configure_name_cache(path: Path | None = NAME_CACHE_PATH, maxsize: int = NAME_CACHE_SIZE) -> MemoCache:
+    """
+    Replace the module name parse cache (path=None: memory only).
+    
+    The on-disk namespace is versioned by the probablepeople release (its
+    CRF model decides the tags) and NAME_PARSE_VERSION.
+    """
+    global NAME_CACHE
+    NAME_CACHE.close()
+    pp_version = metadata.version("probablepeople") if PROBABLEPEOPLE_AVAILABLE else "unavailable"
+    NAME_CACHE = MemoCache(maxsize=maxsize, path=path, namespace="name",
+                           version=f"{NAME_PARSE_VERSION}:{pp_version}")
+    return NAME_CACHE
+
+
+def normalize_name_key(full_name: str | None) -> str:
+    """Cache key for a raw name: stripped, internal whitespace collapsed."""
+    return " ".join(full_name.split()) if full_name else ""
+
+
 def parse_name_with_probablepeople(full_name: str) -> dict:
     """
     Parse a name using probablepeople CRF model.
     
+    Parses are memoized in NAME_CACHE by normalize_name_key(full_name);
+    returns a fresh dict each call (callers fill in missing components).
+    
     Returns dict with:
     - parsed_prefix, parsed_first, parsed_middle, parsed_last, parsed_suffix
     - parsed_nickname
@@ -74,20 +120,15 @@ def parse_name_with_probablepeople(full_name: str) -> dict:
     if not PROBABLEPEOPLE_AVAILABLE:
         return fallback_parse(full_name)
     
-    if not full_name or not full_name.strip():
-        return {
-            "parsed_prefix": None,
-            "parsed_first": None,
-            "parsed_middle": None,
-            "parsed_last": None,
-            "parsed_suffix": None,
-            "parsed_nickname": None,
-            "parse_type": "Unknown",
-            "parse_confidence": 0.0
-        }
-    
-    full_name = full_name.strip()
+    key = normalize_name_key(full_name)
+    if not key:
+        return fallback_parse(key)  # empty parse
     
+    return dict(NAME_CACHE.get_or_compute(key, lambda: _tag_name(key)))
+
+
+def _tag_name(full_name: str) -> dict:
+    """Run the CRF tagger on a non-empty, normalized name (uncached)."""
     try:
         parsed, name_type = pp.tag(full_name)
         
@@ -174,6 +215,55 @@ def fallback_parse(full_name: str) -> dict:
     }
 
 
+# =============================================================================
+# Parse Stage
+# =============================================================================
+
+def _init_parse_worker():
+    """Process pool initializer: load the CRF model before the first task."""
+    if PROBABLEPEOPLE_AVAILABLE:
+        _tag_name("John Smith")
+
+
+def parse_names(raw_names: list[str], workers: int = 1, chunk_size: int = NAME_CHUNK_SIZE) -> list[dict]:
+    """
+    Parse a batch of raw names, returning one parse per input in order.
+    
+    Names are deduplicated by normalize_name_key(). With workers > 1, keys
+    not yet in NAME_CACHE are tagged across a process pool (each worker
+    loads the CRF model once, in its initializer) and stored in the cache;
+    results are then read back through parse_name_with_probablepeople(), so
+    every mention gets its own dict.
+    
+    Args:
+        raw_names: Names as they will be stored in raw_name
+        workers: Pool processes (1 = tag serially on first use)
+        chunk_size: Names sent to a worker per task
+    
+    Returns:
+        list: parse_name_with_probablepeople() dict per raw name
+    """
+    if workers > 1 and PROBABLEPEOPLE_AVAILABLE:
+        keys = {normalize_name_key(name) for name in raw_names}
+        keys.discard("")
+        todo = sorted(key for key in keys if key not in NAME_CACHE)
+        print(f"\n  Name parse pre-pass: {len(keys):,} distinct names, {len(todo):,} uncached")
+        
+        # AI NOTE: Same constraint as transform_black_book_l1.prewarm_phone_cache:
+        # a memory-only cache smaller than the batch evicts results before
+        # they are read back (they'd be re-tagged serially).
+        if len(todo) > NAME_CACHE.maxsize and NAME_CACHE.path is None:
+            print(f"  WARNING: {len(todo):,} names exceed the in-memory name cache ({NAME_CACHE.maxsize:,})")
+        
+        if todo:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker) as executor:
+                for key, parsed in zip(todo, executor.map(_tag_name, todo, chunksize=chunk_size)):
+                    NAME_CACHE.put(key, parsed)
+            print(f"    Tagged {len(todo):,} names across {workers} processes")
+    
+    return [parse_name_with_probablepeople(name) for name in raw_names]
+
+
 # =============================================================================
 # DDL
 # =============================================================================
@@ -203,9 +293,15 @@ CREATE TABLE IF NOT EXISTS l1.identity_mentions (
     parse_type VARCHAR(20) CHECK (parse_type IN ('Person', 'Corporation', 'Household', 'Unknown')),
     parse_confidence DECIMAL(3,2),
     
-    -- Blocking codes (for entity resolution)
+    -- Blocking codes (for entity resolution, see blocking_keys.py)
     soundex_first VARCHAR(4),
     soundex_last VARCHAR(4),
+    nysiis_first VARCHAR(6),
+    nysiis_last VARCHAR(6),
+    dmetaphone_first VARCHAR(4),
+    dmetaphone_last VARCHAR(4),
+    dmetaphone_last_alt VARCHAR(4),
+    initial_last_key VARCHAR(4),
     
     -- Placeholder for M06 embeddings
     name_embedding vector(384),   -- Will be populated in M06
@@ -214,10 +310,31 @@ CREATE TABLE IF NOT EXISTS l1.identity_mentions (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Tables created before the extra blocking keys existed
+ALTER TABLE l1.identity_mentions
+    ADD COLUMN IF NOT EXISTS nysiis_first VARCHAR(6),
+    ADD COLUMN IF NOT EXISTS nysiis_last VARCHAR(6),
+    ADD COLUMN IF NOT EXISTS dmetaphone_first VARCHAR(4),
+    ADD COLUMN IF NOT EXISTS dmetaphone_last VARCHAR(4),
+    ADD COLUMN IF NOT EXISTS dmetaphone_last_alt VARCHAR(4),
+    ADD COLUMN IF NOT EXISTS initial_last_key VARCHAR(4);
+
 -- Indexes for entity resolution blocking
 CREATE INDEX IF NOT EXISTS idx_identity_mentions_soundex 
     ON l1.identity_mentions(soundex_last, soundex_first);
 
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_nysiis 
+    ON l1.identity_mentions(nysiis_last, nysiis_first);
+
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_dmetaphone 
+    ON l1.identity_mentions(dmetaphone_last, dmetaphone_first);
+
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_dmetaphone_alt 
+    ON l1.identity_mentions(dmetaphone_last_alt) WHERE dmetaphone_last_alt IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_identity_mentions_initial_last 
+    ON l1.identity_mentions(initial_last_key);
+
 CREATE INDEX IF NOT EXISTS idx_identity_mentions_source 
     ON l1.identity_mentions(source_table, source_id);
 
@@ -239,7 +356,7 @@ def create_tables(conn):
     
     with conn.cursor() as cur:
         cur.execute(IDENTITY_MENTIONS_DDL)
-        print("  Created l1.identity_mentions with Soundex indexes")
+        print("  Created l1.identity_mentions with blocking key indexes")
     
     conn.commit()
 
@@ -248,12 +365,22 @@ def create_tables(conn):
 # Main Build
 # =============================================================================
 
-def build_identity_mentions(dry_run: bool = False):
+def build_identity_mentions(dry_run: bool = False, workers: int = 1):
     """
     Build unified identity mentions from flight passengers and contact persons.
+    
+    Names from both sources are parsed in one batch (parse_names) before
+    mentions are assembled; with workers > 1 the CRF tagging runs across a
+    process pool.
     """
     print("Building unified identity mentions...")
     
+    # Refuse to write blocking keys that disagree with the reference codes
+    failures = check_known_answers()
+    if failures:
+        raise RuntimeError("Blocking key known-answer check failed: " + "; ".join(failures))
+    print("  ✓ Blocking key known answers match")
+    
     with get_connection() as conn:
         # Create table
         create_tables(conn)
@@ -292,16 +419,63 @@ def build_identity_mentions(dry_run: bool = False):
             flight_rows = cur.fetchall()
             print(f"    Found {len(flight_rows)} passenger records (confidence >= 0.3)")
             
+            flight_items = []  # (row, raw_name)
             for row in flight_rows:
                 passenger_id, l0_id, first_name, last_name, first_last, identity_conf = row
                 
                 # Use first_last as the canonical name to parse
                 raw_name = first_last or f"{first_name or ''} {last_name or ''}".strip()
                 
-                if not raw_name:
+                if raw_name:
+                    flight_items.append((row, raw_name))
+            
+            # =================================================================
+            # Extract from contact_persons
+            # =================================================================
+            print("\n  Extracting from l1.contact_persons...")
+            
+            cur.execute("""
+                SELECT 
+                    cp.person_id,
+                    cp.l0_record_id,
+                    cp.extracted_first,
+                    cp.extracted_last,
+                    cp.extracted_raw,
+                    c.entity_type
+                FROM l1.contact_persons cp
+                JOIN l1.contacts c ON cp.contact_id = c.contact_id
+                WHERE c.entity_type IN ('individual', 'household')  -- Skip organizations
+            """)
+            
+            contact_rows = cur.fetchall()
+            print(f"    Found {len(contact_rows)} contact person records")
+            
+            contact_items = []  # (row, raw_name)
+            for row in contact_rows:
+                person_id, l0_record_id, first, last, raw, entity_type = row
+                
+                # Build name to parse
+                if raw and raw.strip():
+                    raw_name = raw.strip()
+                elif first or last:
+                    raw_name = f"{first or ''} {last or ''}".strip()
+                else:
                     continue
                 
-                parsed = parse_name_with_probablepeople(raw_name)
+                contact_items.append((row, raw_name))
+            
+            # =================================================================
+            # Parse all names (deduplicated, optionally in parallel)
+            # =================================================================
+            parsed_names = parse_names([raw_name for _, raw_name in flight_items + contact_items], workers)
+            flight_parsed = parsed_names[:len(flight_items)]
+            contact_parsed = parsed_names[len(flight_items):]
+            
+            # =================================================================
+            # Build mentions
+            # =================================================================
+            for (row, raw_name), parsed in zip(flight_items, flight_parsed):
+                passenger_id, l0_id, first_name, last_name, first_last, identity_conf = row
                 
                 # Override with known components if parse failed
                 if not parsed["parsed_first"] and first_name:
@@ -309,8 +483,6 @@ def build_identity_mentions(dry_run: bool = False):
                 if not parsed["parsed_last"] and last_name:
                     parsed["parsed_last"] = last_name
                 
-                # Soundex codes will be computed via SQL function after insert
-                
                 mention = {
                     "mention_id": str(uuid.uuid4()),
                     "source_table": "flight_passengers",
@@ -326,6 +498,7 @@ def build_identity_mentions(dry_run: bool = False):
                     "parsed_nickname": parsed["parsed_nickname"],
                     "parse_type": parsed["parse_type"],
                     "parse_confidence": parsed["parse_confidence"],
+                    **blocking_keys(parsed["parsed_first"], parsed["parsed_last"]),
                 }
                 
                 mentions.append(mention)
@@ -340,40 +513,9 @@ def build_identity_mentions(dry_run: bool = False):
                 else:
                     stats["low_confidence"] += 1
             
-            # =================================================================
-            # Extract from contact_persons
-            # =================================================================
-            print("\n  Extracting from l1.contact_persons...")
-            
-            cur.execute("""
-                SELECT 
-                    cp.person_id,
-                    cp.l0_record_id,
-                    cp.extracted_first,
-                    cp.extracted_last,
-                    cp.extracted_raw,
-                    c.entity_type
-                FROM l1.contact_persons cp
-                JOIN l1.contacts c ON cp.contact_id = c.contact_id
-                WHERE c.entity_type IN ('individual', 'household')  -- Skip organizations
-            """)
-            
-            contact_rows = cur.fetchall()
-            print(f"    Found {len(contact_rows)} contact person records")
-            
-            for row in contact_rows:
+            for (row, raw_name), parsed in zip(contact_items, contact_parsed):
                 person_id, l0_record_id, first, last, raw, entity_type = row
                 
-                # Build name to parse
-                if raw and raw.strip():
-                    raw_name = raw.strip()
-                elif first or last:
-                    raw_name = f"{first or ''} {last or ''}".strip()
-                else:
-                    continue
-                
-                parsed = parse_name_with_probablepeople(raw_name)
-                
                 # Override with extracted components if available
                 if not parsed["parsed_first"] and first:
                     parsed["parsed_first"] = first
@@ -395,6 +537,7 @@ def build_identity_mentions(dry_run: bool = False):
                     "parsed_nickname": parsed["parsed_nickname"],
                     "parse_type": parsed["parse_type"],
                     "parse_confidence": parsed["parse_confidence"],
+                    **blocking_keys(parsed["parsed_first"], parsed["parsed_last"]),
                 }
                 
                 mentions.append(mention)
@@ -425,6 +568,12 @@ def build_identity_mentions(dry_run: bool = False):
             print(f"    High (>=0.7): {stats['high_confidence']:,}")
             print(f"    Low (<0.7):   {stats['low_confidence']:,}")
             
+            if PROBABLEPEOPLE_AVAILABLE:
+                cache = NAME_CACHE.stats()
+                print(f"\n  Name parse cache:")
+                print(f"    Hits:   {cache['hits']:,} memory, {cache['disk_hits']:,} disk")
+                print(f"    Misses: {cache['misses']:,} names tagged ({cache['hit_rate']:.1%} hit rate)")
+            
             if dry_run:
                 print("\n  [DRY RUN] No data written")
                 return
@@ -438,37 +587,12 @@ def build_identity_mentions(dry_run: bool = False):
                 "mention_id", "source_table", "source_id", "l0_source_table",
                 "l0_source_id", "raw_name", "parsed_prefix", "parsed_first",
                 "parsed_middle", "parsed_last", "parsed_suffix", "parsed_nickname",
-                "parse_type", "parse_confidence"
-            ]
-            placeholders = ", ".join(["%s"] * len(cols))
-            insert_sql = f"""
-                INSERT INTO l1.identity_mentions ({", ".join(cols)})
-                VALUES ({placeholders})
-            """
-            
-            rows_to_insert = [
-                tuple(m[col] for col in cols)
-                for m in mentions
+                "parse_type", "parse_confidence", *BLOCKING_COLUMNS
             ]
-            
-            # Batch insert
-            batch_size = 1000
-            for i in range(0, len(rows_to_insert), batch_size):
-                batch = rows_to_insert[i:i + batch_size]
-                cur.executemany(insert_sql, batch)
-            
-            # =================================================================
-            # Update Soundex codes via SQL
-            # =================================================================
-            print("  Computing Soundex codes...")
-            
-            cur.execute("""
-                UPDATE l1.identity_mentions
-                SET 
-                    soundex_first = soundex(parsed_first),
-                    soundex_last = soundex(parsed_last)
-                WHERE parsed_first IS NOT NULL OR parsed_last IS NOT NULL
-            """)
+            copy_rows(
+                cur, "l1.identity_mentions", cols,
+                (tuple(m[col] for col in cols) for m in mentions)
+            )
             
             conn.commit()
             
@@ -493,14 +617,31 @@ def build_identity_mentions(dry_run: bool = False):
             print(f"\n  ✓ Inserted {total_count:,} identity mentions")
             print(f"  ✓ {soundex_count:,} have Soundex codes")
             print(f"  ✓ {unique_soundex:,} unique surname Soundex codes (blocking groups)")
+            
+            for column, label in (
+                ("nysiis_last", "NYSIIS"),
+                ("dmetaphone_last", "Double Metaphone"),
+                ("initial_last_key", "initial + surname prefix"),
+            ):
+                cur.execute(f"SELECT COUNT(DISTINCT {column}) FROM l1.identity_mentions")
+                print(f"  ✓ {cur.fetchone()[0]:,} unique {label} blocking keys")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Build unified identity mentions")
     parser.add_argument("--dry-run", action="store_true",
                         help="Process without writing to database")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for name parsing (default: 1 = serial)")
+    parser.add_argument("--name-cache", type=Path, default=NAME_CACHE_PATH,
+                        help=f"SQLite file backing the name parse cache (default: {NAME_CACHE_PATH})")
+    parser.add_argument("--no-name-cache", action="store_true",
+                        help="Keep the name parse cache in memory only (no reuse across runs)")
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
     print("=" * 60)
     print("Epstein Files ARD - Build Identity Mentions")
     print("=" * 60)
@@ -510,8 +651,15 @@ def main():
         print("  pip install probablepeople")
         print()
     
+    if not METAPHONE_AVAILABLE:
+        print("\nWARNING: Install metaphone for Double Metaphone blocking keys (NULL without it):")
+        print("  pip install metaphone")
+        print()
+    
+    configure_name_cache(None if args.no_name_cache else args.name_cache)
+    
     try:
-        build_identity_mentions(dry_run=args.dry_run)
+        build_identity_mentions(dry_run=args.dry_run, workers=args.workers)
         print("\n✓ Build completed successfully")
         return 0
     except Exception as e:
@@ -519,6 +667,8 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        NAME_CACHE.close()
 
 
 if __name__ == "__main__":
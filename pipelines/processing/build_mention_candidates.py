@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Build Entity Resolution Candidate Pairs
+
+Reads the blocking keys on l1.identity_mentions (see blocking_keys.py) and
+emits candidate mention pairs for entity resolution to l1.mention_candidates:
+
+- One blocking scheme per key family (Soundex, NYSIIS, Double Metaphone
+  primary/alternate, initial + surname prefix); mentions sharing a scheme's
+  key form a block, and every pair within a block is a candidate
+- Blocks above --max-block-size are skipped (and reported) instead of
+  expanding into O(n^2) pairs; very common surnames are caught by the
+  tighter schemes
+- Pairs are deduplicated across schemes; each row records the schemes that
+  produced it
+- Reports candidate counts and the reduction ratio against comparing every
+  mention with every other
+
+Mention IDs are regenerated by build_identity_mentions.py, so rerun this
+after every identity mentions build.
+
+Usage:
+    python build_mention_candidates.py [--dry-run]
+    python build_mention_candidates.py --max-block-size 500 --schemes soundex nysiis
+    python build_mention_candidates.py --cross-source-only   # flight x black book pairs only
+
+Requirements:
+    pip install psycopg[binary] python-dotenv
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+
+import psycopg
+from dotenv import load_dotenv
+
+from l1_bulk_writer import copy_rows
+
+# Load environment
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+load_dotenv(PROJECT_ROOT / ".env")
+
+# Configuration
+PGSQL_HOST = os.getenv("PGSQL_HOST")
+PGSQL_PORT = os.getenv("PGSQL_PORT", "5432")
+PGSQL_USER = os.getenv("PGSQL_USER")
+PGSQL_PASSWORD = os.getenv("PGSQL_PASSWORD")
+PGSQL_DATABASE = os.getenv("PGSQL_DATABASE")
+
+# Scheme -> l1.identity_mentions columns forming the block key. The first
+# column (surname code) must be set; later columns may be NULL, which then
+# only blocks with other NULLs.
+BLOCKING_SCHEMES = {
+    "soundex": ("soundex_last", "soundex_first"),
+    "nysiis": ("nysiis_last", "nysiis_first"),
+    "dmetaphone": ("dmetaphone_last", "dmetaphone_first"),
+    "dmetaphone_alt": ("dmetaphone_last_alt", "dmetaphone_first"),
+    "initial_last": ("initial_last_key",),
+}
+
+# Blocks larger than this are skipped (pairs in a block grow as n^2)
+MAX_BLOCK_SIZE = 200
+
+# Largest skipped blocks listed in the report
+REPORT_SKIPPED = 10
+
+
+def get_connection():
+    """Connect to the project database."""
+    return psycopg.connect(
+        host=PGSQL_HOST,
+        port=PGSQL_PORT,
+        user=PGSQL_USER,
+        password=PGSQL_PASSWORD,
+        dbname=PGSQL_DATABASE
+    )
+
+
+def pair_count(n: int) -> int:
+    """Unordered pairs among n items."""
+    return n * (n - 1) // 2
+
+
+# =============================================================================
+# DDL
+# =============================================================================
+
+# AI NOTE: No foreign keys to l1.identity_mentions: build_identity_mentions.py
+# TRUNCATEs that table on every build, which a referencing table would block.
+MENTION_CANDIDATES_DDL = """
+CREATE TABLE IF NOT EXISTS l1.mention_candidates (
+    -- Ordered pair (mention_id_a < mention_id_b), one row per pair
+    mention_id_a UUID NOT NULL,
+    mention_id_b UUID NOT NULL,
+    
+    -- Blocking schemes that put both mentions in one block
+    blocking_schemes TEXT[] NOT NULL,
+    scheme_count INTEGER NOT NULL,
+    
+    -- Flight passenger x contact person pair
+    cross_source BOOLEAN NOT NULL,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (mention_id_a, mention_id_b),
+    CHECK (mention_id_a < mention_id_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_mention_candidates_b ON l1.mention_candidates(mention_id_b);
+CREATE INDEX IF NOT EXISTS idx_mention_candidates_schemes ON l1.mention_candidates(scheme_count);
+CREATE INDEX IF NOT EXISTS idx_mention_candidates_cross ON l1.mention_candidates(cross_source) WHERE cross_source;
+"""
+
+
+def create_tables(conn):
+    """Create candidate pairs table."""
+    print("Creating l1.mention_candidates table...")
+    
+    with conn.cursor() as cur:
+        cur.execute(MENTION_CANDIDATES_DDL)
+        print("  Created l1.mention_candidates")
+    
+    conn.commit()
+
+
+# =============================================================================
+# Blocking
+# =============================================================================
+
+def build_blocks(mentions: list[dict], schemes: list[str]) -> dict[str, dict[tuple, list[str]]]:
+    """
+    Group mention IDs by block key, per scheme.
+    
+    Returns:
+        dict: scheme -> {block key: [mention_id, ...]}
+    """
+    blocks = {scheme: defaultdict(list) for scheme in schemes}
+    
+    for mention in mentions:
+        for scheme in schemes:
+            key = tuple(mention[col] for col in BLOCKING_SCHEMES[scheme])
+            if key[0]:
+                blocks[scheme][key].append(mention["mention_id"])
+    
+    return blocks
+
+
+def generate_candidates(
+    mentions: list[dict],
+    schemes: list[str],
+    max_block_size: int = MAX_BLOCK_SIZE,
+    cross_source_only: bool = False,
+) -> tuple[dict[tuple[str, str], list[str]], dict]:
+    """
+    Candidate pairs from every block of at most max_block_size mentions.
+    
+    Args:
+        mentions: Dicts with mention_id, source_table and the blocking columns
+        schemes: BLOCKING_SCHEMES names to use (repeats are ignored)
+        max_block_size: Larger blocks are skipped
+        cross_source_only: Keep only flight passenger x contact person pairs
+    
+    Returns:
+        (pairs, stats): pairs maps (mention_id_a, mention_id_b), a < b, to
+        the schemes that produced it; stats holds per-scheme block/pair
+        counts and the skipped blocks
+    """
+    # A repeated scheme would put each mention in its block twice (self-pairs)
+    schemes = list(dict.fromkeys(schemes))
+    source_of = {m["mention_id"]: m["source_table"] for m in mentions}
+    pairs = defaultdict(list)
+    stats = {"schemes": {}, "skipped": []}
+    
+    for scheme, scheme_blocks in build_blocks(mentions, schemes).items():
+        scheme_stats = {
+            "blocks": 0,
+            "pairs": 0,
+            "skipped_blocks": 0,
+            "skipped_pairs": 0,
+        }
+        
+        for key, ids in scheme_blocks.items():
+            if len(ids) < 2:
+                continue
+            
+            if len(ids) > max_block_size:
+                scheme_stats["skipped_blocks"] += 1
+                scheme_stats["skipped_pairs"] += pair_count(len(ids))
+                stats["skipped"].append((scheme, key, len(ids)))
+                continue
+            
+            scheme_stats["blocks"] += 1
+            for a, b in combinations(sorted(ids), 2):
+                if cross_source_only and source_of[a] == source_of[b]:
+                    continue
+                scheme_stats["pairs"] += 1
+                pairs[(a, b)].append(scheme)
+        
+        stats["schemes"][scheme] = scheme_stats
+    
+    stats["skipped"].sort(key=lambda item: -item[2])
+    return pairs, stats
+
+
+def print_report(mention_count: int, pairs: dict, stats: dict, max_block_size: int, cross_source_only: bool):
+    """Print per-scheme counts, skipped blocks and reduction ratios."""
+    print(f"\n  Blocking schemes (max block size {max_block_size:,}):")
+    print(f"    {'Scheme':<16} {'Blocks':>8} {'Pairs':>12} {'Skipped':>8} {'Pairs avoided':>14}")
+    for scheme, s in stats["schemes"].items():
+        print(f"    {scheme:<16} {s['blocks']:>8,} {s['pairs']:>12,} {s['skipped_blocks']:>8,} {s['skipped_pairs']:>14,}")
+    
+    if stats["skipped"]:
+        print(f"\n  ⚠ {len(stats['skipped']):,} blocks over the size cap skipped; largest:")
+        for scheme, key, size in stats["skipped"][:REPORT_SKIPPED]:
+            print(f"    {scheme:<16} {'/'.join(str(k) for k in key):<16} {size:,} mentions")
+    
+    scheme_pairs = sum(s["pairs"] for s in stats["schemes"].values())
+    full_pairs = pair_count(mention_count)
+    multi_scheme = sum(1 for schemes in pairs.values() if len(schemes) > 1)
+    
+    print("\n  Candidate pairs:")
+    print(f"    Mentions:                {mention_count:,}")
+    print(f"    Full comparison:         {full_pairs:,} pairs")
+    print(f"    Emitted by schemes:      {scheme_pairs:,}")
+    print(f"    Distinct candidates:     {len(pairs):,}" + (" (cross-source only)" if cross_source_only else ""))
+    print(f"    Found by 2+ schemes:     {multi_scheme:,}")
+    if full_pairs:
+        print(f"    Reduction ratio:         {1 - len(pairs) / full_pairs:.4%}")
+    if scheme_pairs:
+        print(f"    Cross-scheme dedup:      {1 - len(pairs) / scheme_pairs:.1%} of emitted pairs were duplicates")
+
+
+# =============================================================================
+# Main Build
+# =============================================================================
+
+def build_mention_candidates(
+    dry_run: bool = False,
+    schemes: list[str] | None = None,
+    max_block_size: int = MAX_BLOCK_SIZE,
+    cross_source_only: bool = False,
+):
+    """
+    Build l1.mention_candidates from the blocking keys on l1.identity_mentions.
+    """
+    schemes = list(dict.fromkeys(schemes or BLOCKING_SCHEMES))
+    print("Building entity resolution candidate pairs...")
+    
+    with get_connection() as conn:
+        create_tables(conn)
+        
+        with conn.cursor() as cur:
+            columns = sorted({col for scheme in schemes for col in BLOCKING_SCHEMES[scheme]})
+            cur.execute(f"""
+                SELECT mention_id::text, source_table, {", ".join(columns)}
+                FROM l1.identity_mentions
+            """)
+            names = [desc[0] for desc in cur.description]
+            mentions = [dict(zip(names, row)) for row in cur.fetchall()]
+            print(f"  Loaded {len(mentions):,} identity mentions")
+            
+            pairs, stats = generate_candidates(mentions, schemes, max_block_size, cross_source_only)
+            print_report(len(mentions), pairs, stats, max_block_size, cross_source_only)
+            
+            if dry_run:
+                print("\n  [DRY RUN] No data written")
+                return
+            
+            source_of = {m["mention_id"]: m["source_table"] for m in mentions}
+            
+            print("\n  Inserting candidate pairs...")
+            cur.execute("TRUNCATE l1.mention_candidates")
+            copy_rows(
+                cur, "l1.mention_candidates",
+                ["mention_id_a", "mention_id_b", "blocking_schemes", "scheme_count", "cross_source"],
+                (
+                    (a, b, pair_schemes, len(pair_schemes), source_of[a] != source_of[b])
+                    for (a, b), pair_schemes in pairs.items()
+                ),
+            )
+            
+            conn.commit()
+            
+            # =================================================================
+            # Verify
+            # =================================================================
+            cur.execute("""
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE cross_source)
+                FROM l1.mention_candidates
+            """)
+            total_count, cross_count = cur.fetchone()
+            
+            print(f"\n  ✓ Inserted {total_count:,} candidate pairs")
+            print(f"  ✓ {cross_count:,} pair flight passengers with contact persons")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build entity resolution candidate pairs")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report blocks and pair counts without writing to database")
+    parser.add_argument("--schemes", nargs="+", choices=list(BLOCKING_SCHEMES), default=list(BLOCKING_SCHEMES),
+                        help="Blocking schemes to use (default: all)")
+    parser.add_argument("--max-block-size", type=int, default=MAX_BLOCK_SIZE,
+                        help=f"Skip blocks with more mentions than this (default: {MAX_BLOCK_SIZE})")
+    parser.add_argument("--cross-source-only", action="store_true",
+                        help="Only keep flight passenger x contact person pairs")
+    args = parser.parse_args()
+    
+    if args.max_block_size < 2:
+        parser.error("--max-block-size must be at least 2")
+    
+    print("=" * 60)
+    print("Epstein Files ARD - Build Mention Candidates")
+    print("=" * 60)
+    
+    try:
+        build_mention_candidates(
+            dry_run=args.dry_run,
+            schemes=args.schemes,
+            max_block_size=args.max_block_size,
+            cross_source_only=args.cross_source_only,
+        )
+        print("\n✓ Build completed successfully")
+        return 0
+    except Exception as e:
+        print(f"\nERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+Country Lookup
+
+BB-3 country resolution for transform_black_book_l1.py: maps free-text
+country values to ISO 3166-1 alpha-2.
+
+- Every ISO 3166-1 country (name, common name, official name, alpha-3)
+  plus common aliases, merged with the transform's own COUNTRY_MAP
+  overrides (typos, cities) which take precedence
+- Keys are normalized once at build time (casefold, accents stripped,
+  whitespace and punctuation removed), so "U.S.A.", "usa" and " U S A "
+  are a single dict lookup
+- Values still unmatched fall back to a BK-tree search within a small edit
+  distance ("Swizerland" -> CH): one edit below 8 characters, two above.
+  Short values never fuzzy-match, caller-marked names (city aliases such as
+  "Paris") only match exactly, and a value equally close to keys for two
+  different countries stays unmapped
+- US state names are ambiguous in this mostly-US address book ("Georgia"
+  is also GE) and resolve to None, exactly or fuzzily, unless an override
+  names them
+- Fuzzy hits are recorded per raw value (`fuzzy_hits`) for review
+- Results are memoized per raw value
+
+Usage:
+    from country_lookup import CountryIndex
+    
+    index = CountryIndex(COUNTRY_MAP, exact_only=CITY_COUNTRY_MAP)
+    index.lookup("Untied Kingdom")  # "GB"
+    index.fuzzy_hits                # {"Untied Kingdom": ("GB", "unitedkingdom")}
+"""
+
+import unicodedata
+
+# =============================================================================
+# ISO 3166-1 (generated from the Debian iso-codes package, iso_3166-1.json)
+# =============================================================================
+
+# (alpha-2, alpha-3, names)
+ISO_3166_1 = (
+    ("AD", "AND", ("Andorra", "Principality of Andorra")),
+    ("AE", "ARE", ("United Arab Emirates",)),
+    ("AF", "AFG", ("Afghanistan", "Islamic Republic of Afghanistan")),
+    ("AG", "ATG", ("Antigua and Barbuda",)),
+    ("AI", "AIA", ("Anguilla",)),
+    ("AL", "ALB", ("Albania", "Republic of Albania")),
+    ("AM", "ARM", ("Armenia", "Republic of Armenia")),
+    ("AO", "AGO", ("Angola", "Republic of Angola")),
+    ("AQ", "ATA", ("Antarctica",)),
+    ("AR", "ARG", ("Argentina", "Argentine Republic")),
+    ("AS", "ASM", ("American Samoa",)),
+    ("AT", "AUT", ("Austria", "Republic of Austria")),
+    ("AU", "AUS", ("Australia",)),
+    ("AW", "ABW", ("Aruba",)),
+    ("AX", "ALA", ("Åland Islands",)),
+    ("AZ", "AZE", ("Azerbaijan", "Republic of Azerbaijan")),
+    ("BA", "BIH", ("Bosnia and Herzegovina", "Republic of Bosnia and Herzegovina")),
+    ("BB", "BRB", ("Barbados",)),
+    ("BD", "BGD", ("Bangladesh", "People's Republic of Bangladesh")),
+    ("BE", "BEL", ("Belgium", "Kingdom of Belgium")),
+    ("BF", "BFA", ("Burkina Faso",)),
+    ("BG", "BGR", ("Bulgaria", "Republic of Bulgaria")),
+    ("BH", "BHR", ("Bahrain", "Kingdom of Bahrain")),
+    ("BI", "BDI", ("Burundi", "Republic of Burundi")),
+    ("BJ", "BEN", ("Benin", "Republic of Benin")),
+    ("BL", "BLM", ("Saint Barthélemy",)),
+    ("BM", "BMU", ("Bermuda",)),
+    ("BN", "BRN", ("Brunei Darussalam",)),
+    ("BO", "BOL", ("Bolivia, Plurinational State of", "Bolivia", "Plurinational State of Bolivia")),
+    ("BQ", "BES", ("Bonaire, Sint Eustatius and Saba",)),
+    ("BR", "BRA", ("Brazil", "Federative Republic of Brazil")),
+    ("BS", "BHS", ("Bahamas", "Commonwealth of the Bahamas")),
+    ("BT", "BTN", ("Bhutan", "Kingdom of Bhutan")),
+    ("BV", "BVT", ("Bouvet Island",)),
+    ("BW", "BWA", ("Botswana", "Republic of Botswana")),
+    ("BY", "BLR", ("Belarus", "Republic of Belarus")),
+    ("BZ", "BLZ", ("Belize",)),
+    ("CA", "CAN", ("Canada",)),
+    ("CC", "CCK", ("Cocos (Keeling) Islands",)),
+    ("CD", "COD", ("Congo, The Democratic Republic of the",)),
+    ("CF", "CAF", ("Central African Republic",)),
+    ("CG", "COG", ("Congo", "Republic of the Congo")),
+    ("CH", "CHE", ("Switzerland", "Swiss Confederation")),
+    ("CI", "CIV", ("Côte d'Ivoire", "Republic of Côte d'Ivoire")),
+    ("CK", "COK", ("Cook Islands",)),
+    ("CL", "CHL", ("Chile", "Republic of Chile")),
+    ("CM", "CMR", ("Cameroon", "Republic of Cameroon")),
+    ("CN", "CHN", ("China", "People's Republic of China")),
+    ("CO", "COL", ("Colombia", "Republic of Colombia")),
+    ("CR", "CRI", ("Costa Rica", "Republic of Costa Rica")),
+    ("CU", "CUB", ("Cuba", "Republic of Cuba")),
+    ("CV", "CPV", ("Cabo Verde", "Republic of Cabo Verde")),
+    ("CW", "CUW", ("Curaçao",)),
+    ("CX", "CXR", ("Christmas Island",)),
+    ("CY", "CYP", ("Cyprus", "Republic of Cyprus")),
+    ("CZ", "CZE", ("Czechia", "Czech Republic")),
+    ("DE", "DEU", ("Germany", "Federal Republic of Germany")),
+    ("DJ", "DJI", ("Djibouti", "Republic of Djibouti")),
+    ("DK", "DNK", ("Denmark", "Kingdom of Denmark")),
+    ("DM", "DMA", ("Dominica", "Commonwealth of Dominica")),
+    ("DO", "DOM", ("Dominican Republic",)),
+    ("DZ", "DZA", ("Algeria", "People's Democratic Republic of Algeria")),
+    ("EC", "ECU", ("Ecuador", "Republic of Ecuador")),
+    ("EE", "EST", ("Estonia", "Republic of Estonia")),
+    ("EG", "EGY", ("Egypt", "Arab Republic of Egypt")),
+    ("EH", "ESH", ("Western Sahara",)),
+    ("ER", "ERI", ("Eritrea", "the State of Eritrea")),
+    ("ES", "ESP", ("Spain", "Kingdom of Spain")),
+    ("ET", "ETH", ("Ethiopia", "Federal Democratic Republic of Ethiopia")),
+    ("FI", "FIN", ("Finland", "Republic of Finland")),
+    ("FJ", "FJI", ("Fiji", "Republic of Fiji")),
+    ("FK", "FLK", ("Falkland Islands (Malvinas)",)),
+    ("FM", "FSM", ("Micronesia, Federated States of", "Federated States of Micronesia")),
+    ("FO", "FRO", ("Faroe Islands",)),
+    ("FR", "FRA", ("France", "French Republic")),
+    ("GA", "GAB", ("Gabon", "Gabonese Republic")),
+    ("GB", "GBR", ("United Kingdom", "United Kingdom of Great Britain and Northern Ireland")),
+    ("GD", "GRD", ("Grenada",)),
+    ("GE", "GEO", ("Georgia",)),
+    ("GF", "GUF", ("French Guiana",)),
+    ("GG", "GGY", ("Guernsey",)),
+    ("GH", "GHA", ("Ghana", "Republic of Ghana")),
+    ("GI", "GIB", ("Gibraltar",)),
+    ("GL", "GRL", ("Greenland",)),
+    ("GM", "GMB", ("Gambia", "Republic of the Gambia")),
+    ("GN", "GIN", ("Guinea", "Republic of Guinea")),
+    ("GP", "GLP", ("Guadeloupe",)),
+    ("GQ", "GNQ", ("Equatorial Guinea", "Republic of Equatorial Guinea")),
+    ("GR", "GRC", ("Greece", "Hellenic Republic")),
+    ("GS", "SGS", ("South Georgia and the South Sandwich Islands",)),
+    ("GT", "GTM", ("Guatemala", "Republic of Guatemala")),
+    ("GU", "GUM", ("Guam",)),
+    ("GW", "GNB", ("Guinea-Bissau", "Republic of Guinea-Bissau")),
+    ("GY", "GUY", ("Guyana", "Republic of Guyana")),
+    ("HK", "HKG", ("Hong Kong", "Hong Kong Special Administrative Region of China")),
+    ("HM", "HMD", ("Heard Island and McDonald Islands",)),
+    ("HN", "HND", ("Honduras", "Republic of Honduras")),
+    ("HR", "HRV", ("Croatia", "Republic of Croatia")),
+    ("HT", "HTI", ("Haiti", "Republic of Haiti")),
+    ("HU", "HUN", ("Hungary",)),
+    ("ID", "IDN", ("Indonesia", "Republic of Indonesia")),
+    ("IE", "IRL", ("Ireland",)),
+    ("IL", "ISR", ("Israel", "State of Israel")),
+    ("IM", "IMN", ("Isle of Man",)),
+    ("IN", "IND", ("India", "Republic of India")),
+    ("IO", "IOT", ("British Indian Ocean Territory",)),
+    ("IQ", "IRQ", ("Iraq", "Republic of Iraq")),
+    ("IR", "IRN", ("Iran, Islamic Republic of", "Iran", "Islamic Republic of Iran")),
+    ("IS", "ISL", ("Iceland", "Republic of Iceland")),
+    ("IT", "ITA", ("Italy", "Italian Republic")),
+    ("JE", "JEY", ("Jersey",)),
+    ("JM", "JAM", ("Jamaica",)),
+    ("JO", "JOR", ("Jordan", "Hashemite Kingdom of Jordan")),
+    ("JP", "JPN", ("Japan",)),
+    ("KE", "KEN", ("Kenya", "Republic of Kenya")),
+    ("KG", "KGZ", ("Kyrgyzstan", "Kyrgyz Republic")),
+    ("KH", "KHM", ("Cambodia", "Kingdom of Cambodia")),
+    ("KI", "KIR", ("Kiribati", "Republic of Kiribati")),
+    ("KM", "COM", ("Comoros", "Union of the Comoros")),
+    ("KN", "KNA", ("Saint Kitts and Nevis",)),
+    ("KP", "PRK", ("Korea, Democratic People's Republic of", "North Korea", "Democratic People's Republic of Korea")),
+    ("KR", "KOR", ("Korea, Republic of", "South Korea")),
+    ("KW", "KWT", ("Kuwait", "State of Kuwait")),
+    ("KY", "CYM", ("Cayman Islands",)),
+    ("KZ", "KAZ", ("Kazakhstan", "Republic of Kazakhstan")),
+    ("LA", "LAO", ("Lao People's Democratic Republic", "Laos")),
+    ("LB", "LBN", ("Lebanon", "Lebanese Republic")),
+    ("LC", "LCA", ("Saint Lucia",)),
+    ("LI", "LIE", ("Liechtenstein", "Principality of Liechtenstein")),
+    ("LK", "LKA", ("Sri Lanka", "Democratic Socialist Republic of Sri Lanka")),
+    ("LR", "LBR", ("Liberia", "Republic of Liberia")),
+    ("LS", "LSO", ("Lesotho", "Kingdom of Lesotho")),
+    ("LT", "LTU", ("Lithuania", "Republic of Lithuania")),
+    ("LU", "LUX", ("Luxembourg", "Grand Duchy of Luxembourg")),
+    ("LV", "LVA", ("Latvia", "Republic of Latvia")),
+    ("LY", "LBY", ("Libya",)),
+    ("MA", "MAR", ("Morocco", "Kingdom of Morocco")),
+    ("MC", "MCO", ("Monaco", "Principality of Monaco")),
+    ("MD", "MDA", ("Moldova, Republic of", "Moldova", "Republic of Moldova")),
+    ("ME", "MNE", ("Montenegro",)),
+    ("MF", "MAF", ("Saint Martin (French part)",)),
+    ("MG", "MDG", ("Madagascar", "Republic of Madagascar")),
+    ("MH", "MHL", ("Marshall Islands", "Republic of the Marshall Islands")),
+    ("MK", "MKD", ("North Macedonia", "Republic of North Macedonia")),
+    ("ML", "MLI", ("Mali", "Republic of Mali")),
+    ("MM", "MMR", ("Myanmar", "Republic of Myanmar")),
+    ("MN", "MNG", ("Mongolia",)),
+    ("MO", "MAC", ("Macao", "Macao Special Administrative Region of China")),
+    ("MP", "MNP", ("Northern Mariana Islands", "Commonwealth of the Northern Mariana Islands")),
+    ("MQ", "MTQ", ("Martinique",)),
+    ("MR", "MRT", ("Mauritania", "Islamic Republic of Mauritania")),
+    ("MS", "MSR", ("Montserrat",)),
+    ("MT", "MLT", ("Malta", "Republic of Malta")),
+    ("MU", "MUS", ("Mauritius", "Republic of Mauritius")),
+    ("MV", "MDV", ("Maldives", "Republic of Maldives")),
+    ("MW", "MWI", ("Malawi", "Republic of Malawi")),
+    ("MX", "MEX", ("Mexico", "United Mexican States")),
+    ("MY", "MYS", ("Malaysia",)),
+    ("MZ", "MOZ", ("Mozambique", "Republic of Mozambique")),
+    ("NA", "NAM", ("Namibia", "Republic of Namibia")),
+    ("NC", "NCL", ("New Caledonia",)),
+    ("NE", "NER", ("Niger", "Republic of the Niger")),
+    ("NF", "NFK", ("Norfolk Island",)),
+    ("NG", "NGA", ("Nigeria", "Federal Republic of Nigeria")),
+    ("NI", "NIC", ("Nicaragua", "Republic of Nicaragua")),
+    ("NL", "NLD", ("Netherlands", "Kingdom of the Netherlands")),
+    ("NO", "NOR", ("Norway", "Kingdom of Norway")),
+    ("NP", "NPL", ("Nepal", "Federal Democratic Republic of Nepal")),
+    ("NR", "NRU", ("Nauru", "Republic of Nauru")),
+    ("NU", "NIU", ("Niue",)),
+    ("NZ", "NZL", ("New Zealand",)),
+    ("OM", "OMN", ("Oman", "Sultanate of Oman")),
+    ("PA", "PAN", ("Panama", "Republic of Panama")),
+    ("PE", "PER", ("Peru", "Republic of Peru")),
+    ("PF", "PYF", ("French Polynesia",)),
+    ("PG", "PNG", ("Papua New Guinea", "Independent State of Papua New Guinea")),
+    ("PH", "PHL", ("Philippines", "Republic of the Philippines")),
+    ("PK", "PAK", ("Pakistan", "Islamic Republic of Pakistan")),
+    ("PL", "POL", ("Poland", "Republic of Poland")),
+    ("PM", "SPM", ("Saint Pierre and Miquelon",)),
+    ("PN", "PCN", ("Pitcairn",)),
+    ("PR", "PRI", ("Puerto Rico",)),
+    ("PS", "PSE", ("Palestine, State of", "the State of Palestine")),
+    ("PT", "PRT", ("Portugal", "Portuguese Republic")),
+    ("PW", "PLW", ("Palau", "Republic of Palau")),
+    ("PY", "PRY", ("Paraguay", "Republic of Paraguay")),
+    ("QA", "QAT", ("Qatar", "State of Qatar")),
+    ("RE", "REU", ("Réunion",)),
+    ("RO", "ROU", ("Romania",)),
+    ("RS", "SRB", ("Serbia", "Republic of Serbia")),
+    ("RU", "RUS", ("Russian Federation",)),
+    ("RW", "RWA", ("Rwanda", "Rwandese Republic")),
+    ("SA", "SAU", ("Saudi Arabia", "Kingdom of Saudi Arabia")),
+    ("SB", "SLB", ("Solomon Islands",)),
+    ("SC", "SYC", ("Seychelles", "Republic of Seychelles")),
+    ("SD", "SDN", ("Sudan", "Republic of the Sudan")),
+    ("SE", "SWE", ("Sweden", "Kingdom of Sweden")),
+    ("SG", "SGP", ("Singapore", "Republic of Singapore")),
+    ("SH", "SHN", ("Saint Helena, Ascension and Tristan da Cunha",)),
+    ("SI", "SVN", ("Slovenia", "Republic of Slovenia")),
+    ("SJ", "SJM", ("Svalbard and Jan Mayen",)),
+    ("SK", "SVK", ("Slovakia", "Slovak Republic")),
+    ("SL", "SLE", ("Sierra Leone", "Republic of Sierra Leone")),
+    ("SM", "SMR", ("San Marino", "Republic of San Marino")),
+    ("SN", "SEN", ("Senegal", "Republic of Senegal")),
+    ("SO", "SOM", ("Somalia", "Federal Republic of Somalia")),
+    ("SR", "SUR", ("Suriname", "Republic of Suriname")),
+    ("SS", "SSD", ("South Sudan", "Republic of South Sudan")),
+    ("ST", "STP", ("Sao Tome and Principe", "Democratic Republic of Sao Tome and Principe")),
+    ("SV", "SLV", ("El Salvador", "Republic of El Salvador")),
+    ("SX", "SXM", ("Sint Maarten (Dutch part)",)),
+    ("SY", "SYR", ("Syrian Arab Republic", "Syria")),
+    ("SZ", "SWZ", ("Eswatini", "Kingdom of Eswatini")),
+    ("TC", "TCA", ("Turks and Caicos Islands",)),
+    ("TD", "TCD", ("Chad", "Republic of Chad")),
+    ("TF", "ATF", ("French Southern Territories",)),
+    ("TG", "TGO", ("Togo", "Togolese Republic")),
+    ("TH", "THA", ("Thailand", "Kingdom of Thailand")),
+    ("TJ", "TJK", ("Tajikistan", "Republic of Tajikistan")),
+    ("TK", "TKL", ("Tokelau",)),
+    ("TL", "TLS", ("Timor-Leste", "Democratic Republic of Timor-Leste")),
+    ("TM", "TKM", ("Turkmenistan",)),
+    ("TN", "TUN", ("Tunisia", "Republic of Tunisia")),
+    ("TO", "TON", ("Tonga", "Kingdom of Tonga")),
+    ("TR", "TUR", ("Türkiye", "Republic of Türkiye")),
+    ("TT", "TTO", ("Trinidad and Tobago", "Republic of Trinidad and Tobago")),
+    ("TV", "TUV", ("Tuvalu",)),
+    ("TW", "TWN", ("Taiwan, Province of China", "Taiwan")),
+    ("TZ", "TZA", ("Tanzania, United Republic of", "Tanzania", "United Republic of Tanzania")),
+    ("UA", "UKR", ("Ukraine",)),
+    ("UG", "UGA", ("Uganda", "Republic of Uganda")),
+    ("UM", "UMI", ("United States Minor Outlying Islands",)),
+    ("US", "USA", ("United States", "United States of America")),
+    ("UY", "URY", ("Uruguay", "Eastern Republic of Uruguay")),
+    ("UZ", "UZB", ("Uzbekistan", "Republic of Uzbekistan")),
+    ("VA", "VAT", ("Holy See (Vatican City State)",)),
+    ("VC", "VCT", ("Saint Vincent and the Grenadines",)),
+    ("VE", "VEN", ("Venezuela, Bolivarian Republic of", "Venezuela", "Bolivarian Republic of Venezuela")),
+    ("VG", "VGB", ("Virgin Islands, British", "British Virgin Islands")),
+    ("VI", "VIR", ("Virgin Islands, U.S.", "Virgin Islands of the United States")),
+    ("VN", "VNM", ("Viet Nam", "Vietnam", "Socialist Republic of Viet Nam")),
+    ("VU", "VUT", ("Vanuatu", "Republic of Vanuatu")),
+    ("WF", "WLF", ("Wallis and Futuna",)),
+    ("WS", "WSM", ("Samoa", "Independent State of Samoa")),
+    ("YE", "YEM", ("Yemen", "Republic of Yemen")),
+    ("YT", "MYT", ("Mayotte",)),
+    ("ZA", "ZAF", ("South Africa", "Republic of South Africa")),
+    ("ZM", "ZMB", ("Zambia", "Republic of Zambia")),
+    ("ZW", "ZWE", ("Zimbabwe", "Republic of Zimbabwe")),
+)
+
+# Common names and native spellings not in the ISO tables
+COUNTRY_ALIASES = {
+    "America": "US",
+    "United States of America": "US",
+    "Britain": "GB",
+    "United Kingdom": "GB",
+    "Scotland": "GB",
+    "Wales": "GB",
+    "Northern Ireland": "GB",
+    "Holland": "NL",
+    "Deutschland": "DE",
+    "España": "ES",
+    "Italia": "IT",
+    "Brasil": "BR",
+    "Schweiz": "CH",
+    "Suisse": "CH",
+    "Österreich": "AT",
+    "Czechia": "CZ",
+    "South Korea": "KR",
+    "Korea": "KR",
+    "Ivory Coast": "CI",
+    "Burma": "MM",
+    "Swaziland": "SZ",
+    "Macedonia": "MK",
+    "Vatican": "VA",
+    "Vatican City": "VA",
+    "UAE": "AE",
+    "Emirates": "AE",
+    "BVI": "VG",
+    "British Virgin Islands": "VG",
+    "US Virgin Islands": "VI",
+    "USVI": "VI",
+    "St Barths": "BL",
+    "St Barts": "BL",
+    "St Maarten": "SX",
+    "St Martin": "MF",
+    "Antigua": "AG",
+    "Turks and Caicos": "TC",
+}
+
+# US states (plus DC): never resolved to a country unless an override says so
+US_STATES = (
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
+    "Connecticut", "Delaware", "District of Columbia", "Florida", "Georgia",
+    "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky",
+    "Louisiana", "Maine", "Maryland", "Massachusetts", "Michigan", "Minnesota",
+    "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada", "New Hampshire",
+    "New Jersey", "New Mexico", "New York", "North Carolina", "North Dakota",
+    "Ohio", "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina",
+    "South Dakota", "Tennessee", "Texas", "Utah", "Vermont", "Virginia",
+    "Washington", "West Virginia", "Wisconsin", "Wyoming",
+)
+
+# Fuzzy matching: keys shorter than FUZZY_MIN_LENGTH never fuzzy-match; keys
+# shorter than FUZZY_SHORT_LENGTH allow one edit, longer ones grow up to
+# FUZZY_MAX_DISTANCE ("Parish" must not become "Paris", "Indiana" not "India")
+FUZZY_MIN_LENGTH = 5
+FUZZY_SHORT_LENGTH = 8
+FUZZY_MAX_DISTANCE = 2
+
+# BK-tree code for US state keys; a best match including it is ambiguous
+US_STATE = "US-STATE"
+
+
+def normalize_key(value: str) -> str:
+    """Casefold, strip accents, drop whitespace and punctuation."""
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    return "".join(ch for ch in decomposed if ch.isalnum())
+
+
+def fuzzy_distance(key: str) -> int:
+    """Edit distance allowed when fuzzy-matching a normalized key."""
+    if len(key) < FUZZY_MIN_LENGTH:
+        return 0
+    if len(key) < FUZZY_SHORT_LENGTH:
+        return 1
+    return min(FUZZY_MAX_DISTANCE, len(key) // 3)
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance (insert/delete/substitute, unit cost)."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        previous = current
+    return previous[-1]
+
+
+# =============================================================================
+# BK-tree
+# =============================================================================
+
+class BKTree:
+    """
+    Burkhard-Keller tree over strings under Levenshtein distance.
+    
+    Each child edge is labelled with its distance to the parent; by the
+    triangle inequality a search within `max_distance` of the query only
+    descends edges labelled d(query, node) +/- max_distance.
+    """
+    
+    def __init__(self, words=()):
+        self._root = None
+        for word in words:
+            self.add(word)
+    
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            return
+        
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+    
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """All (distance, word) within max_distance, closest first."""
+        if self._root is None:
+            return []
+        
+        matches = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                matches.append((distance, node_word))
+            for edge, child in children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        
+        return sorted(matches)
+
+
+# =============================================================================
+# Country index
+# =============================================================================
+
+class CountryIndex:
+    """
+    Normalized ISO 3166-1 alpha-2 lookup with a bounded fuzzy fallback.
+    
+    Lookup order:
+    1. Exact match in overrides (the caller's curated map)
+    2. US state name (not in overrides): None
+    3. Normalized key (overrides, aliases, ISO names)
+    4. ISO code given as-is: any 2-letter uppercase value, or a known
+       uppercase alpha-3 code
+    5. Fuzzy match on the normalized key (BK-tree), never against
+       exact_only names; a best match that is a US state gives None
+    
+    Counters: `fuzzy_matches` (distinct values resolved by step 5, detailed
+    in `fuzzy_hits`), `us_states` (distinct values left unmapped as US
+    states), `unmapped` (distinct values not resolved, including us_states).
+    """
+    
+    def __init__(self, overrides: dict[str, str] | None = None, exact_only=()):
+        """
+        Args:
+            overrides: Raw value -> alpha-2, taking precedence over everything
+            exact_only: Names (e.g. city aliases) never used as fuzzy targets
+        """
+        self.overrides = dict(overrides or {})
+        self.alpha3 = {alpha3: alpha2 for alpha2, alpha3, _ in ISO_3166_1}
+        
+        # Normalized key -> alpha-2; a key claimed by two ISO codes is
+        # dropped unless an alias or override settles it
+        self.keys = {}
+        ambiguous = set()
+        for alpha2, _, names in ISO_3166_1:
+            for name in names:
+                key = normalize_key(name)
+                if self.keys.setdefault(key, alpha2) != alpha2:
+                    ambiguous.add(key)
+        for key in ambiguous:
+            del self.keys[key]
+        for source in (COUNTRY_ALIASES, self.overrides):
+            for name, alpha2 in source.items():
+                self.keys[normalize_key(name)] = alpha2
+        
+        # State names beat ISO names and aliases ("Georgia"), not overrides
+        override_keys = {normalize_key(name) for name in self.overrides}
+        self.state_keys = {normalize_key(name) for name in US_STATES} - override_keys
+        for key in self.state_keys:
+            self.keys.pop(key, None)
+        
+        exact_keys = {normalize_key(name) for name in exact_only}
+        self.tree = BKTree(
+            key for key in (*self.keys, *self.state_keys)
+            if len(key) >= FUZZY_MIN_LENGTH and key not in exact_keys
+        )
+        self._memo = {}
+        
+        self.fuzzy_hits = {}
+        self.fuzzy_matches = 0
+        self.us_states = 0
+        self.unmapped = 0
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def lookup(self, country: str | None) -> str | None:
+        """
+        Resolve a raw country value to ISO 3166-1 alpha-2.
+        
+        Returns None if empty or unmappable.
+        """
+        if not country:
+            return None
+        
+        country = country.strip()
+        if country in self._memo:
+            return self._memo[country]
+        
+        result = self._resolve(country)
+        self._memo[country] = result
+        return result
+    
+    def _resolve(self, country: str) -> str | None:
+        if country in self.overrides:
+            return self.overrides[country]
+        
+        key = normalize_key(country)
+        if key in self.state_keys:
+            self.us_states += 1
+            self.unmapped += 1
+            return None
+        if key in self.keys:
+            return self.keys[key]
+        
+        # Already ISO code?
+        if len(country) == 2 and country.isupper():
+            return country
+        if len(country) == 3 and country.isupper() and country in self.alpha3:
+            return self.alpha3[country]
+        
+        match, matched_key = self.fuzzy_lookup(key)
+        if match:
+            self.fuzzy_matches += 1
+            self.fuzzy_hits[country] = (match, matched_key)
+        else:
+            self.unmapped += 1
+        return match
+    
+    def is_fuzzy(self, country: str | None) -> bool:
+        """Whether lookup(country) was resolved by the fuzzy fallback."""
+        return bool(country) and country.strip() in self.fuzzy_hits
+    
+    def fuzzy_lookup(self, key: str) -> tuple[str | None, str | None]:
+        """
+        Closest-key match for a normalized key.
+        
+        Returns:
+            (alpha-2, matched key), or (None, None) if no key is close
+            enough, the closest keys disagree, or one is a US state
+        """
+        max_distance = fuzzy_distance(key)
+        if max_distance == 0:
+            return None, None
+        
+        matches = self.tree.search(key, max_distance)
+        if not matches:
+            return None, None
+        
+        best = matches[0][0]
+        closest = [word for distance, word in matches if distance == best]
+        codes = {self.keys.get(word, US_STATE) for word in closest}
+        if len(codes) != 1 or US_STATE in codes:
+            return None, None
+        return codes.pop(), closest[0]
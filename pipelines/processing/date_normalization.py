@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Flight Log Date Normalization
+
+FL-3 date parsing shared by extract_flight_logs.py (validation),
+transform_flight_logs_l1.py and validation/quality_audit_l0.py.
+
+- Flight log dates are M/D/YYYY strings; ~5,000 passenger rows collapse to
+  a few hundred distinct values, so parses are memoized in a bounded LRU
+  cache instead of running strptime on every row
+- date_cache_stats() exposes hit/miss counters for stats output
+
+Usage:
+    from date_normalization import parse_flight_date, normalize_date, date_cache_stats
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+# Distinct date strings kept; the full corpus needs well under 1,000
+DATE_CACHE_SIZE = 4096
+
+FLIGHT_DATE_FORMAT = "%m/%d/%Y"
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_flight_date(date_str: str | None) -> date | None:
+    """
+    Parse an M/D/YYYY flight log date (surrounding whitespace ignored).
+    
+    Returns None if the value is empty or not a valid calendar date.
+    """
+    if not date_str:
+        return None
+    
+    try:
+        return datetime.strptime(date_str.strip(), FLIGHT_DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def normalize_date(date_str: str | None) -> str | None:
+    """
+    Convert M/D/YYYY to ISO 8601 (YYYY-MM-DD).
+    
+    Returns None if parsing fails.
+    """
+    parsed = parse_flight_date(date_str)
+    return parsed.strftime("%Y-%m-%d") if parsed else None
+
+
+def date_cache_stats() -> dict:
+    """
+    Hit/miss counters for the shared date cache (since process start or the
+    last reset_date_cache()).
+    
+    Returns:
+        dict: hits, misses, size, maxsize, hit_rate (0-1)
+    """
+    info = parse_flight_date.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def reset_date_cache() -> None:
+    """Empty the cache and zero its counters."""
+    parse_flight_date.cache_clear()
@@ -12,10 +12,16 @@ Origin: Bradley Edwards court exhibits (Epstein v. Edwards, Case No. 50 2009 CA
 Usage:
     python pipelines/processing/extract_flight_logs.py
     python pipelines/processing/extract_flight_logs.py --verify-only
+    python pipelines/processing/extract_flight_logs.py --workers 8
+    python pipelines/processing/extract_flight_logs.py --no-cache
 
 Output:
     data/layer-0-canonical/flight-logs.csv
 
+Cache:
+    data/cache/flight-log-pages/<pdf sha256>/<settings>/page-NNNNN.json
+    Raw per-page tables, reused whenever the PDF and extractor settings match.
+
 Dependencies:
     pip install pdfplumber
 
@@ -26,14 +32,27 @@ Date: 2026-02-01
 import argparse
 import csv
 import hashlib
+import json
+import os
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 
+from date_normalization import parse_flight_date
+from file_hashing import HASH_CACHE_PATH, compute_file_hash, compute_file_hashes
+
 # Resolve paths relative to repo root
 REPO_ROOT = Path(__file__).resolve().parents[2]
 INPUT_PDF = REPO_ROOT / "data" / "raw" / "epstein-flight-logs-unredacted.pdf"
 OUTPUT_CSV = REPO_ROOT / "data" / "layer-0-canonical" / "flight-logs.csv"
+PAGE_CACHE_DIR = REPO_ROOT / "data" / "cache" / "flight-log-pages"
+
+# pdfplumber table settings passed to page.extract_tables(). Empty means
+# pdfplumber defaults. Part of the page cache key.
+TABLE_SETTINGS: dict = {}
 
 # Expected schema (22 columns)
 # AI NOTE: This list defines the contract with downstream consumers. Changes here
@@ -65,21 +84,257 @@ EXPECTED_COLUMNS = [
 ]
 
 
-def compute_file_hash(filepath: Path) -> str:
-    """Compute SHA-256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+def clean_row(row: list) -> list[str]:
+    """Normalize a raw pdfplumber row: None -> "", embedded newlines -> spaces."""
+    return [
+        (c.replace("\n", " ").strip() if c else "")
+        for c in row
+    ]
 
 
-def extract_tables_from_pdf(pdf_path: Path) -> tuple[list[str], list[list[str]]]:
+def clean_page_tables(raw_tables: list) -> list[list[tuple[int, list[str]]]]:
     """
-    Extract tabular data from PDF using pdfplumber.
+    Clean the raw tables of a single PDF page.
     
     Returns:
-        tuple: (header_row, data_rows)
+        list: One entry per table, each a list of (row_index, cleaned_row).
+        Empty rows are dropped, but row_index keeps the row's original
+        position in the table because header detection depends on it.
+    """
+    page_tables = []
+    
+    for table in raw_tables:
+        rows = []
+        for j, row in enumerate(table):
+            if not row or not any(row):
+                continue
+            rows.append((j, clean_row(row)))
+        page_tables.append(rows)
+    
+    return page_tables
+
+
+def extract_page_tables(page) -> list:
+    """Run pdfplumber table extraction on one page (raw cells, None preserved)."""
+    return page.extract_tables(TABLE_SETTINGS) or []
+
+
+# =============================================================================
+# Page Cache
+# =============================================================================
+
+# AI NOTE: The cache stores *raw* pdfplumber output, before clean_row() and
+# header handling. Changes to cleaning or header-skip rules therefore reuse
+# the cache; only a different PDF, pdfplumber version, or TABLE_SETTINGS
+# produce a new cache key.
+
+def extractor_settings_key() -> str:
+    """Short digest of everything besides the PDF that affects extract_tables()."""
+    import pdfplumber
+    
+    settings = {
+        "pdfplumber": pdfplumber.__version__,
+        "table_settings": TABLE_SETTINGS,
+    }
+    encoded = json.dumps(settings, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def page_cache_dir(cache_root: Path, pdf_hash: str) -> Path:
+    """Cache directory for one PDF (by SHA-256) and extractor settings."""
+    return cache_root / pdf_hash / extractor_settings_key()
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write JSON via a temp file so readers never see a partial entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _cached_page_path(cache_dir: Path, page_index: int) -> Path:
+    return cache_dir / f"page-{page_index:05d}.json"
+
+
+def load_cached_page_count(cache_dir: Path) -> int | None:
+    """Return the page count recorded for a cached PDF, if any."""
+    manifest = cache_dir / "manifest.json"
+    if not manifest.exists():
+        return None
+    with open(manifest, "r", encoding="utf-8") as f:
+        return json.load(f)["total_pages"]
+
+
+def _count_pages(pdf_path: Path) -> int:
+    import pdfplumber
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+def _extract_page_list(pdf_path: Path, page_indices: list[int]) -> list:
+    """
+    Worker entry point for --workers mode: extract the given pages.
+    
+    Each worker opens its own pdfplumber handle; page objects cannot be
+    pickled across process boundaries.
+    """
+    import pdfplumber
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        return [extract_page_tables(pdf.pages[i]) for i in page_indices]
+
+
+def _extract_pages(
+    pdf_path: Path, page_indices: list[int], total_pages: int, workers: int
+) -> Iterator[tuple[int, list]]:
+    """
+    Yield (page_index, raw_tables) for page_indices, in ascending order.
+    
+    With workers > 1 the page list is split into contiguous chunks that are
+    extracted in a process pool. Executor.map returns results in submission
+    order, so callers see exactly the same sequence as the serial path.
+    """
+    if not page_indices:
+        return
+    
+    if workers <= 1:
+        import pdfplumber
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            for i in page_indices:
+                if (i + 1) % 20 == 0:
+                    print(f"  Page {i + 1}/{total_pages}")
+                yield i, extract_page_tables(pdf.pages[i])
+        return
+    
+    # Several chunks per worker keeps the pool busy when page density varies
+    chunk_size = max(1, -(-len(page_indices) // (workers * 4)))
+    chunks = [
+        page_indices[k:k + chunk_size]
+        for k in range(0, len(page_indices), chunk_size)
+    ]
+    
+    print(f"  Using {workers} workers ({len(chunks)} page ranges)")
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_extract_page_list, repeat(pdf_path), chunks)
+        for chunk, chunk_tables in zip(chunks, results):
+            print(f"  Pages {chunk[0] + 1}-{chunk[-1] + 1}/{total_pages}")
+            yield from zip(chunk, chunk_tables)
+
+
+def iter_page_tables(
+    pdf_path: Path,
+    workers: int = 1,
+    cache_root: Path | None = None,
+    pdf_hash: str | None = None,
+) -> Iterator[tuple[int, list]]:
+    """
+    Yield (page_index, raw_tables) for every page, always in page order.
+    
+    When cache_root and pdf_hash are given, pages already in the cache are
+    read from disk and only missing pages go through pdfplumber. Freshly
+    extracted pages are written back to the cache.
+    """
+    cache_dir = None
+    total_pages = None
+    if cache_root is not None and pdf_hash is not None:
+        cache_dir = page_cache_dir(cache_root, pdf_hash)
+        total_pages = load_cached_page_count(cache_dir)
+    
+    if total_pages is None:
+        total_pages = _count_pages(pdf_path)
+        if cache_dir is not None:
+            _write_json_atomic(cache_dir / "manifest.json", {"total_pages": total_pages})
+    
+    print(f"Processing {total_pages} pages...")
+    
+    if cache_dir is not None:
+        missing = [
+            i for i in range(total_pages)
+            if not _cached_page_path(cache_dir, i).exists()
+        ]
+        print(f"  Page cache: {total_pages - len(missing)} cached, {len(missing)} to extract")
+    else:
+        missing = list(range(total_pages))
+    
+    missing_set = set(missing)
+    fresh = _extract_pages(pdf_path, missing, total_pages, workers)
+    
+    for i in range(total_pages):
+        if i in missing_set:
+            page_index, raw_tables = next(fresh)
+            assert page_index == i
+            if cache_dir is not None:
+                _write_json_atomic(_cached_page_path(cache_dir, i), raw_tables)
+        else:
+            with open(_cached_page_path(cache_dir, i), "r", encoding="utf-8") as f:
+                raw_tables = json.load(f)
+        yield i, raw_tables
+
+
+def _split_page_rows(
+    page_index: int, raw_tables: list, header: list[str] | None
+) -> tuple[list[str] | None, list[list[str]]]:
+    """
+    Apply header detection and repeated-header skipping to one page.
+    
+    Returns:
+        tuple: (header, data_rows) where header is the input header, or the
+        header found on this page if none was known yet
+    """
+    data_rows = []
+    
+    for table in clean_page_tables(raw_tables):
+        for j, cleaned in table:
+            # First row of first page is header
+            if header is None and page_index == 0 and j == 0:
+                header = cleaned
+                # AI NOTE: The PDF renderer sometimes doubles the "ID" column
+                # header as "IIDD". This is a known artifact of pdfplumber's
+                # text extraction on this specific document. Do not remove
+                # this fix without re-testing extraction.
+                if header[0] == "IIDD":
+                    header[0] = "ID"
+            else:
+                # AI NOTE: The PDF contains repeated header rows on each page.
+                # We detect and skip these by checking if the first column
+                # contains the header text. This assumes "ID"/"IIDD" never
+                # appears as a valid data value in column 0.
+                if cleaned[0] not in ("ID", "IIDD"):
+                    data_rows.append(cleaned)
+    
+    return header, data_rows
+
+
+def extract_rows_from_pdf(
+    pdf_path: Path,
+    workers: int = 1,
+    cache_root: Path | None = None,
+    pdf_hash: str | None = None,
+) -> tuple[list[str], Iterator[list[str]]]:
+    """
+    Extract tabular data from PDF as a lazily evaluated row stream.
+    
+    Only the first page is processed up front (to find the header); the
+    remaining pages are extracted as the returned iterator is consumed, so
+    memory stays flat regardless of document size.
+    
+    Args:
+        pdf_path: Source PDF
+        workers: Number of extraction processes (1 = serial)
+        cache_root: Page cache directory (None disables the cache)
+        pdf_hash: SHA-256 of pdf_path, used as the page cache key
+    
+    Returns:
+        tuple: (header_row, data_row_iterator)
     """
     try:
         import pdfplumber
@@ -87,138 +342,230 @@ def extract_tables_from_pdf(pdf_path: Path) -> tuple[list[str], list[list[str]]]
         print("ERROR: pdfplumber not installed. Run: pip install pdfplumber")
         sys.exit(1)
     
-    all_rows = []
-    header = None
-    
     print(f"Opening PDF: {pdf_path}")
     
-    with pdfplumber.open(pdf_path) as pdf:
-        total_pages = len(pdf.pages)
-        print(f"Processing {total_pages} pages...")
-        
-        for i, page in enumerate(pdf.pages):
-            if (i + 1) % 20 == 0:
-                print(f"  Page {i + 1}/{total_pages}")
-            
-            tables = page.extract_tables()
-            if not tables:
-                continue
-                
-            for table in tables:
-                for j, row in enumerate(table):
-                    if not row or not any(row):
-                        continue
-                    
-                    # Clean cell values
-                    cleaned = [
-                        (c.replace("\n", " ").strip() if c else "")
-                        for c in row
-                    ]
-                    
-                    # First row of first page is header
-                    if header is None and i == 0 and j == 0:
-                        header = cleaned
-                        # AI NOTE: The PDF renderer sometimes doubles the "ID" column
-                        # header as "IIDD". This is a known artifact of pdfplumber's
-                        # text extraction on this specific document. Do not remove
-                        # this fix without re-testing extraction.
-                        if header[0] == "IIDD":
-                            header[0] = "ID"
-                    else:
-                        # AI NOTE: The PDF contains repeated header rows on each page.
-                        # We detect and skip these by checking if the first column
-                        # contains the header text. This assumes "ID"/"IIDD" never
-                        # appears as a valid data value in column 0.
-                        if cleaned[0] not in ("ID", "IIDD"):
-                            all_rows.append(cleaned)
-    
-    print(f"Extracted {len(all_rows)} data rows")
+    pages = iter_page_tables(pdf_path, workers, cache_root, pdf_hash)
+    
+    header = None
+    first_page_rows = []
+    for i, raw_tables in pages:
+        header, first_page_rows = _split_page_rows(i, raw_tables, header)
+        break
     
     # Guard against empty PDF (no header found)
     if header is None:
         print("ERROR: No header row found in PDF")
         sys.exit(1)
     
-    return header, all_rows
+    def iter_rows() -> Iterator[list[str]]:
+        count = len(first_page_rows)
+        yield from first_page_rows
+        for i, raw_tables in pages:
+            _, page_rows = _split_page_rows(i, raw_tables, header)
+            count += len(page_rows)
+            yield from page_rows
+        print(f"Extracted {count} data rows")
+    
+    return header, iter_rows()
 
 
-def validate_extraction(header: list[str], rows: list[list[str]]) -> dict:
+def extract_tables_from_pdf(
+    pdf_path: Path,
+    workers: int = 1,
+    cache_root: Path | None = None,
+    pdf_hash: str | None = None,
+) -> tuple[list[str], list[list[str]]]:
     """
-    Validate extracted data against expected schema.
+    Extract tabular data from PDF using pdfplumber.
+    
+    Materialized form of extract_rows_from_pdf(); see there for arguments.
     
     Returns:
-        dict: Validation results with pass/fail and metrics
+        tuple: (header_row, data_rows)
     """
-    results = {
-        "passed": True,
-        "errors": [],
-        "warnings": [],
-        "metrics": {},
-    }
+    header, rows = extract_rows_from_pdf(pdf_path, workers, cache_root, pdf_hash)
+    return header, list(rows)
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+class ExtractionValidator:
+    """
+    Incremental validator for streamed extraction rows.
     
-    # Check header columns
-    if len(header) != len(EXPECTED_COLUMNS):
-        results["errors"].append(
-            f"Column count mismatch: got {len(header)}, expected {len(EXPECTED_COLUMNS)}"
-        )
-        results["passed"] = False
+    Feed rows one at a time with add(); finish() returns the validation
+    results dict. All metrics are accumulated in the same single pass; only
+    counters, distinct-value sets and the running date range are kept, never
+    the rows themselves. Used for both post-extraction checks and
+    --verify-only.
+    """
     
-    for i, (got, expected) in enumerate(zip(header, EXPECTED_COLUMNS)):
-        if got != expected:
-            results["errors"].append(
-                f"Column {i} mismatch: got '{got}', expected '{expected}'"
+    def __init__(self, header: list[str]):
+        self.header = header
+        self.errors = []
+        self.total_rows = 0
+        self.bad_rows = 0
+        self.flights = set()
+        self.dates = set()
+        self.passengers = set()
+        self.known = 0
+        self.unknown = 0
+        self.min_date = None
+        self.max_date = None
+        
+        # Check header columns
+        if len(header) != len(EXPECTED_COLUMNS):
+            self.errors.append(
+                f"Column count mismatch: got {len(header)}, expected {len(EXPECTED_COLUMNS)}"
             )
+        
+        for i, (got, expected) in enumerate(zip(header, EXPECTED_COLUMNS)):
+            if got != expected:
+                self.errors.append(
+                    f"Column {i} mismatch: got '{got}', expected '{expected}'"
+                )
+    
+    def add(self, row: list[str]) -> None:
+        """Account for one data row."""
+        self.total_rows += 1
+        
+        # Check row consistency
+        if len(row) != len(self.header):
+            self.bad_rows += 1
+            # Too short to index the metric columns; already reported above
+            if len(row) < len(EXPECTED_COLUMNS):
+                return
+        
+        if row[11]:  # Flight_No.
+            self.flights.add(row[11])
+        if row[1] and row[1] not in self.dates:  # Date
+            self.dates.add(row[1])
+            # Only a few hundred distinct date strings exist, so each one is
+            # parsed once when first seen instead of once per row
+            self._update_date_range(row[1])
+        if row[17]:  # First Last
+            self.passengers.add(row[17])
+        if row[20] == "Yes":  # Known
+            self.known += 1
+        elif row[20] == "No":
+            self.unknown += 1
+    
+    def _update_date_range(self, date_str: str) -> None:
+        """Extend the running date range with a newly seen date string."""
+        if "/" not in date_str:
+            return
+        date_obj = parse_flight_date(date_str)
+        if date_obj is None:
+            raise ValueError(f"Unparseable flight date: {date_str!r}")
+        if self.min_date is None or date_obj < self.min_date:
+            self.min_date = date_obj
+        if self.max_date is None or date_obj > self.max_date:
+            self.max_date = date_obj
+    
+    def finish(self) -> dict:
+        """
+        Build the validation results from everything seen so far.
+        
+        Returns:
+            dict: Validation results with pass/fail and metrics
+        """
+        results = {
+            "passed": True,
+            "errors": list(self.errors),
+            "warnings": [],
+            "metrics": {},
+        }
+        
+        if self.bad_rows > 0:
+            results["errors"].append(f"{self.bad_rows} rows have inconsistent column count")
+        
+        if results["errors"]:
             results["passed"] = False
-    
-    # Check row consistency
-    bad_rows = sum(1 for r in rows if len(r) != len(header))
-    if bad_rows > 0:
-        results["errors"].append(f"{bad_rows} rows have inconsistent column count")
-        results["passed"] = False
-    
-    # Compute metrics
-    results["metrics"]["total_rows"] = len(rows)
-    results["metrics"]["unique_flights"] = len(set(r[11] for r in rows if r[11]))  # Flight_No.
-    results["metrics"]["unique_dates"] = len(set(r[1] for r in rows if r[1]))  # Date
-    results["metrics"]["unique_passengers"] = len(set(r[17] for r in rows if r[17]))  # First Last
-    results["metrics"]["known_passengers"] = sum(1 for r in rows if r[20] == "Yes")  # Known
-    results["metrics"]["unknown_passengers"] = sum(1 for r in rows if r[20] == "No")
-    
-    # Date range
-    dates = [r[1] for r in rows if r[1] and "/" in r[1]]
-    if dates:
-        date_objects = [datetime.strptime(d, "%m/%d/%Y") for d in dates]
-        results["metrics"]["date_range"] = f"{min(date_objects).strftime('%m/%d/%Y')} to {max(date_objects).strftime('%m/%d/%Y')}"
-    
-    # Sanity checks
-    if results["metrics"]["total_rows"] < 4000:
-        results["warnings"].append(
-            f"Row count ({results['metrics']['total_rows']}) lower than expected (~5000)"
+        
+        # Compute metrics
+        results["metrics"]["total_rows"] = self.total_rows
+        results["metrics"]["unique_flights"] = len(self.flights)
+        results["metrics"]["unique_dates"] = len(self.dates)
+        results["metrics"]["unique_passengers"] = len(self.passengers)
+        results["metrics"]["known_passengers"] = self.known
+        results["metrics"]["unknown_passengers"] = self.unknown
+        
+        if self.min_date is not None:
+            results["metrics"]["date_range"] = f"{self.min_date.strftime('%m/%d/%Y')} to {self.max_date.strftime('%m/%d/%Y')}"
+        
+        # Sanity checks
+        if results["metrics"]["total_rows"] < 4000:
+            results["warnings"].append(
+                f"Row count ({results['metrics']['total_rows']}) lower than expected (~5000)"
+            )
+        
+        known_pct = (
+            results["metrics"]["known_passengers"] / results["metrics"]["total_rows"] * 100
+            if results["metrics"]["total_rows"] > 0
+            else 0
         )
+        if known_pct < 75:
+            results["warnings"].append(
+                f"Known passenger percentage ({known_pct:.1f}%) lower than expected (~82%)"
+            )
+        
+        return results
+
+
+def validate_extraction(header: list[str], rows: Iterable[list[str]]) -> dict:
+    """
+    Validate extracted data against expected schema.
     
-    known_pct = (
-        results["metrics"]["known_passengers"] / results["metrics"]["total_rows"] * 100
-        if results["metrics"]["total_rows"] > 0
-        else 0
-    )
-    if known_pct < 75:
-        results["warnings"].append(
-            f"Known passenger percentage ({known_pct:.1f}%) lower than expected (~82%)"
-        )
+    Single pass over rows via ExtractionValidator, so rows may be any
+    iterable (e.g. a csv.reader) and are never materialized.
     
-    return results
+    Returns:
+        dict: Validation results with pass/fail and metrics
+    """
+    validator = ExtractionValidator(header)
+    for row in rows:
+        validator.add(row)
+    return validator.finish()
 
 
-def write_csv(header: list[str], rows: list[list[str]], output_path: Path) -> None:
-    """Write extracted data to CSV."""
+def write_csv_streaming(
+    header: list[str],
+    rows: Iterator[list[str]],
+    output_path: Path,
+    validator: ExtractionValidator,
+) -> dict:
+    """
+    Validate and write rows in a single streaming pass.
+    
+    Rows go to a temp file next to output_path while the validator watches
+    them. The temp file atomically replaces output_path only if validation
+    passes, so a failed run never leaves a partial or invalid CSV behind.
+    
+    Returns:
+        dict: Validation results from validator.finish()
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
     
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(header)
-        writer.writerows(rows)
+    try:
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for row in rows:
+                validator.add(row)
+                writer.writerow(row)
+        
+        results = validator.finish()
+        if results["passed"]:
+            os.replace(tmp_path, output_path)
+            print(f"Wrote {validator.total_rows} rows to {output_path}")
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
     
-    print(f"Wrote {len(rows)} rows to {output_path}")
+    return results
 
 
 def print_validation_report(results: dict) -> None:
@@ -268,8 +615,33 @@ def main():
         default=OUTPUT_CSV,
         help=f"Output CSV path (default: {OUTPUT_CSV})",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Extract page ranges in N parallel processes (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=PAGE_CACHE_DIR,
+        help=f"Per-page extraction cache (default: {PAGE_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-extract every page with pdfplumber",
+    )
+    parser.add_argument(
+        "--rehash",
+        action="store_true",
+        help=f"Ignore cached SHA-256 digests in {HASH_CACHE_PATH.name} and re-read files",
+    )
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
     print("Flight Logs Extraction Script")
     print(f"Run time: {datetime.now().isoformat()}")
     print()
@@ -279,8 +651,14 @@ def main():
         print(f"ERROR: Input PDF not found: {args.input}")
         sys.exit(1)
     
-    # Compute input hash for provenance
-    input_hash = compute_file_hash(args.input)
+    # Compute input hash for provenance (and the output hash alongside it
+    # when verifying, so both files are read concurrently)
+    hash_cache = None if args.rehash else HASH_CACHE_PATH
+    hash_paths = [args.input]
+    if args.verify_only and args.output.exists():
+        hash_paths.append(args.output)
+    hashes = compute_file_hashes(hash_paths, cache_path=hash_cache)
+    input_hash = hashes[args.input]
     print(f"Input: {args.input}")
     print(f"SHA-256: {input_hash}")
     print()
@@ -295,32 +673,30 @@ def main():
         with open(args.output, "r", encoding="utf-8") as f:
             reader = csv.reader(f)
             header = next(reader)
-            rows = list(reader)
+            results = validate_extraction(header, reader)
         
-        results = validate_extraction(header, rows)
         print_validation_report(results)
         
-        output_hash = compute_file_hash(args.output)
-        print(f"\nOutput SHA-256: {output_hash}")
+        print(f"\nOutput SHA-256: {hashes[args.output]}")
         
         sys.exit(0 if results["passed"] else 1)
     
-    # Extract from PDF
-    header, rows = extract_tables_from_pdf(args.input)
-    
-    # Validate extraction
-    results = validate_extraction(header, rows)
+    # Extract, validate and write in one streaming pass
+    header, rows = extract_rows_from_pdf(
+        args.input,
+        workers=args.workers,
+        cache_root=None if args.no_cache else args.cache_dir,
+        pdf_hash=input_hash,
+    )
+    results = write_csv_streaming(header, rows, args.output, ExtractionValidator(header))
     print_validation_report(results)
     
     if not results["passed"]:
         print("\nExtraction failed validation. Not writing output.")
         sys.exit(1)
     
-    # Write output
-    write_csv(header, rows, args.output)
-    
     # Final verification
-    output_hash = compute_file_hash(args.output)
+    output_hash = compute_file_hash(args.output, cache_path=hash_cache)
     print(f"\nOutput SHA-256: {output_hash}")
     print("\nExtraction complete.")
 
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+File Hashing Helpers
+
+SHA-256 provenance checksums shared by the L0 processing scripts
+(extract_flight_logs.py, normalize_black_book.py).
+
+- Files are memory-mapped and hashed in large windows instead of 8 KiB
+  read() chunks, which matters for multi-GB raw PDF dumps
+- Digests are cached in a sidecar JSON file keyed by (path, size, mtime_ns),
+  so unchanged inputs are not re-hashed on every run and every --verify-only
+- compute_file_hashes() hashes several files concurrently; hashlib releases
+  the GIL while digesting large buffers, so threads are sufficient
+
+Usage:
+    from file_hashing import compute_file_hash, compute_file_hashes
+
+Cache:
+    data/cache/file-hashes.json
+
+Author: Epstein Files ARD Project
+Date: 2026-10-16
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Resolve paths relative to repo root
+REPO_ROOT = Path(__file__).resolve().parents[2]
+HASH_CACHE_PATH = REPO_ROOT / "data" / "cache" / "file-hashes.json"
+
+# Bytes handed to sha256.update() per call
+HASH_WINDOW = 64 * 1024 * 1024
+
+
+def sha256_file(filepath: Path) -> str:
+    """Compute SHA-256 of a file via mmap, bypassing the cache."""
+    sha256 = hashlib.sha256()
+    
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # mmap cannot map empty files
+        if size == 0:
+            return sha256.hexdigest()
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                for offset in range(0, size, HASH_WINDOW):
+                    sha256.update(view[offset:offset + HASH_WINDOW])
+    
+    return sha256.hexdigest()
+
+
+def _load_cache(cache_path: Path) -> dict:
+    """Load the sidecar digest cache; a missing or corrupt file is an empty cache."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache_path: Path, updates: dict) -> None:
+    """Merge updates into the on-disk cache and write it atomically."""
+    cache = _load_cache(cache_path)
+    cache.update(updates)
+    
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, cache_path)
+
+
+def compute_file_hashes(
+    filepaths: list[Path],
+    cache_path: Path | None = HASH_CACHE_PATH,
+    max_workers: int = 4,
+) -> dict[Path, str]:
+    """
+    Compute SHA-256 hashes for several files, reusing cached digests.
+    
+    AI NOTE: A cache hit requires the same resolved path, byte size and
+    st_mtime_ns. Tools that rewrite a file in place while preserving both
+    would defeat this check; pass cache_path=None (--rehash on the CLI) when
+    a from-scratch provenance check is required.
+    
+    Args:
+        filepaths: Files to hash
+        cache_path: Sidecar cache file (None disables the cache)
+        max_workers: Files hashed concurrently on a cache miss
+    
+    Returns:
+        dict: Input path -> hex digest
+    """
+    cache = _load_cache(cache_path) if cache_path is not None else {}
+    
+    digests = {}
+    stats = {}
+    misses = []
+    
+    for filepath in filepaths:
+        resolved = Path(filepath).resolve()
+        stat = resolved.stat()
+        stats[filepath] = (str(resolved), stat.st_size, stat.st_mtime_ns)
+        
+        entry = cache.get(str(resolved))
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            digests[filepath] = entry["sha256"]
+        else:
+            misses.append(filepath)
+    
+    if not misses:
+        return digests
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(misses)))) as executor:
+        for filepath, digest in zip(misses, executor.map(sha256_file, misses)):
+            digests[filepath] = digest
+    
+    if cache_path is not None:
+        updates = {}
+        for filepath in misses:
+            key, size, mtime_ns = stats[filepath]
+            updates[key] = {"size": size, "mtime_ns": mtime_ns, "sha256": digests[filepath]}
+        _save_cache(cache_path, updates)
+    
+    return digests
+
+
+def compute_file_hash(filepath: Path, cache_path: Path | None = HASH_CACHE_PATH) -> str:
+    """Compute SHA-256 hash of a file, reusing the cached digest if unchanged."""
+    return compute_file_hashes([filepath], cache_path)[filepath]
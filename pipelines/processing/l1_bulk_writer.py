@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+L1 Bulk Writer
+
+Binary COPY writer shared by the L1 transforms (transform_flight_logs_l1.py,
+transform_black_book_l1.py, build_identity_mentions.py).
+
+- Rows are streamed from any iterable straight into COPY ... FROM STDIN
+  (FORMAT BINARY); nothing is materialized beyond what the caller holds
+- Column types are read from the target table, so the binary encoding always
+  matches the DDL (UUID, NUMERIC, DATE are coerced from the str/float values
+  the transforms produce)
+- Optional ON CONFLICT merge: rows are COPYed into a temp table shaped like
+  the target, then merged with one INSERT ... SELECT ... ON CONFLICT
+
+Usage:
+    from l1_bulk_writer import copy_rows
+    
+    copy_rows(cur, "l1.contacts", contact_cols, rows)
+    copy_rows(cur, "l1.flight_events", flight_cols, rows, conflict_key="flight_id")
+
+Requirements:
+    pip install psycopg[binary]
+"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+from psycopg.postgres import types as pg_types
+
+
+def _to_uuid(value):
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _to_decimal(value):
+    # str() first so 0.7 becomes Decimal("0.7"), not its binary expansion
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _to_date(value):
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _to_int(value):
+    return value if isinstance(value, int) else int(value)
+
+
+def _to_str(value):
+    return value if isinstance(value, str) else str(value)
+
+
+# AI NOTE: Binary COPY dumpers are chosen by column OID, not by Python type,
+# and do not convert: a str UUID or a float NUMERIC raises mid-COPY. Types not
+# listed here (bool, timestamps, ...) are passed through unchanged.
+COERCERS = {
+    pg_types["uuid"].oid: _to_uuid,
+    pg_types["numeric"].oid: _to_decimal,
+    pg_types["date"].oid: _to_date,
+    pg_types["int2"].oid: _to_int,
+    pg_types["int4"].oid: _to_int,
+    pg_types["int8"].oid: _to_int,
+    pg_types["text"].oid: _to_str,
+    pg_types["varchar"].oid: _to_str,
+    pg_types["bpchar"].oid: _to_str,
+}
+
+
+def column_oids(cur, table: str, columns: list[str]) -> list[int]:
+    """Look up the type OIDs of `columns` in `table` (zero-row query)."""
+    cur.execute(f"SELECT {', '.join(columns)} FROM {table} LIMIT 0")
+    return [desc.type_code for desc in cur.description]
+
+
+def on_conflict_clause(conflict_key: str, columns: list[str], update: bool = True) -> str:
+    """ON CONFLICT clause that overwrites every non-key column (or skips)."""
+    assignments = ", ".join(f"{col} = EXCLUDED.{col}" for col in columns if col != conflict_key)
+    if not update or not assignments:
+        return f"ON CONFLICT ({conflict_key}) DO NOTHING"
+    return f"ON CONFLICT ({conflict_key}) DO UPDATE SET {assignments}"
+
+
+def _copy_binary(cur, table: str, columns: list[str], oids: list[int], rows: Iterable) -> int:
+    """COPY rows into table in binary format; returns rows written."""
+    coercers = [COERCERS.get(oid) for oid in oids]
+    count = 0
+    
+    with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN (FORMAT BINARY)") as copy:
+        copy.set_types(oids)
+        for row in rows:
+            copy.write_row([
+                value if value is None or coerce is None else coerce(value)
+                for value, coerce in zip(row, coercers)
+            ])
+            count += 1
+    
+    return count
+
+
+def copy_rows(
+    cur,
+    table: str,
+    columns: list[str],
+    rows: Iterable,
+    conflict_key: str | None = None,
+    update: bool = True,
+) -> int:
+    """
+    Write rows to an L1 table with binary COPY.
+    
+    Runs inside the caller's transaction; the caller commits.
+    
+    Args:
+        cur: psycopg cursor
+        table: Schema-qualified target table (e.g. "l1.contacts")
+        columns: Target columns, in the order values appear in each row
+        rows: Iterable of sequences (tuples/lists) aligned with columns
+        conflict_key: If set, merge on this unique column instead of a plain
+            COPY (rows are staged in a temp table first)
+        update: With conflict_key, overwrite existing rows (True) or keep
+            them (False, DO NOTHING)
+    
+    Returns:
+        int: Rows written to COPY (before conflict resolution)
+    """
+    oids = column_oids(cur, table, columns)
+    
+    if conflict_key is None:
+        return _copy_binary(cur, table, columns, oids, rows)
+    
+    # Unique name so concurrent/nested merges in one session never collide
+    staging = f"_l1_merge_{uuid.uuid4().hex[:12]}"
+    cur.execute(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+    
+    count = _copy_binary(cur, staging, columns, oids, rows)
+    
+    col_list = ", ".join(columns)
+    cur.execute(f"""
+        INSERT INTO {table} ({col_list})
+        SELECT {col_list} FROM {staging}
+        {on_conflict_clause(conflict_key, columns, update)}
+    """)
+    cur.execute(f"DROP TABLE {staging}")
+    
+    return count
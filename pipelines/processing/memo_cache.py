@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Memo Cache
+
+Bounded in-memory LRU with optional SQLite backing, shared by the L1
+transforms for expensive per-value work (phone normalization, name parsing).
+
+- In memory: OrderedDict LRU, evicting the least recently used entry once
+  maxsize is reached
+- On disk (optional): one SQLite file can hold several caches, separated by
+  namespace. Each namespace carries a version string (typically the version
+  of the library producing the values); entries written under a different
+  version are treated as misses and overwritten
+- Keys and values must be JSON-serializable (tuples come back as lists, so
+  keep values to dicts/lists/scalars)
+
+Usage:
+    from memo_cache import MemoCache
+    
+    cache = MemoCache(maxsize=50_000, path=CACHE_DIR / "l1-memo.sqlite",
+                      namespace="phone", version=phonenumbers.__version__)
+    value = cache.get_or_compute((raw, region), lambda: parse(raw, region))
+    cache.close()
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+# Returned by get() on a miss (None is a valid cached value)
+MISSING = object()
+
+# Pending disk writes flushed in one transaction once this many accumulate
+FLUSH_EVERY = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class MemoCache:
+    """
+    LRU memo cache with an optional SQLite read-through/write-behind store.
+    
+    Counters: `hits` (memory), `disk_hits` (loaded from SQLite), `misses`
+    (caller had to compute).
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 65536,
+        path: Path | None = None,
+        namespace: str = "default",
+        version: str = "",
+    ):
+        self.maxsize = maxsize
+        self.path = Path(path) if path is not None else None
+        self.namespace = namespace
+        self.version = version
+        
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._db = None
+        
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(SCHEMA)
+            self._db.commit()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @staticmethod
+    def _encode(key) -> str:
+        return json.dumps(key, separators=(",", ":"))
+    
+    def _remember(self, encoded: str, value) -> None:
+        self._entries[encoded] = value
+        self._entries.move_to_end(encoded)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __contains__(self, key) -> bool:
+        """Whether key is cached in memory or on disk (counters untouched)."""
+        encoded = self._encode(key)
+        if encoded in self._entries or encoded in self._pending:
+            return True
+        if self._db is None:
+            return False
+        return self._db.execute(
+            "SELECT 1 FROM memo WHERE namespace = ? AND key = ? AND version = ?",
+            (self.namespace, encoded, self.version),
+        ).fetchone() is not None
+    
+    def get(self, key):
+        """Cached value for key, or MISSING."""
+        encoded = self._encode(key)
+        
+        if encoded in self._entries:
+            self._entries.move_to_end(encoded)
+            self.hits += 1
+            return self._entries[encoded]
+        
+        if self._db is not None:
+            # Evicted from memory before its write was flushed
+            if encoded in self._pending:
+                row = (self._pending[encoded],)
+            else:
+                row = self._db.execute(
+                    "SELECT value FROM memo WHERE namespace = ? AND key = ? AND version = ?",
+                    (self.namespace, encoded, self.version),
+                ).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+                self._remember(encoded, value)
+                self.disk_hits += 1
+                return value
+        
+        self.misses += 1
+        return MISSING
+    
+    def put(self, key, value) -> None:
+        """Store value in memory (and queue it for disk, if backed)."""
+        encoded = self._encode(key)
+        self._remember(encoded, value)
+        
+        if self._db is not None:
+            self._pending[encoded] = json.dumps(value, separators=(",", ":"))
+            if len(self._pending) >= FLUSH_EVERY:
+                self.flush()
+    
+    def get_or_compute(self, key, compute: Callable[[], object]):
+        """Cached value for key, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def flush(self) -> None:
+        """Write queued entries to SQLite."""
+        if self._db is None or not self._pending:
+            return
+        
+        self._db.executemany(
+            "INSERT OR REPLACE INTO memo (namespace, key, version, value) VALUES (?, ?, ?, ?)",
+            [(self.namespace, key, self.version, value) for key, value in self._pending.items()],
+        )
+        self._db.commit()
+        self._pending.clear()
+    
+    def close(self) -> None:
+        """Flush and close the SQLite store (the in-memory cache stays usable)."""
+        if self._db is None:
+            return
+        self.flush()
+        self._db.close()
+        self._db = None
+    
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: hits, disk_hits, misses, size, maxsize, hit_rate (0-1,
+            memory and disk hits over all lookups)
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
@@ -30,6 +30,8 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 
+from file_hashing import HASH_CACHE_PATH, compute_file_hash, compute_file_hashes
+
 # Resolve paths relative to repo root
 REPO_ROOT = Path(__file__).resolve().parents[2]
 INPUT_CSV = REPO_ROOT / "data" / "raw" / "epsteinsblackbook-com" / "black-book-lines.csv"
@@ -61,15 +63,6 @@ SOURCE_COLUMNS = [
 OUTPUT_COLUMNS = ["record_id"] + SOURCE_COLUMNS
 
 
-def compute_file_hash(filepath: Path) -> str:
-    """Compute SHA-256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def load_and_dedupe(csv_path: Path) -> tuple[list[str], list[dict]]:
     """
     Load CSV and remove exact duplicate rows.
@@ -258,6 +251,11 @@ def main():
         default=OUTPUT_CSV,
         help=f"Output CSV path (default: {OUTPUT_CSV})",
     )
+    parser.add_argument(
+        "--rehash",
+        action="store_true",
+        help=f"Ignore cached SHA-256 digests in {HASH_CACHE_PATH.name} and re-read files",
+    )
     args = parser.parse_args()
     
     print("Black Book Normalization Script")
@@ -269,8 +267,14 @@ def main():
         print(f"ERROR: Input CSV not found: {args.input}")
         sys.exit(1)
     
-    # Compute input hash for provenance
-    input_hash = compute_file_hash(args.input)
+    # Compute input hash for provenance (and the output hash alongside it
+    # when verifying, so both files are read concurrently)
+    hash_cache = None if args.rehash else HASH_CACHE_PATH
+    hash_paths = [args.input]
+    if args.verify_only and args.output.exists():
+        hash_paths.append(args.output)
+    hashes = compute_file_hashes(hash_paths, cache_path=hash_cache)
+    input_hash = hashes[args.input]
     print(f"Input: {args.input}")
     print(f"SHA-256: {input_hash}")
     print()
@@ -291,8 +295,7 @@ def main():
         results = validate_data(header, rows)
         print_validation_report(results)
         
-        output_hash = compute_file_hash(args.output)
-        print(f"\nOutput SHA-256: {output_hash}")
+        print(f"\nOutput SHA-256: {hashes[args.output]}")
         
         sys.exit(0 if results["passed"] else 1)
     
@@ -317,7 +320,7 @@ def main():
     write_csv(rows, args.output)
     
     # Final verification
-    output_hash = compute_file_hash(args.output)
+    output_hash = compute_file_hash(args.output, cache_path=hash_cache)
     print(f"\nOutput SHA-256: {output_hash}")
     print("\nNormalization complete.")
 
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Score Entity Resolution Candidate Pairs
+
+Computes name similarity for every pair in l1.mention_candidates (see
+build_mention_candidates.py) from the parsed names on l1.identity_mentions,
+and writes them to l1.mention_candidate_scores:
+
+- first_jaro_winkler / last_jaro_winkler: Jaro-Winkler per name part
+- first_levenshtein / last_levenshtein: normalized Levenshtein per name part
+- name_token_set: token set similarity of the full "first last" names
+  (tolerates swapped and partial names)
+
+Scores are computed in batches by string_similarity.py (rapidfuzz C++
+kernels when installed, pure Python otherwise). Candidates are streamed
+through a server-side cursor and each chunk is bulk-written with one COPY,
+so memory stays bounded however many pairs blocking produced.
+
+Rerun after build_mention_candidates.py.
+
+Usage:
+    python score_mention_candidates.py [--dry-run]
+    python score_mention_candidates.py --chunk-size 500000 --workers 8
+
+Requirements:
+    pip install psycopg[binary] python-dotenv
+    pip install rapidfuzz  # optional, much faster
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import psycopg
+from dotenv import load_dotenv
+
+from l1_bulk_writer import copy_rows
+from string_similarity import RAPIDFUZZ_AVAILABLE, SCORE_COLUMNS, default_backend, score_name_pairs
+
+# Load environment
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+load_dotenv(PROJECT_ROOT / ".env")
+
+# Configuration
+PGSQL_HOST = os.getenv("PGSQL_HOST")
+PGSQL_PORT = os.getenv("PGSQL_PORT", "5432")
+PGSQL_USER = os.getenv("PGSQL_USER")
+PGSQL_PASSWORD = os.getenv("PGSQL_PASSWORD")
+PGSQL_DATABASE = os.getenv("PGSQL_DATABASE")
+
+# Candidate pairs per fetch/score/COPY round trip
+SCORE_CHUNK_SIZE = 200_000
+
+# Score counted as a strong match in the report
+STRONG_MATCH = 0.9
+
+
+def get_connection():
+    """Connect to the project database."""
+    return psycopg.connect(
+        host=PGSQL_HOST,
+        port=PGSQL_PORT,
+        user=PGSQL_USER,
+        password=PGSQL_PASSWORD,
+        dbname=PGSQL_DATABASE
+    )
+
+
+# =============================================================================
+# DDL
+# =============================================================================
+
+# AI NOTE: REAL rather than DECIMAL: scores are only compared against
+# thresholds, and binary COPY takes Python floats for REAL as-is (DECIMAL
+# would cost a Decimal conversion per score). No foreign keys, for the same
+# reason as l1.mention_candidates.
+MENTION_CANDIDATE_SCORES_DDL = """
+CREATE TABLE IF NOT EXISTS l1.mention_candidate_scores (
+    -- Pair from l1.mention_candidates (mention_id_a < mention_id_b)
+    mention_id_a UUID NOT NULL,
+    mention_id_b UUID NOT NULL,
+    
+    -- Similarity 0-1 (see string_similarity.py); NULL where a name part is missing
+    first_jaro_winkler REAL,
+    last_jaro_winkler REAL,
+    first_levenshtein REAL,
+    last_levenshtein REAL,
+    name_token_set REAL,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (mention_id_a, mention_id_b),
+    CHECK (mention_id_a < mention_id_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_mention_candidate_scores_b ON l1.mention_candidate_scores(mention_id_b);
+CREATE INDEX IF NOT EXISTS idx_mention_candidate_scores_token_set ON l1.mention_candidate_scores(name_token_set);
+"""
+
+
+def create_tables(conn):
+    """Create candidate scores table."""
+    print("Creating l1.mention_candidate_scores table...")
+    
+    with conn.cursor() as cur:
+        cur.execute(MENTION_CANDIDATE_SCORES_DDL)
+        print("  Created l1.mention_candidate_scores")
+    
+    conn.commit()
+
+
+# =============================================================================
+# Scoring
+# =============================================================================
+
+def new_stats() -> dict:
+    return {
+        "pairs": 0,
+        "missing_mentions": 0,
+        "score_seconds": 0.0,
+        "columns": {col: {"scored": 0, "total": 0.0, "strong": 0} for col in SCORE_COLUMNS},
+    }
+
+
+def score_chunk(chunk: list[tuple[str, str]], names: dict, stats: dict, workers: int, backend: str) -> list[tuple]:
+    """
+    Score one chunk of (mention_id_a, mention_id_b) pairs.
+    
+    Returns:
+        list: Rows of (mention_id_a, mention_id_b, *SCORE_COLUMNS)
+    """
+    names_a = []
+    names_b = []
+    for a, b in chunk:
+        if a not in names or b not in names:
+            stats["missing_mentions"] += 1
+        names_a.append(names.get(a, (None, None)))
+        names_b.append(names.get(b, (None, None)))
+    
+    t0 = time.perf_counter()
+    scores = score_name_pairs(names_a, names_b, backend=backend, workers=workers)
+    stats["score_seconds"] += time.perf_counter() - t0
+    stats["pairs"] += len(chunk)
+    
+    for col in SCORE_COLUMNS:
+        col_stats = stats["columns"][col]
+        for score in scores[col]:
+            if score is not None:
+                col_stats["scored"] += 1
+                col_stats["total"] += score
+                col_stats["strong"] += score >= STRONG_MATCH
+    
+    return [
+        (a, b, *row_scores)
+        for (a, b), row_scores in zip(chunk, zip(*(scores[col] for col in SCORE_COLUMNS)))
+    ]
+
+
+def print_report(stats: dict, backend: str):
+    """Print throughput and per-score coverage."""
+    pairs = stats["pairs"]
+    seconds = stats["score_seconds"]
+    
+    print(f"\n  Scored {pairs:,} candidate pairs with the {backend} backend")
+    if seconds:
+        print(f"    Scoring time:            {seconds:.2f}s ({pairs / seconds:,.0f} pairs/s)")
+    
+    if stats["missing_mentions"]:
+        print(f"  ⚠ {stats['missing_mentions']:,} pairs reference mentions no longer in l1.identity_mentions "
+              f"(rerun build_mention_candidates.py)")
+    
+    print(f"\n    {'Score':<20} {'Scored':>12} {'Mean':>8} {f'>= {STRONG_MATCH}':>12}")
+    for col, s in stats["columns"].items():
+        mean = s["total"] / s["scored"] if s["scored"] else 0.0
+        print(f"    {col:<20} {s['scored']:>12,} {mean:>8.3f} {s['strong']:>12,}")
+
+
+# =============================================================================
+# Main Build
+# =============================================================================
+
+def score_mention_candidates(
+    dry_run: bool = False,
+    chunk_size: int = SCORE_CHUNK_SIZE,
+    workers: int = -1,
+    backend: str | None = None,
+):
+    """
+    Score l1.mention_candidates into l1.mention_candidate_scores.
+    """
+    backend = backend or default_backend()
+    print(f"Scoring entity resolution candidate pairs ({backend} backend, {chunk_size:,} pairs/chunk)...")
+    if not RAPIDFUZZ_AVAILABLE:
+        print("  ⚠ rapidfuzz not installed, using pure-Python kernels (pip install rapidfuzz)")
+    
+    with get_connection() as conn:
+        create_tables(conn)
+        
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT mention_id::text, parsed_first, parsed_last
+                FROM l1.identity_mentions
+            """)
+            names = {mention_id: (first, last) for mention_id, first, last in cur.fetchall()}
+            print(f"  Loaded {len(names):,} identity mention names")
+            
+            if not dry_run:
+                cur.execute("TRUNCATE l1.mention_candidate_scores")
+            
+            stats = new_stats()
+            
+            # AI NOTE: Named cursors are server-side and only live inside a
+            # transaction; the COPYs on `cur` share that transaction, so
+            # nothing may commit until the read cursor is exhausted.
+            with conn.cursor(name="mention_candidates_stream") as src:
+                src.itersize = chunk_size
+                src.execute("""
+                    SELECT mention_id_a::text, mention_id_b::text
+                    FROM l1.mention_candidates
+                """)
+                
+                while True:
+                    chunk = src.fetchmany(chunk_size)
+                    if not chunk:
+                        break
+                    
+                    rows = score_chunk(chunk, names, stats, workers, backend)
+                    if not dry_run:
+                        copy_rows(cur, "l1.mention_candidate_scores",
+                                  ["mention_id_a", "mention_id_b", *SCORE_COLUMNS], rows)
+                    
+                    print(f"    {stats['pairs']:,} pairs scored...", end="\r")
+            
+            print_report(stats, backend)
+            
+            if dry_run:
+                print("\n  [DRY RUN] No data written")
+                return
+            
+            conn.commit()
+            
+            # =================================================================
+            # Verify
+            # =================================================================
+            cur.execute(f"""
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE name_token_set >= {STRONG_MATCH})
+                FROM l1.mention_candidate_scores
+            """)
+            total_count, strong_count = cur.fetchone()
+            
+            print(f"\n  ✓ Inserted {total_count:,} candidate scores")
+            print(f"  ✓ {strong_count:,} pairs with name_token_set >= {STRONG_MATCH}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score entity resolution candidate pairs")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Score and report without writing to database")
+    parser.add_argument("--chunk-size", type=int, default=SCORE_CHUNK_SIZE,
+                        help=f"Candidate pairs per fetch/score/COPY round trip (default: {SCORE_CHUNK_SIZE})")
+    parser.add_argument("--workers", type=int, default=-1,
+                        help="rapidfuzz scoring threads (default: -1, all cores)")
+    parser.add_argument("--backend", choices=["rapidfuzz", "python"], default=None,
+                        help="Similarity kernels (default: rapidfuzz when installed)")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Epstein Files ARD - Score Mention Candidates")
+    print("=" * 60)
+    
+    try:
+        score_mention_candidates(
+            dry_run=args.dry_run,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            backend=args.backend,
+        )
+        print("\n✓ Scoring completed successfully")
+        return 0
+    except Exception as e:
+        print(f"\nERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
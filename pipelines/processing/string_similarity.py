@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+String Similarity
+
+Batch name-similarity kernels for entity resolution. Scores are computed
+element-wise over two equal-length arrays (left[i] vs right[i]), all in 0-1:
+
+- jaro_winkler: Jaro-Winkler similarity (prefix weight 0.1, common prefix up
+  to 4 characters, applied when the Jaro similarity is above 0.7)
+- levenshtein: 1 - edit distance / length of the longer string
+- token_set: token set ratio / 100 (fuzzywuzzy/rapidfuzz semantics: word
+  order and repeated words are ignored, a name whose words are all in the
+  other scores 1.0)
+
+With rapidfuzz installed the batch runs in its C++ kernels through
+process.cpdist (multi-threaded, no per-pair Python call); without it the
+pure-Python kernels below produce the same scores. Either way every distinct
+normalized pair is scored once: candidate pairs repeat the same first names
+and surnames heavily.
+
+Values are normalized before scoring (accents folded, case folded,
+apostrophes and periods dropped, other punctuation as spaces). A pair where
+either side is None or empty after normalization scores None.
+
+Usage:
+    from string_similarity import SCORE_COLUMNS, score_name_pairs, score_pairs
+    
+    score_pairs(["Jon", "Ann"], ["John", None], "jaro_winkler")  # [0.933..., None]
+    scores = score_name_pairs(names_a, names_b)  # SCORE_COLUMNS -> [score, ...]
+
+Requirements (optional):
+    pip install rapidfuzz
+"""
+
+import unicodedata
+from functools import lru_cache
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz
+    from rapidfuzz.distance import JaroWinkler, Levenshtein
+    from rapidfuzz.process import cpdist
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+METRICS = ["jaro_winkler", "levenshtein", "token_set"]
+
+# Columns produced by score_name_pairs() (l1.mention_candidate_scores)
+SCORE_COLUMNS = [
+    "first_jaro_winkler", "last_jaro_winkler",
+    "first_levenshtein", "last_levenshtein",
+    "name_token_set",
+]
+
+WINKLER_PREFIX_WEIGHT = 0.1
+WINKLER_MAX_PREFIX = 4
+WINKLER_THRESHOLD = 0.7
+
+# Distinct raw values kept by normalize_value()
+NORMALIZE_CACHE_SIZE = 65_536
+
+# Dropped outright ("O'Brien" -> "obrien", "J." -> "j"); any other
+# non-alphanumeric character separates words
+DROPPED_CHARS = frozenset("'’`.")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_value(value: str) -> str:
+    """Casefolded, accent-folded words of value joined by single spaces."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    chars = []
+    for ch in decomposed.casefold():
+        if ch.isalnum():
+            chars.append(ch)
+        elif ch in DROPPED_CHARS or unicodedata.combining(ch):
+            continue
+        else:
+            chars.append(" ")
+    return " ".join("".join(chars).split())
+
+
+# =============================================================================
+# Pure-Python kernels (fallback and reference)
+# =============================================================================
+
+def jaro_winkler(s1: str, s2: str) -> float:
+    """Jaro-Winkler similarity of two non-empty strings."""
+    if s1 == s2:
+        return 1.0
+    
+    len1, len2 = len(s1), len(s2)
+    window = max(max(len1, len2) // 2 - 1, 0)
+    
+    matched2 = [False] * len2
+    matches1 = []
+    for i, ch in enumerate(s1):
+        for j in range(max(0, i - window), min(len2, i + window + 1)):
+            if not matched2[j] and s2[j] == ch:
+                matched2[j] = True
+                matches1.append(ch)
+                break
+    
+    common = len(matches1)
+    if not common:
+        return 0.0
+    
+    matches2 = [s2[j] for j in range(len2) if matched2[j]]
+    transpositions = sum(a != b for a, b in zip(matches1, matches2)) // 2
+    sim = (common / len1 + common / len2 + (common - transpositions) / common) / 3
+    
+    if sim > WINKLER_THRESHOLD:
+        prefix = 0
+        for a, b in zip(s1[:WINKLER_MAX_PREFIX], s2[:WINKLER_MAX_PREFIX]):
+            if a != b:
+                break
+            prefix += 1
+        sim += prefix * WINKLER_PREFIX_WEIGHT * (1.0 - sim)
+    
+    return sim
+
+
+def levenshtein(s1: str, s2: str) -> float:
+    """1 - Levenshtein distance / longer length."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if not s1:
+        return 1.0
+    
+    previous = list(range(len(s2) + 1))
+    for i, ch1 in enumerate(s1, 1):
+        current = [i]
+        for j, ch2 in enumerate(s2, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ch1 != ch2),
+            ))
+        previous = current
+    
+    return 1.0 - previous[-1] / len(s1)
+
+
+def _indel_distance(s1: str, s2: str) -> int:
+    """Insertions + deletions turning s1 into s2 (len1 + len2 - 2 * LCS)."""
+    previous = [0] * (len(s2) + 1)
+    for ch1 in s1:
+        current = [0]
+        for j, ch2 in enumerate(s2, 1):
+            current.append(previous[j - 1] + 1 if ch1 == ch2 else max(previous[j], current[j - 1]))
+        previous = current
+    return len(s1) + len(s2) - 2 * previous[-1]
+
+
+def _norm_distance(distance: int, length: int) -> float:
+    return 1.0 - distance / length if length else 1.0
+
+
+def token_set(s1: str, s2: str) -> float:
+    """rapidfuzz fuzz.token_set_ratio / 100."""
+    tokens_a = set(s1.split())
+    tokens_b = set(s2.split())
+    if not tokens_a or not tokens_b:
+        return 0.0
+    
+    intersect = tokens_a & tokens_b
+    diff_ab = tokens_a - tokens_b
+    diff_ba = tokens_b - tokens_a
+    
+    # All words of one name appear in the other
+    if intersect and (not diff_ab or not diff_ba):
+        return 1.0
+    
+    diff_ab_joined = " ".join(sorted(diff_ab))
+    diff_ba_joined = " ".join(sorted(diff_ba))
+    ab_len = len(diff_ab_joined)
+    ba_len = len(diff_ba_joined)
+    sect_len = len(" ".join(intersect))
+    
+    # Lengths of "sect ab" and "sect ba"
+    sect_ab_len = sect_len + (sect_len != 0) + ab_len
+    sect_ba_len = sect_len + (sect_len != 0) + ba_len
+    
+    result = _norm_distance(_indel_distance(diff_ab_joined, diff_ba_joined), sect_ab_len + sect_ba_len)
+    if not sect_len:
+        return result
+    
+    # "sect" vs "sect ab" / "sect ba" differ only by the appended words
+    sect_ab_ratio = _norm_distance((sect_len != 0) + ab_len, sect_len + sect_ab_len)
+    sect_ba_ratio = _norm_distance((sect_len != 0) + ba_len, sect_len + sect_ba_len)
+    
+    return max(result, sect_ab_ratio, sect_ba_ratio)
+
+
+PYTHON_KERNELS = {
+    "jaro_winkler": jaro_winkler,
+    "levenshtein": levenshtein,
+    "token_set": token_set,
+}
+
+if RAPIDFUZZ_AVAILABLE:
+    # Scorer and factor bringing its result to 0-1
+    RAPIDFUZZ_SCORERS = {
+        "jaro_winkler": (JaroWinkler.normalized_similarity, 1.0),
+        "levenshtein": (Levenshtein.normalized_similarity, 1.0),
+        "token_set": (fuzz.token_set_ratio, 0.01),
+    }
+
+
+# =============================================================================
+# Batch scoring
+# =============================================================================
+
+def default_backend() -> str:
+    return "rapidfuzz" if RAPIDFUZZ_AVAILABLE else "python"
+
+
+def _score_distinct(pairs: list[tuple[str, str]], metric: str, backend: str, workers: int) -> list[float]:
+    if not pairs:
+        return []
+    
+    if backend == "rapidfuzz":
+        scorer, factor = RAPIDFUZZ_SCORERS[metric]
+        scores = cpdist(
+            [a for a, _ in pairs], [b for _, b in pairs],
+            scorer=scorer, dtype=np.float64, workers=workers,
+        )
+        if factor != 1.0:
+            scores *= factor
+        return scores.tolist()
+    
+    kernel = PYTHON_KERNELS[metric]
+    return [kernel(a, b) for a, b in pairs]
+
+
+def score_pairs(
+    left: list[str | None],
+    right: list[str | None],
+    metric: str,
+    backend: str | None = None,
+    workers: int = -1,
+) -> list[float | None]:
+    """
+    Element-wise similarity of left[i] and right[i].
+    
+    Args:
+        left, right: Equal-length value lists (None allowed)
+        metric: One of METRICS
+        backend: "rapidfuzz" or "python" (default: rapidfuzz when installed)
+        workers: rapidfuzz threads (-1 = all cores)
+    
+    Returns:
+        list: Score per position, None where either value is missing
+    """
+    if len(left) != len(right):
+        raise ValueError(f"left and right differ in length ({len(left)} vs {len(right)})")
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r} (expected one of {METRICS})")
+    backend = backend or default_backend()
+    if backend == "rapidfuzz" and not RAPIDFUZZ_AVAILABLE:
+        raise ValueError("rapidfuzz backend requested but rapidfuzz is not installed")
+    
+    # Distinct raw pairs first, so each is normalized only once
+    raw_pairs = {}
+    raw_slots = [raw_pairs.setdefault(pair, len(raw_pairs)) for pair in zip(left, right)]
+    
+    # AI NOTE: All three metrics are symmetric, so (a, b) and (b, a) share
+    # one slot in `distinct`, as do raw pairs that normalize alike
+    distinct = {}
+    kernel_slots = []
+    for a, b in raw_pairs:
+        a = normalize_value(a) if a else ""
+        b = normalize_value(b) if b else ""
+        if not a or not b:
+            kernel_slots.append(None)
+            continue
+        key = (a, b) if a <= b else (b, a)
+        kernel_slots.append(distinct.setdefault(key, len(distinct)))
+    
+    distinct_scores = _score_distinct(list(distinct), metric, backend, workers)
+    
+    raw_scores = [None if slot is None else distinct_scores[slot] for slot in kernel_slots]
+    return [raw_scores[slot] for slot in raw_slots]
+
+
+def full_name(first: str | None, last: str | None) -> str | None:
+    """Full name ("first last") from whichever parts are present."""
+    return " ".join(part for part in (first, last) if part) or None
+
+
+def score_name_pairs(
+    names_a: list[tuple[str | None, str | None]],
+    names_b: list[tuple[str | None, str | None]],
+    backend: str | None = None,
+    workers: int = -1,
+) -> dict[str, list[float | None]]:
+    """
+    SCORE_COLUMNS for (parsed_first, parsed_last) pairs names_a[i] vs names_b[i].
+    
+    First-name and surname scores compare the parts separately; the token
+    set score compares the full names, so swapped or partial names still match.
+    
+    Returns:
+        dict: SCORE_COLUMNS -> list of scores (None where not computable)
+    """
+    first_a = [first for first, _ in names_a]
+    last_a = [last for _, last in names_a]
+    first_b = [first for first, _ in names_b]
+    last_b = [last for _, last in names_b]
+    
+    return {
+        "first_jaro_winkler": score_pairs(first_a, first_b, "jaro_winkler", backend, workers),
+        "last_jaro_winkler": score_pairs(last_a, last_b, "jaro_winkler", backend, workers),
+        "first_levenshtein": score_pairs(first_a, first_b, "levenshtein", backend, workers),
+        "last_levenshtein": score_pairs(last_a, last_b, "levenshtein", backend, workers),
+        "name_token_set": score_pairs(
+            [full_name(*name) for name in names_a],
+            [full_name(*name) for name in names_b],
+            "token_set", backend, workers,
+        ),
+    }
@@ -5,7 +5,7 @@ Transform Black Book from L0 (core) to L1
 Implements:
 - BB-1: Multi-person entry decomposition
 - BB-2: Phone normalization to E.164
-- BB-3: Country standardization to ISO 3166-1
+- BB-3: Country standardization to ISO 3166-1 (country_lookup.py)
 - BB-4: Entity type classification
 
 Creates:
@@ -14,7 +14,9 @@ Creates:
 - l1.phone_numbers: Normalized phone numbers
 
 Usage:
-    python transform_black_book_l1.py [--dry-run]
+    python transform_black_book_l1.py [--dry-run] [--incremental]
+    python transform_black_book_l1.py --no-phone-cache   # don't persist phone results
+    python transform_black_book_l1.py --workers 8        # parallel phone normalization
 
 Requirements:
     pip install psycopg[binary] python-dotenv phonenumbers
@@ -25,11 +27,19 @@ import os
 import re
 import sys
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Sequence
 
 import psycopg
 from dotenv import load_dotenv
 
+from country_lookup import CountryIndex
+from l1_bulk_writer import copy_rows
+from memo_cache import MemoCache
+
 try:
     import phonenumbers
     PHONENUMBERS_AVAILABLE = True
@@ -48,6 +58,21 @@ PGSQL_USER = os.getenv("PGSQL_USER")
 PGSQL_PASSWORD = os.getenv("PGSQL_PASSWORD")
 PGSQL_DATABASE = os.getenv("PGSQL_DATABASE")
 
+# BB-2 result cache: (raw, region) -> normalize_phone() dict. Office and
+# switchboard numbers recur across many entries.
+PHONE_CACHE_PATH = PROJECT_ROOT / "data" / "cache" / "l1-memo.sqlite"
+PHONE_CACHE_SIZE = 50_000
+PHONE_CACHE = MemoCache(maxsize=PHONE_CACHE_SIZE)
+
+# (raw, region) pairs per process-pool task with --workers
+PHONE_CHUNK_SIZE = 500
+
+# Distinct (name, surname, first_name) decompositions kept in memory
+DECOMPOSE_CACHE_SIZE = 16_384
+
+# uuid5 namespace for every L1 black book ID (contact, person, phone, household)
+L1_ID_NAMESPACE = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # URL namespace
+
 
 def get_connection():
     """Connect to the project database."""
@@ -130,8 +155,11 @@ COUNTRY_MAP = {
     # Typos and variations
     "Columbia": "CO",  # Common typo for Colombia
     "Untied States": "US",
-    
-    # Cities used as countries (infer from context)
+}
+
+# Cities used as countries (infer from context); exact matches only, so
+# "Parish" does not fuzzy-match "Paris"
+CITY_COUNTRY_MAP = {
     "London": "GB",
     "New York": "US",
     "Paris": "FR",
@@ -140,33 +168,28 @@ COUNTRY_MAP = {
     "Palm Beach": "US",
 }
 
+COUNTRY_MAP.update(CITY_COUNTRY_MAP)
+
+
+# Normalized ISO 3166-1 index over COUNTRY_MAP + ISO names/aliases, with a
+# bounded fuzzy fallback for misspellings
+COUNTRY_INDEX = CountryIndex(COUNTRY_MAP, exact_only=CITY_COUNTRY_MAP)
+
+# Fuzzy matches listed in the report for review
+REPORT_FUZZY = 25
+
 
 def normalize_country(country: str | None) -> str | None:
     """
     Normalize country to ISO 3166-1 alpha-2.
     
+    COUNTRY_MAP entries win; otherwise any ISO 3166-1 name, alias or
+    alpha-3 code (case, accents and punctuation ignored), then the closest
+    known name within a small edit distance.
+    
     Returns None if unmappable.
     """
-    if not country:
-        return None
-    
-    country = country.strip()
-    
-    # Direct lookup
-    if country in COUNTRY_MAP:
-        return COUNTRY_MAP[country]
-    
-    # Case-insensitive lookup
-    country_lower = country.lower()
-    for key, value in COUNTRY_MAP.items():
-        if key.lower() == country_lower:
-            return value
-    
-    # Already ISO code?
-    if len(country) == 2 and country.isupper():
-        return country
-    
-    return None
+    return COUNTRY_INDEX.lookup(country)
 
 
 # =============================================================================
@@ -186,7 +209,8 @@ def classify_entity_type(row: dict) -> str:
     if company and not first_name and not surname:
         return "organization"
     
-    # Multi-person entry
+    # Multi-person entry (&/and only: "+" lists are decomposed by
+    # decompose_multi_person() but keep their original entity_type)
     if " & " in name or " and " in name.lower():
         return "household"
     
@@ -201,10 +225,184 @@ def classify_entity_type(row: dict) -> str:
 # BB-1: Multi-Person Decomposition
 # =============================================================================
 
-def decompose_multi_person(name: str, surname: str | None, first_name: str | None) -> list[dict]:
+# AI NOTE: The three layouts below generalize the original patterns (see
+# decompose_multi_person_legacy) from two people to N. For a name with a
+# single separator they split exactly where the originals did, so two-person
+# results are unchanged; check_decomposition_equivalence() verifies this.
+
+# Multi-person test shared with classify_entity_type()
+MULTI_PERSON_PATTERN = re.compile(r" (?:&|and|\+) ", re.IGNORECASE)
+
+# Separators between people
+SEPARATOR_PATTERN = re.compile(r"\s*&\s*|\s+and\s+|\s+\+\s+", re.IGNORECASE)
+
+# Commas between people in "Surname, First1, First2 & First3"
+LIST_COMMA_PATTERN = re.compile(r"\s*,\s*")
+
+# "Surname, First1 & First2", "Surname First1 & First2", "First1 & First2 Surname"
+SURNAME_COMMA_PATTERN = re.compile(r"^([^,]+),\s*(.+)$")
+SURNAME_FIRST_PATTERN = re.compile(r"^([A-Z][a-z]+)\s+(.+)$")
+SURNAME_LAST_PATTERN = re.compile(r"^(.+?)\s+([A-Z][a-z]+)$")
+
+
+def is_multi_person(name: str | None) -> bool:
+    """Whether name joins several people with &, "and" or "+"."""
+    return bool(name) and MULTI_PERSON_PATTERN.search(name) is not None
+
+
+def _split_members(text: str, comma_list: bool = False) -> list[str] | None:
+    """
+    Split the first-name part of a multi-person entry.
+    
+    Returns None unless there are at least two non-empty members.
+    """
+    members = SEPARATOR_PATTERN.split(text)
+    if comma_list:
+        # Commas separate people only before the last separator; after it
+        # they belong to the last member, as in the original pattern
+        members = [
+            part
+            for member in members[:-1]
+            for part in LIST_COMMA_PATTERN.split(member.strip().rstrip(","))
+        ] + members[-1:]
+    
+    members = [member.strip() for member in members]
+    if len(members) < 2 or not all(members):
+        return None
+    return members
+
+
+def _people(members: list[str], surname: str) -> tuple[Mapping, ...]:
+    return tuple(
+        MappingProxyType({"first": first, "last": surname, "position": position})
+        for position, first in enumerate(members, 1)
+    )
+
+
+# AI NOTE: Cached results are shared between calls, so the person mappings
+# are read-only views; copy with dict() before modifying one.
+@lru_cache(maxsize=DECOMPOSE_CACHE_SIZE)
+def _decompose(name: str | None, surname: str | None, first_name: str | None) -> tuple[Mapping, ...]:
+    if not name:
+        return (MappingProxyType({"raw": "", "position": 1}),)
+    
+    if is_multi_person(name):
+        for pattern, comma_list in (
+            (SURNAME_COMMA_PATTERN, True),
+            (SURNAME_FIRST_PATTERN, False),
+        ):
+            match = pattern.match(name)
+            members = match and _split_members(match.group(2), comma_list)
+            if members:
+                return _people(members, match.group(1).strip())
+        
+        match = SURNAME_LAST_PATTERN.match(name)
+        members = match and _split_members(match.group(1))
+        if members:
+            return _people(members, match.group(2))
+    
+    # Single person, or couldn't parse - use parsed components if available
+    return (MappingProxyType({
+        "first": first_name or "",
+        "last": surname or "",
+        "raw": name,
+        "position": 1
+    }),)
+
+
+def decompose_multi_person(name: str, surname: str | None, first_name: str | None) -> list[Mapping]:
     """
     Split multi-person entries into individual records.
     
+    Patterns handled ("&", "and" and "+" are interchangeable, any number of
+    people):
+    - "Surname, First1 & First2" / "Surname, First1, First2 & First3"
+    - "Surname First1 & First2"
+    - "First1 & First2 Surname"
+    
+    Memoized on (name, surname, first_name).
+    
+    Returns list of read-only mappings with 'first', 'last', 'position'
+    keys (plus 'raw' for single or unparseable entries).
+    """
+    return list(_decompose(name, surname, first_name))
+
+
+def decompose_multi_persons(
+    names: Sequence,
+    surnames: Sequence,
+    first_names: Sequence,
+) -> list[list[Mapping]]:
+    """
+    Decompose columnar name/surname/first_name arrays.
+    
+    Returns:
+        list: decompose_multi_person() result per input row
+    """
+    if not len(names) == len(surnames) == len(first_names):
+        raise ValueError("names, surnames and first_names must have equal length")
+    
+    return list(map(decompose_multi_person, names, surnames, first_names))
+
+
+def in_legacy_scope(name: str | None) -> bool:
+    """
+    Whether the original decomposition is authoritative for name: one "&"
+    or "and" separator, and no comma list before it.
+    """
+    if not name:
+        return False
+    separators = SEPARATOR_PATTERN.findall(name)
+    if len(separators) != 1 or "+" in separators[0]:
+        return False
+    return SEPARATOR_PATTERN.split(name)[0].count(",") <= 1
+
+
+def check_decomposition_equivalence(rows: list[dict], max_report: int = 5) -> int:
+    """
+    Compare decompose_multi_person() with the original implementation on
+    rows within its scope (see in_legacy_scope).
+    
+    'raw' is ignored for unparsed entries: the original stored its "and"
+    -> "&" rewrite there rather than the name as written. Entries the
+    original split into a person with an empty name (e.g. "Smith  &  Mary",
+    where the extra space became the first person) are skipped; the engine
+    never emits empty members.
+    
+    Returns:
+        int: Number of rows where the results differ
+    """
+    def comparable(persons):
+        return [(p.get("first"), p.get("last"), p["position"], p.get("raw") if len(persons) > 1 else None)
+                for p in persons]
+    
+    mismatches = 0
+    for row in rows:
+        name, surname, first_name = row.get("name"), row.get("surname"), row.get("first_name")
+        if not in_legacy_scope(name):
+            continue
+        
+        expected = decompose_multi_person_legacy(name, surname, first_name)
+        if len(expected) > 1 and not all(p["first"] and p["last"] for p in expected):
+            continue
+        
+        actual = decompose_multi_person(name, surname, first_name)
+        if comparable(actual) != comparable(expected):
+            mismatches += 1
+            if mismatches <= max_report:
+                print(f"    ✗ {name!r}: engine={actual} original={expected}")
+    
+    return mismatches
+
+
+def decompose_multi_person_legacy(name: str, surname: str | None, first_name: str | None) -> list[dict]:
+    """
+    Original BB-1 decomposition (two people, "&"/"and" only).
+    
+    Kept as the reference for check_decomposition_equivalence() and
+    benchmarks/benchmark_decomposition.py; the transform uses
+    decompose_multi_person().
+    
     Patterns handled:
     - "Surname, First1 & First2"
     - "Surname First1 & First2"
@@ -255,7 +453,7 @@ def decompose_multi_person(name: str, surname: str | None, first_name: str | Non
     # Pattern with 'and' instead of &
     name_and = re.sub(r'\s+and\s+', ' & ', name, flags=re.IGNORECASE)
     if name_and != name:
-        return decompose_multi_person(name_and, surname, first_name)
+        return decompose_multi_person_legacy(name_and, surname, first_name)
     
     # Couldn't parse - return as single with raw
     return [{
@@ -268,8 +466,31 @@ def decompose_multi_person(name: str, surname: str | None, first_name: str | Non
 
 def generate_household_id(l0_record_id) -> str:
     """Generate deterministic household ID from L0 record ID."""
-    namespace = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # URL namespace
-    return str(uuid.uuid5(namespace, str(l0_record_id)))
+    return str(uuid.uuid5(L1_ID_NAMESPACE, str(l0_record_id)))
+
+
+# AI NOTE: Contact, person and phone IDs are uuid5 over the L0 record_id plus
+# the row's role within that record, so full and incremental runs reproduce
+# them and l1.identity_mentions.source_id survives rebuilds. The ":role"
+# suffix keeps them distinct from generate_household_id(), which hashes the
+# bare record_id (unchanged so existing household IDs stay valid).
+
+def generate_contact_id(l0_record_id) -> str:
+    """Generate deterministic contact ID (one contact per L0 record)."""
+    return str(uuid.uuid5(L1_ID_NAMESPACE, f"{l0_record_id}:contact"))
+
+
+def generate_person_id(l0_record_id, position: int) -> str:
+    """Generate deterministic person ID from L0 record ID and BB-1 position."""
+    return str(uuid.uuid5(L1_ID_NAMESPACE, f"{l0_record_id}:person:{position}"))
+
+
+def generate_phone_id(l0_record_id, phone_type: str, ordinal: int) -> str:
+    """
+    Generate deterministic phone ID from L0 record ID, phone type and the
+    number's 1-based position among that record's numbers of that type.
+    """
+    return str(uuid.uuid5(L1_ID_NAMESPACE, f"{l0_record_id}:phone:{phone_type}:{ordinal}"))
 
 
 # =============================================================================
@@ -306,47 +527,33 @@ REGION_MAP = {
 }
 
 
-def normalize_phone(raw: str, country_iso: str | None = None) -> dict:
+def configure_phone_cache(path: Path | None = PHONE_CACHE_PATH, maxsize: int = PHONE_CACHE_SIZE) -> MemoCache:
     """
-    Normalize phone number to E.164 format.
+    Replace the module phone cache (path=None: memory only).
     
-    Returns dict with:
-    - raw_value: Original input
-    - e164_format: Normalized E.164 (or None if invalid)
-    - country_code: Numeric country code
-    - national_format: Formatted for display
-    - is_valid: Whether parsing succeeded
-    - parse_region: Region used for parsing
+    The on-disk namespace is versioned by the phonenumbers release, whose
+    metadata decides validity and formatting.
     """
-    if not PHONENUMBERS_AVAILABLE:
-        return {
-            "raw_value": raw,
-            "e164_format": None,
-            "country_code": None,
-            "national_format": None,
-            "is_valid": False,
-            "parse_region": None
-        }
-    
-    if not raw or not raw.strip():
-        return {
-            "raw_value": raw,
-            "e164_format": None,
-            "country_code": None,
-            "national_format": None,
-            "is_valid": False,
-            "parse_region": None
-        }
-    
-    raw = raw.strip()
-    
-    # Determine region
+    global PHONE_CACHE
+    PHONE_CACHE.close()
+    version = phonenumbers.__version__ if PHONENUMBERS_AVAILABLE else ""
+    PHONE_CACHE = MemoCache(maxsize=maxsize, path=path, namespace="phone", version=version)
+    return PHONE_CACHE
+
+
+def phone_region(raw: str, country_iso: str | None) -> str:
+    """Region used to parse a stripped raw number."""
     region = REGION_MAP.get(country_iso, "US")
     
     # Override for zero-prefix (likely UK)
     if raw.startswith("0") and not raw.startswith("00") and not country_iso:
         region = "GB"
     
+    return region
+
+
+def _parse_phone(raw: str, region: str) -> dict:
+    """phonenumbers parse/validate/format for one stripped number (uncached)."""
     try:
         parsed = phonenumbers.parse(raw, region)
         if phonenumbers.is_valid_number(parsed):
@@ -375,22 +582,66 @@ def normalize_phone(raw: str, country_iso: str | None = None) -> dict:
     }
 
 
-def extract_phones_from_row(row: dict, country_iso: str | None) -> list[dict]:
+def normalize_phone_in_region(raw: str, region: str) -> dict:
     """
-    Extract and normalize all phone numbers from a black book row.
+    Normalize a stripped number with a known parse region, via PHONE_CACHE.
     
-    Handles pipe-separated values in single fields.
+    Returns a fresh dict each call; callers add keys (phone_type) to it.
     """
-    phones = []
+    return dict(PHONE_CACHE.get_or_compute((raw, region), lambda: _parse_phone(raw, region)))
+
+
+def normalize_phone(raw: str, country_iso: str | None = None) -> dict:
+    """
+    Normalize phone number to E.164 format.
     
-    phone_fields = [
-        ("phone_general", "general"),
-        ("phone_work", "work"),
-        ("phone_home", "home"),
-        ("phone_mobile", "mobile"),
-    ]
+    Returns dict with:
+    - raw_value: Original input
+    - e164_format: Normalized E.164 (or None if invalid)
+    - country_code: Numeric country code
+    - national_format: Formatted for display
+    - is_valid: Whether parsing succeeded
+    - parse_region: Region used for parsing
+    """
+    if not PHONENUMBERS_AVAILABLE:
+        return {
+            "raw_value": raw,
+            "e164_format": None,
+            "country_code": None,
+            "national_format": None,
+            "is_valid": False,
+            "parse_region": None
+        }
+    
+    if not raw or not raw.strip():
+        return {
+            "raw_value": raw,
+            "e164_format": None,
+            "country_code": None,
+            "national_format": None,
+            "is_valid": False,
+            "parse_region": None
+        }
+    
+    raw = raw.strip()
+    return normalize_phone_in_region(raw, phone_region(raw, country_iso))
+
+
+PHONE_FIELDS = [
+    ("phone_general", "general"),
+    ("phone_work", "work"),
+    ("phone_home", "home"),
+    ("phone_mobile", "mobile"),
+]
+
+
+def iter_phone_values(row: dict):
+    """
+    Yield (phone_type, stripped number) for every phone in a black book row.
     
-    for field, phone_type in phone_fields:
+    Handles pipe-separated values in single fields.
+    """
+    for field, phone_type in PHONE_FIELDS:
         value = row.get(field)
         if not value:
             continue
@@ -401,13 +652,110 @@ def extract_phones_from_row(row: dict, country_iso: str | None) -> list[dict]:
         for num in numbers:
             num = num.strip()
             if num:
-                normalized = normalize_phone(num, country_iso)
-                normalized["phone_type"] = phone_type
-                phones.append(normalized)
+                yield phone_type, num
+
+
+def extract_phones_from_row(row: dict, country_iso: str | None) -> list[dict]:
+    """
+    Extract and normalize all phone numbers from a black book row.
+    
+    Handles pipe-separated values in single fields.
+    """
+    phones = []
+    
+    for phone_type, num in iter_phone_values(row):
+        normalized = normalize_phone(num, country_iso)
+        normalized["phone_type"] = phone_type
+        phones.append(normalized)
     
     return phones
 
 
+def _parse_phone_pair(pair: tuple[str, str]) -> dict:
+    """Process pool entry point for prewarm_phone_cache()."""
+    return _parse_phone(*pair)
+
+
+def prewarm_phone_cache(
+    rows: list[dict],
+    workers: int,
+    chunk_size: int = PHONE_CHUNK_SIZE,
+) -> int:
+    """
+    Normalize every distinct uncached (raw, region) pair across a process pool.
+    
+    phonenumbers parsing is pure-Python CPU work, so the serial row loop
+    cannot use more than one core. Pairs are collected from all rows,
+    deduplicated, and any pair already cached is skipped; results are put in
+    PHONE_CACHE, so the row loop afterwards only reads the cache.
+    
+    Args:
+        rows: core.black_book rows as dicts
+        workers: Pool processes
+        chunk_size: Pairs sent to a worker per task
+    
+    Returns:
+        int: Pairs parsed in the pool
+    """
+    if not PHONENUMBERS_AVAILABLE:
+        return 0
+    
+    pairs = set()
+    for row in rows:
+        country_iso = normalize_country(row.get("country"))
+        for _, num in iter_phone_values(row):
+            pairs.add((num, phone_region(num, country_iso)))
+    
+    todo = sorted(pair for pair in pairs if pair not in PHONE_CACHE)
+    print(f"  Phone pre-pass: {len(pairs):,} distinct (number, region) pairs, {len(todo):,} uncached")
+    if not todo:
+        return 0
+    
+    # AI NOTE: Memory-only caches smaller than the uncached set would evict
+    # prewarmed results before the row loop reads them (they'd be re-parsed
+    # serially). Disk-backed caches still serve them from SQLite.
+    if len(todo) > PHONE_CACHE.maxsize and PHONE_CACHE.path is None:
+        print(f"  WARNING: {len(todo):,} pairs exceed the in-memory phone cache ({PHONE_CACHE.maxsize:,})")
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pair, result in zip(todo, executor.map(_parse_phone_pair, todo, chunksize=chunk_size)):
+            PHONE_CACHE.put(pair, result)
+    
+    return len(todo)
+
+
+# =============================================================================
+# L0 Query
+# =============================================================================
+
+# AI NOTE: Column order matches import_l0_to_postgres.BLACK_BOOK_COLUMN_MAP, so
+# L0_ROW_HASH_SQL equals the row_hash recorded in ingest.l0_change_manifest by
+# upsert imports. Keep both lists in the same order.
+L0_COLUMNS = [
+    "record_id", "page", "page_link", "name", "company_text", "surname",
+    "first_name", "address_type", "address", "zip", "city", "country",
+    "phone_general", "phone_work", "phone_home", "phone_mobile", "email",
+]
+
+L0_ROW_HASH_SQL = "md5(ROW({})::text)".format(
+    ", ".join(f"bb.{col}" for col in L0_COLUMNS)
+)
+
+L0_SELECT_SQL = f"""
+    SELECT
+        {", ".join(f"bb.{col}" for col in L0_COLUMNS)},
+        {L0_ROW_HASH_SQL} AS l0_row_hash
+    FROM core.black_book bb
+"""
+
+# Incremental mode: only records never transformed or changed since
+L0_CHANGED_SQL = f"""
+    {L0_SELECT_SQL}
+    LEFT JOIN l1.contacts c ON c.l0_record_id = bb.record_id
+    WHERE c.l0_row_hash IS DISTINCT FROM {L0_ROW_HASH_SQL}
+"""
+
+
 # =============================================================================
 # DDL
 # =============================================================================
@@ -440,9 +788,13 @@ CREATE TABLE IF NOT EXISTS l1.contacts (
     email TEXT,
     
     -- Metadata
+    l0_row_hash TEXT,  -- md5 of the core row this was built from (incremental mode)
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Tables created before incremental mode existed
+ALTER TABLE l1.contacts ADD COLUMN IF NOT EXISTS l0_row_hash TEXT;
+
 CREATE INDEX IF NOT EXISTS idx_contacts_l0 ON l1.contacts(l0_record_id);
 CREATE INDEX IF NOT EXISTS idx_contacts_name ON l1.contacts(surname, first_name);
 CREATE INDEX IF NOT EXISTS idx_contacts_country ON l1.contacts(country_iso);
@@ -469,6 +821,7 @@ CREATE TABLE IF NOT EXISTS l1.contact_persons (
 );
 
 CREATE INDEX IF NOT EXISTS idx_contact_persons_contact ON l1.contact_persons(contact_id);
+CREATE INDEX IF NOT EXISTS idx_contact_persons_l0 ON l1.contact_persons(l0_record_id);
 CREATE INDEX IF NOT EXISTS idx_contact_persons_household ON l1.contact_persons(household_id);
 CREATE INDEX IF NOT EXISTS idx_contact_persons_name ON l1.contact_persons(extracted_last, extracted_first);
 """
@@ -495,6 +848,7 @@ CREATE TABLE IF NOT EXISTS l1.phone_numbers (
 );
 
 CREATE INDEX IF NOT EXISTS idx_phone_numbers_contact ON l1.phone_numbers(contact_id);
+CREATE INDEX IF NOT EXISTS idx_phone_numbers_l0 ON l1.phone_numbers(l0_record_id);
 CREATE INDEX IF NOT EXISTS idx_phone_numbers_e164 ON l1.phone_numbers(e164_format) WHERE e164_format IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_phone_numbers_valid ON l1.phone_numbers(is_valid);
 """
@@ -521,9 +875,19 @@ def create_tables(conn):
 # Main Transform
 # =============================================================================
 
-def transform_black_book(dry_run: bool = False):
+def transform_black_book(dry_run: bool = False, workers: int = 1, incremental: bool = False):
     """
     Transform black book from core to L1.
+    
+    Full mode truncates the three L1 tables and rebuilds them. Incremental
+    mode only transforms core records whose content hash differs from the
+    one stored on their l1.contacts row: their persons and phones are
+    replaced, contacts are upserted, and L1 rows whose core record no longer
+    exists are removed. IDs are deterministic, so both modes produce
+    identical IDs for identical input.
+    
+    With workers > 1, phone numbers are normalized up front across a process
+    pool (prewarm_phone_cache) instead of one by one inside the row loop.
     """
     print("Transforming black book to L1...")
     
@@ -533,25 +897,34 @@ def transform_black_book(dry_run: bool = False):
         
         with conn.cursor() as cur:
             # Clear existing L1 data
-            if not dry_run:
+            if not dry_run and not incremental:
                 cur.execute("TRUNCATE l1.phone_numbers CASCADE")
                 cur.execute("TRUNCATE l1.contact_persons CASCADE")
                 cur.execute("TRUNCATE l1.contacts CASCADE")
             
-            # Fetch all L0 records
-            cur.execute("""
-                SELECT 
-                    record_id, page, page_link, name, company_text, surname,
-                    first_name, address_type, address, zip, city, country,
-                    phone_general, phone_work, phone_home, phone_mobile, email
-                FROM core.black_book
-                ORDER BY page, name
-            """)
+            # Fetch L0 records (all, or only new/changed ones)
+            cur.execute((L0_CHANGED_SQL if incremental else L0_SELECT_SQL) + " ORDER BY bb.page, bb.name")
             
             rows = cur.fetchall()
             columns = [desc[0] for desc in cur.description]
             
-            print(f"  Processing {len(rows)} L0 records...")
+            if incremental:
+                print(f"  Processing {len(rows)} new or changed L0 records...")
+            else:
+                print(f"  Processing {len(rows)} L0 records...")
+            
+            # BB-2 pre-pass: parse distinct phone numbers across processes
+            row_dicts = [dict(zip(columns, row_tuple)) for row_tuple in rows]
+            pool_parsed = 0
+            if workers > 1:
+                pool_parsed = prewarm_phone_cache(row_dicts, workers)
+            
+            # BB-1 over the whole batch
+            persons_by_row = decompose_multi_persons(
+                [row["name"] for row in row_dicts],
+                [row["surname"] for row in row_dicts],
+                [row["first_name"] for row in row_dicts],
+            )
             
             # Output collections
             contacts = []
@@ -569,11 +942,11 @@ def transform_black_book(dry_run: bool = False):
                 "phones_total": 0,
                 "phones_valid": 0,
                 "country_mapped": 0,
+                "country_fuzzy": 0,
                 "country_unmapped": 0,
             }
             
-            for row_tuple in rows:
-                row = dict(zip(columns, row_tuple))
+            for row, persons in zip(row_dicts, persons_by_row):
                 l0_record_id = row["record_id"]
                 
                 # BB-3: Country normalization
@@ -582,6 +955,8 @@ def transform_black_book(dry_run: bool = False):
                 
                 if country_iso:
                     stats["country_mapped"] += 1
+                    if COUNTRY_INDEX.is_fuzzy(country_raw):
+                        stats["country_fuzzy"] += 1
                 elif country_raw:
                     stats["country_unmapped"] += 1
                 
@@ -590,7 +965,7 @@ def transform_black_book(dry_run: bool = False):
                 stats[entity_type] += 1
                 
                 # Create contact record
-                contact_id = str(uuid.uuid4())
+                contact_id = generate_contact_id(l0_record_id)
                 contacts.append({
                     "contact_id": contact_id,
                     "l0_record_id": l0_record_id,
@@ -606,15 +981,10 @@ def transform_black_book(dry_run: bool = False):
                     "country_iso": country_iso,
                     "entity_type": entity_type,
                     "email": row["email"],
+                    "l0_row_hash": row["l0_row_hash"],
                 })
                 
                 # BB-1: Multi-person decomposition
-                persons = decompose_multi_person(
-                    row["name"],
-                    row["surname"],
-                    row["first_name"]
-                )
-                
                 if len(persons) > 1:
                     stats["multi_person_entries"] += 1
                 
@@ -623,7 +993,7 @@ def transform_black_book(dry_run: bool = False):
                 for person in persons:
                     stats["total_persons"] += 1
                     contact_persons.append({
-                        "person_id": str(uuid.uuid4()),
+                        "person_id": generate_person_id(l0_record_id, person["position"]),
                         "contact_id": contact_id,
                         "l0_record_id": l0_record_id,
                         "household_id": household_id,
@@ -635,14 +1005,17 @@ def transform_black_book(dry_run: bool = False):
                 
                 # BB-2: Phone normalization
                 phones = extract_phones_from_row(row, country_iso)
+                type_ordinals = {}
                 
                 for phone in phones:
                     stats["phones_total"] += 1
                     if phone["is_valid"]:
                         stats["phones_valid"] += 1
                     
+                    ordinal = type_ordinals.get(phone["phone_type"], 0) + 1
+                    type_ordinals[phone["phone_type"]] = ordinal
                     phone_numbers.append({
-                        "phone_id": str(uuid.uuid4()),
+                        "phone_id": generate_phone_id(l0_record_id, phone["phone_type"], ordinal),
                         "contact_id": contact_id,
                         "l0_record_id": l0_record_id,
                         "phone_type": phone["phone_type"],
@@ -664,6 +1037,8 @@ def transform_black_book(dry_run: bool = False):
             print("\n  Multi-person decomposition:")
             print(f"    Multi-person entries: {stats['multi_person_entries']}")
             print(f"    Total persons:        {stats['total_persons']}")
+            info = _decompose.cache_info()
+            print(f"    Distinct names:       {info.currsize:,} ({info.hits:,} cache hits)")
             
             print("\n  Phone normalization:")
             print(f"    Total phones:  {stats['phones_total']}")
@@ -671,32 +1046,50 @@ def transform_black_book(dry_run: bool = False):
             if stats['phones_total'] > 0:
                 pct = 100.0 * stats['phones_valid'] / stats['phones_total']
                 print(f"    Success rate:  {pct:.1f}%")
+            cache = PHONE_CACHE.stats()
+            print(f"    Cache:         {cache['hits']:,} hits, {cache['disk_hits']:,} from disk, "
+                  f"{cache['misses']:,} parsed ({cache['hit_rate']:.1%} hit rate)")
+            if workers > 1:
+                print(f"    Pool-parsed:   {pool_parsed:,} distinct numbers across {workers} processes")
             
             print("\n  Country normalization:")
-            print(f"    Mapped:   {stats['country_mapped']}")
+            print(f"    Mapped:   {stats['country_mapped']} (exact {stats['country_mapped'] - stats['country_fuzzy']}, "
+                  f"fuzzy {stats['country_fuzzy']})")
             print(f"    Unmapped: {stats['country_unmapped']}")
+            if COUNTRY_INDEX.us_states:
+                print(f"    ⚠ {COUNTRY_INDEX.us_states} distinct US state names left unmapped (ambiguous)")
+            if COUNTRY_INDEX.fuzzy_hits:
+                print(f"    ⚠ {COUNTRY_INDEX.fuzzy_matches} distinct values matched by edit distance (review):")
+                for raw, (iso, matched_key) in sorted(COUNTRY_INDEX.fuzzy_hits.items())[:REPORT_FUZZY]:
+                    print(f"        {raw!r} -> {iso} (via {matched_key!r})")
             
             if dry_run:
+                mismatches = check_decomposition_equivalence(row_dicts)
+                if mismatches:
+                    print(f"\n  ✗ Decomposition: {mismatches:,} entries differ from the original two-person patterns")
+                else:
+                    print("\n  ✓ Decomposition: two-person entries match the original patterns")
                 print("\n  [DRY RUN] No data written")
                 return
             
+            # AI NOTE: A changed record can decompose into fewer persons or
+            # carry fewer phones than before, so its children are replaced
+            # wholesale rather than upserted (which would leave the extras).
+            if incremental:
+                _delete_children(cur, [r["l0_record_id"] for r in contacts])
+            
             # Insert contacts
             print("\n  Inserting contacts...")
             contact_cols = [
                 "contact_id", "l0_record_id", "page", "name", "company_text",
                 "surname", "first_name", "address", "city", "zip",
-                "country_raw", "country_iso", "entity_type", "email"
-            ]
-            contact_placeholders = ", ".join(["%s"] * len(contact_cols))
-            contact_insert = f"""
-                INSERT INTO l1.contacts ({", ".join(contact_cols)})
-                VALUES ({contact_placeholders})
-            """
-            contact_rows = [
-                tuple(c[col] for col in contact_cols)
-                for c in contacts
+                "country_raw", "country_iso", "entity_type", "email", "l0_row_hash"
             ]
-            cur.executemany(contact_insert, contact_rows)  # type: ignore[arg-type]
+            copy_rows(
+                cur, "l1.contacts", contact_cols,
+                (tuple(r[col] for col in contact_cols) for r in contacts),
+                conflict_key="contact_id" if incremental else None
+            )
             
             # Insert contact persons
             print("  Inserting contact persons...")
@@ -704,16 +1097,10 @@ def transform_black_book(dry_run: bool = False):
                 "person_id", "contact_id", "l0_record_id", "household_id",
                 "extracted_first", "extracted_last", "extracted_raw", "position_in_record"
             ]
-            person_placeholders = ", ".join(["%s"] * len(person_cols))
-            person_insert = f"""
-                INSERT INTO l1.contact_persons ({", ".join(person_cols)})
-                VALUES ({person_placeholders})
-            """
-            person_rows = [
-                tuple(p[col] for col in person_cols)
-                for p in contact_persons
-            ]
-            cur.executemany(person_insert, person_rows)  # type: ignore[arg-type]
+            copy_rows(
+                cur, "l1.contact_persons", person_cols,
+                (tuple(r[col] for col in person_cols) for r in contact_persons)
+            )
             
             # Insert phone numbers
             print("  Inserting phone numbers...")
@@ -722,16 +1109,13 @@ def transform_black_book(dry_run: bool = False):
                 "raw_value", "e164_format", "country_code", "national_format",
                 "is_valid", "parse_region"
             ]
-            phone_placeholders = ", ".join(["%s"] * len(phone_cols))
-            phone_insert = f"""
-                INSERT INTO l1.phone_numbers ({", ".join(phone_cols)})
-                VALUES ({phone_placeholders})
-            """
-            phone_rows = [
-                tuple(p[col] for col in phone_cols)
-                for p in phone_numbers
-            ]
-            cur.executemany(phone_insert, phone_rows)  # type: ignore[arg-type]
+            copy_rows(
+                cur, "l1.phone_numbers", phone_cols,
+                (tuple(r[col] for col in phone_cols) for r in phone_numbers)
+            )
+            
+            if incremental:
+                _remove_stale_rows(cur)
             
             conn.commit()
             
@@ -752,17 +1136,56 @@ def transform_black_book(dry_run: bool = False):
             row = cur.fetchone()
             valid_phone_count = row[0] if row else 0
             
-            print(f"\n  ✓ Inserted {contact_count} contacts")
-            print(f"  ✓ Inserted {person_count} contact persons")
-            print(f"  ✓ Inserted {phone_count} phone numbers ({valid_phone_count} valid)")
+            verb = "L1 now has" if incremental else "Inserted"
+            print(f"\n  ✓ {verb} {contact_count} contacts")
+            print(f"  ✓ {verb} {person_count} contact persons")
+            print(f"  ✓ {verb} {phone_count} phone numbers ({valid_phone_count} valid)")
+
+
+def _delete_children(cur, l0_record_ids: list):
+    """Incremental mode: drop persons and phones of records about to be rewritten."""
+    if not l0_record_ids:
+        return
+    
+    cur.execute("DELETE FROM l1.phone_numbers WHERE l0_record_id = ANY(%s)", (l0_record_ids,))
+    cur.execute("DELETE FROM l1.contact_persons WHERE l0_record_id = ANY(%s)", (l0_record_ids,))
+
+
+def _remove_stale_rows(cur):
+    """
+    Incremental mode cleanup after upserts.
+    
+    Deletes phones, persons and contacts whose core.black_book record is
+    gone (children first, for the contact_id foreign keys).
+    """
+    removed = []
+    for table in ("l1.phone_numbers", "l1.contact_persons", "l1.contacts"):
+        cur.execute(f"""
+            DELETE FROM {table} t
+            WHERE NOT EXISTS (SELECT 1 FROM core.black_book bb WHERE bb.record_id = t.l0_record_id)
+        """)
+        removed.append(cur.rowcount)
+    
+    print(f"  Removed stale rows: {removed[2]} contacts, {removed[1]} persons, {removed[0]} phones")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Transform black book to L1")
     parser.add_argument("--dry-run", action="store_true",
                         help="Process without writing to database")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only transform new/changed L0 records and upsert them (no TRUNCATE)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for phone normalization (default: 1 = serial)")
+    parser.add_argument("--phone-cache", type=Path, default=PHONE_CACHE_PATH,
+                        help=f"SQLite file backing the phone normalization cache (default: {PHONE_CACHE_PATH})")
+    parser.add_argument("--no-phone-cache", action="store_true",
+                        help="Keep the phone cache in memory only (no reuse across runs)")
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
     print("=" * 60)
     print("Epstein Files ARD - Black Book L1 Transform")
     print("=" * 60)
@@ -772,8 +1195,10 @@ def main():
         print("  pip install phonenumbers")
         print()
     
+    configure_phone_cache(None if args.no_phone_cache else args.phone_cache)
+    
     try:
-        transform_black_book(dry_run=args.dry_run)
+        transform_black_book(dry_run=args.dry_run, workers=args.workers, incremental=args.incremental)
         print("\n✓ Transform completed successfully")
         return 0
     except Exception as e:
@@ -781,6 +1206,8 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        PHONE_CACHE.close()
 
 
 if __name__ == "__main__":
@@ -13,7 +13,9 @@ Creates:
 - l1.flight_passengers: One row per passenger instance (links to L0)
 
 Usage:
-    python transform_flight_logs_l1.py [--dry-run]
+    python transform_flight_logs_l1.py [--dry-run] [--incremental]
+    python transform_flight_logs_l1.py --stream [--chunk-size 10000]
+    python transform_flight_logs_l1.py --engine sql [--dry-run] [--incremental]
 
 Requirements:
     pip install psycopg[binary] python-dotenv
@@ -25,12 +27,17 @@ import os
 import re
 import sys
 import uuid
-from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Sequence
 
 import psycopg
 from dotenv import load_dotenv
 
+from date_normalization import date_cache_stats, normalize_date  # FL-3
+from l1_bulk_writer import copy_rows, on_conflict_clause
+
 # Load environment
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
@@ -42,6 +49,17 @@ PGSQL_USER = os.getenv("PGSQL_USER")
 PGSQL_PASSWORD = os.getenv("PGSQL_PASSWORD")
 PGSQL_DATABASE = os.getenv("PGSQL_DATABASE")
 
+# Distinct (first, last, known) combinations memoized by score_passenger()
+SCORE_CACHE_SIZE = 65536
+
+# Rows per fetch/COPY round trip in --stream mode
+STREAM_CHUNK_SIZE = 10_000
+
+# L0 table read by every engine (benchmarks substitute a synthetic copy)
+L0_SOURCE_TABLE = "core.flight_logs"
+
+ENGINES = ("python", "sql")
+
 
 def get_connection():
     """Connect to the project database."""
@@ -58,6 +76,12 @@ def get_connection():
 # FL-1: Identity Confidence Scoring
 # =============================================================================
 
+# "Female", "Male (2)", ... (descriptive entries)
+DESCRIPTIVE_PATTERN = re.compile(r'^(Female|Male)\s*(\(\d+\))?$', re.IGNORECASE)
+
+# "Female (1)", "Male (2)", ... (numbered descriptive entries: potential victims)
+NUMBERED_DESCRIPTIVE_PATTERN = re.compile(r'^(Female|Male)\s*\(\d+\)$', re.IGNORECASE)
+
 def compute_identity_confidence(row: dict) -> float:
     """
     Compute confidence score for passenger identity.
@@ -82,7 +106,7 @@ def compute_identity_confidence(row: dict) -> float:
         return 0.0
     
     # Descriptive entries (potential victims)
-    if re.match(r'^(Female|Male)\s*(\(\d+\))?$', first_name, re.IGNORECASE):
+    if DESCRIPTIVE_PATTERN.match(first_name):
         return 0.1
     
     # Check for initials only (1-2 chars each)
@@ -110,9 +134,7 @@ def compute_victim_flags(row: dict, confidence: float) -> tuple[bool, bool]:
     first_name = row.get("first_name", "") or ""
     
     # Pattern: "Female (1)", "Male (2)", etc.
-    potential_victim = bool(
-        re.match(r'^(Female|Male)\s*\(\d+\)$', first_name, re.IGNORECASE)
-    )
+    potential_victim = bool(NUMBERED_DESCRIPTIVE_PATTERN.match(first_name))
     
     # Suppress if potential victim OR very low confidence
     suppress_from_public = potential_victim or confidence < 0.3
@@ -121,23 +143,90 @@ def compute_victim_flags(row: dict, confidence: float) -> tuple[bool, bool]:
 
 
 # =============================================================================
-# FL-3: Date Normalization
+# FL-1/FL-2: Batch Scoring
 # =============================================================================
 
-def normalize_date(date_str: str) -> str | None:
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def score_passenger(first_name: str | None, last_name: str | None, known: str | None) -> tuple[float, bool, bool]:
     """
-    Convert M/D/YYYY to ISO 8601 (YYYY-MM-DD).
+    FL-1 and FL-2 for one passenger in a single pass, memoized.
+    
+    Equivalent to compute_identity_confidence() followed by
+    compute_victim_flags(); both only read first_name, last_name and known,
+    and names repeat heavily across flights.
     
-    Returns None if parsing fails.
+    Returns:
+        (identity_confidence, potential_victim, suppress_from_public)
     """
-    if not date_str:
-        return None
+    first = first_name or ""
+    last = last_name or ""
     
-    try:
-        dt = datetime.strptime(date_str.strip(), "%m/%d/%Y")
-        return dt.strftime("%Y-%m-%d")
-    except ValueError:
-        return None
+    # AI NOTE: One match serves both flags. NUMBERED_DESCRIPTIVE_PATTERN
+    # matches exactly when DESCRIPTIVE_PATTERN matches with the "(n)" group.
+    descriptive = DESCRIPTIVE_PATTERN.match(first)
+    potential_victim = descriptive is not None and descriptive.group(2) is not None
+    
+    if known == "Yes":
+        confidence = 1.0
+    elif "?" in first or "?" in last:
+        confidence = 0.0
+    elif descriptive:
+        confidence = 0.1
+    elif len(first.strip()) <= 2 and len(last.strip()) <= 2:
+        confidence = 0.3
+    else:
+        confidence = 0.7
+    
+    return confidence, potential_victim, potential_victim or confidence < 0.3
+
+
+def score_passengers(
+    first_names: Sequence,
+    last_names: Sequence,
+    knowns: Sequence,
+) -> tuple[list[float], list[bool], list[bool]]:
+    """
+    Score columnar first/last/known arrays.
+    
+    Returns:
+        (confidences, potential_victims, suppress_flags), each aligned with
+        the input arrays
+    """
+    if not len(first_names) == len(last_names) == len(knowns):
+        raise ValueError("first_names, last_names and knowns must have equal length")
+    
+    scores = list(map(score_passenger, first_names, last_names, knowns))
+    if not scores:
+        return [], [], []
+    
+    confidences, victims, suppress = zip(*scores)
+    return list(confidences), list(victims), list(suppress)
+
+
+def check_scoring_equivalence(rows: list[dict], max_report: int = 5) -> int:
+    """
+    Compare score_passengers() with the per-row FL-1/FL-2 functions.
+    
+    Returns:
+        int: Number of rows where the results differ
+    """
+    confidences, victims, suppress = score_passengers(
+        [row.get("first_name") for row in rows],
+        [row.get("last_name") for row in rows],
+        [row.get("known") for row in rows],
+    )
+    
+    mismatches = 0
+    for i, row in enumerate(rows):
+        expected_confidence = compute_identity_confidence(row)
+        expected = (expected_confidence, *compute_victim_flags(row, expected_confidence))
+        actual = (confidences[i], victims[i], suppress[i])
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= max_report:
+                print(f"    ✗ l0_id={row.get('id')}: batch={actual} per-row={expected}")
+    
+    return mismatches
 
 
 # =============================================================================
@@ -149,12 +238,19 @@ def generate_flight_id(row: dict) -> str:
     Generate deterministic UUID for a flight based on its identifying attributes.
     
     Flight identity: date + aircraft_tail + dep_code + arr_code + flight_no
+    
+    Missing (NULL) text parts count as ''; flight_no keeps str(None) = "None"
+    so existing flight_ids do not change (FLIGHT_ID_SQL mirrors both).
     """
+    def text(col):
+        value = row.get(col)
+        return "" if value is None else value
+    
     components = [
-        row.get("date", ""),
-        row.get("aircraft_tail", ""),
-        row.get("dep_code", ""),
-        row.get("arr_code", ""),
+        text("date"),
+        text("aircraft_tail"),
+        text("dep_code"),
+        text("arr_code"),
         str(row.get("flight_no", ""))
     ]
     
@@ -163,6 +259,57 @@ def generate_flight_id(row: dict) -> str:
     return str(uuid.UUID(bytes=hash_bytes))
 
 
+def generate_passenger_id(l0_id) -> str:
+    """
+    Generate deterministic UUID for a passenger instance from its L0 row.
+    
+    Each core.flight_logs row is one passenger on one flight, so the L0 id
+    identifies the passenger instance. Stable IDs keep
+    l1.identity_mentions.source_id valid across rebuilds.
+    """
+    key = f"flight_passenger|{l0_id}"
+    hash_bytes = hashlib.sha256(key.encode()).digest()[:16]
+    return str(uuid.UUID(bytes=hash_bytes))
+
+
+# =============================================================================
+# L0 Query
+# =============================================================================
+
+# AI NOTE: Column order matches import_l0_to_postgres.FLIGHT_LOGS_COLUMN_MAP, so
+# L0_ROW_HASH_SQL equals the row_hash recorded in ingest.l0_change_manifest by
+# upsert imports. Keep both lists in the same order.
+L0_COLUMNS = [
+    "id", "date", "year", "aircraft_model", "aircraft_tail", "aircraft_type",
+    "num_seats", "dep_code", "arr_code", "dep_location", "arr_location",
+    "flight_no", "pass_position", "unique_id", "first_name", "last_name",
+    "last_first", "first_last", "comment", "initials", "known", "data_source",
+]
+
+L0_ROW_HASH_SQL = "md5(ROW({})::text)".format(
+    ", ".join(f"fl.{col}" for col in L0_COLUMNS)
+)
+
+L0_SELECT_SQL = f"""
+    SELECT
+        {", ".join(f"fl.{col}" for col in L0_COLUMNS)},
+        {L0_ROW_HASH_SQL} AS l0_row_hash
+    FROM {{source}} fl
+"""
+
+# Incremental mode: only rows never transformed or changed since
+L0_CHANGED_SQL = f"""
+    {L0_SELECT_SQL}
+    LEFT JOIN l1.flight_passengers fp ON fp.l0_id = fl.id
+    WHERE fp.l0_row_hash IS DISTINCT FROM {L0_ROW_HASH_SQL}
+"""
+
+
+def l0_select_sql(incremental: bool = False, source_table: str = L0_SOURCE_TABLE) -> str:
+    """SELECT over the L0 source: all rows, or only new/changed ones."""
+    return (L0_CHANGED_SQL if incremental else L0_SELECT_SQL).format(source=source_table)
+
+
 # =============================================================================
 # DDL
 # =============================================================================
@@ -226,9 +373,13 @@ CREATE TABLE IF NOT EXISTS l1.flight_passengers (
     suppress_from_public BOOLEAN DEFAULT FALSE,
     
     -- Metadata
+    l0_row_hash TEXT,  -- md5 of the core row this was built from (incremental mode)
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Tables created before incremental mode existed
+ALTER TABLE l1.flight_passengers ADD COLUMN IF NOT EXISTS l0_row_hash TEXT;
+
 CREATE INDEX IF NOT EXISTS idx_flight_passengers_flight ON l1.flight_passengers(flight_id);
 CREATE INDEX IF NOT EXISTS idx_flight_passengers_l0 ON l1.flight_passengers(l0_id);
 CREATE INDEX IF NOT EXISTS idx_flight_passengers_name ON l1.flight_passengers(last_name, first_name);
@@ -271,201 +422,665 @@ def create_tables(conn):
     conn.commit()
 
 
+# =============================================================================
+# Row Transform
+# =============================================================================
+
+FLIGHT_COLS = [
+    "flight_id", "flight_date", "flight_date_raw", "year",
+    "aircraft_model", "aircraft_tail", "aircraft_type", "num_seats",
+    "dep_code", "arr_code", "dep_location", "arr_location",
+    "flight_no", "data_source"
+]
+
+PASSENGER_COLS = [
+    "passenger_id", "flight_id", "l0_id", "first_name", "last_name",
+    "first_last", "initials", "pass_position", "comment",
+    "identity_confidence", "known", "potential_victim", "suppress_from_public",
+    "l0_row_hash"
+]
+
+
+def new_stats() -> dict:
+    """Empty counters for identity confidence / victim protection stats."""
+    return {
+        "confidence_1.0": 0,
+        "confidence_0.7": 0,
+        "confidence_0.3": 0,
+        "confidence_0.1": 0,
+        "confidence_0.0": 0,
+        "potential_victims": 0,
+        "suppressed": 0
+    }
+
+
+def transform_rows(rows: list[dict], stats: dict) -> list[tuple[tuple, tuple]]:
+    """
+    Transform a batch of core.flight_logs rows.
+    
+    Returns:
+        (flight_row, passenger_row) pairs as tuples ordered by FLIGHT_COLS and
+        PASSENGER_COLS, ready for copy_rows()
+    """
+    # FL-1/FL-2 over the whole batch
+    confidences, victims, suppress_flags = score_passengers(
+        [row["first_name"] for row in rows],
+        [row["last_name"] for row in rows],
+        [row["known"] for row in rows],
+    )
+    
+    results = []
+    for row, confidence, potential_victim, suppress in zip(rows, confidences, victims, suppress_flags):
+        flight_id = generate_flight_id(row)
+        
+        flight_row = (
+            flight_id,
+            normalize_date(row["date"]),
+            row["date"],
+            row["year"],
+            row["aircraft_model"],
+            row["aircraft_tail"],
+            row["aircraft_type"],
+            row["num_seats"],
+            row["dep_code"],
+            row["arr_code"],
+            row["dep_location"],
+            row["arr_location"],
+            row["flight_no"],
+            row["data_source"],
+        )
+        
+        # Track stats
+        stats[f"confidence_{confidence}"] += 1
+        if potential_victim:
+            stats["potential_victims"] += 1
+        if suppress:
+            stats["suppressed"] += 1
+        
+        passenger_row = (
+            generate_passenger_id(row["id"]),
+            flight_id,
+            row["id"],
+            row["first_name"],
+            row["last_name"],
+            row["first_last"],
+            row["initials"],
+            row["pass_position"],
+            row["comment"],
+            confidence,
+            row["known"],
+            potential_victim,
+            suppress,
+            row["l0_row_hash"],
+        )
+        
+        results.append((flight_row, passenger_row))
+    
+    return results
+
+
+def print_stats(stats: dict, date_cache: bool = True):
+    """Print identity confidence distribution and victim protection counts."""
+    print("\n  Identity confidence distribution:")
+    print(f"    1.0 (verified):    {stats['confidence_1.0']:,}")
+    print(f"    0.7 (unverified):  {stats['confidence_0.7']:,}")
+    print(f"    0.3 (initials):    {stats['confidence_0.3']:,}")
+    print(f"    0.1 (descriptive): {stats['confidence_0.1']:,}")
+    print(f"    0.0 (unknown):     {stats['confidence_0.0']:,}")
+    print(f"\n  Victim protection:")
+    print(f"    Potential victims: {stats['potential_victims']}")
+    print(f"    Suppressed:        {stats['suppressed']}")
+    
+    if not date_cache:
+        return
+    
+    dates = date_cache_stats()
+    print(f"\n  Date normalization cache:")
+    print(f"    Distinct dates:    {dates['size']:,}")
+    print(f"    Hits / misses:     {dates['hits']:,} / {dates['misses']:,} ({dates['hit_rate']:.1%} hit rate)")
+
+
+def print_scoring_check(mismatches: int, total: int):
+    """Report the dry-run batch vs per-row scoring comparison."""
+    info = score_passenger.cache_info()
+    print(f"\n  Batch scoring check ({info.currsize:,} distinct name/known combinations):")
+    if mismatches:
+        print(f"    ✗ {mismatches:,} of {total:,} rows differ from per-row FL-1/FL-2")
+    else:
+        print(f"    ✓ All {total:,} rows match per-row FL-1/FL-2")
+
+
+# =============================================================================
+# SQL Engine
+# =============================================================================
+
+# AI NOTE: Every expression below must reproduce its Python counterpart
+# exactly, or the two engines assign different IDs/flags to the same rows.
+# `--engine sql --dry-run` compares them row by row; run it after any change
+# to either side.
+#
+# generate_flight_id(): sha256 of "date|tail|dep|arr|flight_no", first 16
+# bytes as a UUID. str(None) is "None" for flight_no; other NULLs become ''.
+FLIGHT_ID_SQL = """
+    substr(encode(sha256(convert_to(concat_ws('|',
+        COALESCE(base.date, ''), COALESCE(base.aircraft_tail, ''),
+        COALESCE(base.dep_code, ''), COALESCE(base.arr_code, ''),
+        COALESCE(base.flight_no, 'None')
+    ), 'UTF8')), 'hex'), 1, 32)::uuid
+"""
+
+# generate_passenger_id()
+PASSENGER_ID_SQL = """
+    substr(encode(sha256(convert_to('flight_passenger|' || base.id, 'UTF8')), 'hex'), 1, 32)::uuid
+"""
+
+# score_passenger(). Python's `$` also matches before a trailing newline,
+# hence `\n?$`; str.strip() is emulated with a \s regexp_replace.
+IDENTITY_CONFIDENCE_SQL = r"""
+    CASE
+        WHEN base.known = 'Yes' THEN 1.0
+        WHEN strpos(COALESCE(base.first_name, ''), '?') > 0
+          OR strpos(COALESCE(base.last_name, ''), '?') > 0 THEN 0.0
+        WHEN COALESCE(base.first_name, '') ~* '^(Female|Male)\s*(\(\d+\))?\n?$' THEN 0.1
+        WHEN length(regexp_replace(COALESCE(base.first_name, ''), '^\s+|\s+$', '', 'g')) <= 2
+         AND length(regexp_replace(COALESCE(base.last_name, ''), '^\s+|\s+$', '', 'g')) <= 2 THEN 0.3
+        ELSE 0.7
+    END::DECIMAL(2,1)
+"""
+
+POTENTIAL_VICTIM_SQL = r"""
+    COALESCE(base.first_name, '') ~* '^(Female|Male)\s*\(\d+\)\n?$'
+"""
+
+# date_normalization.parse_flight_date(): strptime("%m/%d/%Y") field rules,
+# NULL instead of ValueError. Also declared in the canonical DDL
+# (pipelines/ddl/create_epsteinfiles_db.sql); keep both copies identical.
+PARSE_FLIGHT_DATE_DDL = r"""
+CREATE OR REPLACE FUNCTION l1.parse_flight_date(value TEXT) RETURNS DATE
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    parts TEXT[];
+BEGIN
+    parts := regexp_match(
+        regexp_replace(value, '^\s+|\s+$', '', 'g'),
+        '^(1[0-2]|0?[1-9])/(3[01]|[12][0-9]|0?[1-9]| [1-9])/([0-9]{4})$'
+    );
+    IF parts IS NULL THEN
+        RETURN NULL;
+    END IF;
+    RETURN make_date(parts[3]::INTEGER, parts[1]::INTEGER, btrim(parts[2])::INTEGER);
+EXCEPTION WHEN datetime_field_overflow THEN
+    RETURN NULL;  -- e.g. 2/30/1999, year 0000
+END;
+$$;
+"""
+
+SQL_SOURCE_TABLE = "flight_logs_l1_src"
+
+SQL_SOURCE_DDL = f"""
+CREATE TEMP TABLE {SQL_SOURCE_TABLE} ON COMMIT DROP AS
+SELECT
+    base.*,
+    {FLIGHT_ID_SQL} AS flight_id,
+    {PASSENGER_ID_SQL} AS passenger_id,
+    {IDENTITY_CONFIDENCE_SQL} AS identity_confidence,
+    {POTENTIAL_VICTIM_SQL} AS potential_victim
+FROM ({{base}}) base
+"""
+
+# One row per flight: the lowest L0 id wins, as in the Python engine
+SQL_FLIGHT_EVENTS_INSERT = f"""
+INSERT INTO l1.flight_events ({", ".join(FLIGHT_COLS)})
+SELECT DISTINCT ON (flight_id)
+    flight_id, l1.parse_flight_date(date), date, year,
+    aircraft_model, aircraft_tail, aircraft_type, num_seats,
+    dep_code, arr_code, dep_location, arr_location,
+    flight_no, data_source
+FROM {SQL_SOURCE_TABLE}
+ORDER BY flight_id, id
+"""
+
+SQL_FLIGHT_PASSENGERS_INSERT = f"""
+INSERT INTO l1.flight_passengers ({", ".join(PASSENGER_COLS)})
+SELECT
+    passenger_id, flight_id, id, first_name, last_name,
+    first_last, initials, pass_position, comment,
+    identity_confidence, known, potential_victim,
+    potential_victim OR identity_confidence < 0.3,
+    l0_row_hash
+FROM {SQL_SOURCE_TABLE}
+"""
+
+
+def sql_engine_stats(cur) -> tuple[dict, int, int]:
+    """
+    Stats for the staged SQL source, in new_stats() form.
+    
+    Returns:
+        (stats, row_count, flight_count)
+    """
+    stats = new_stats()
+    cur.execute(f"""
+        SELECT
+            identity_confidence,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE potential_victim),
+            COUNT(*) FILTER (WHERE potential_victim OR identity_confidence < 0.3)
+        FROM {SQL_SOURCE_TABLE}
+        GROUP BY identity_confidence
+    """)
+    row_count = 0
+    for confidence, count, victims, suppressed in cur.fetchall():
+        stats[f"confidence_{float(confidence)}"] += count
+        stats["potential_victims"] += victims
+        stats["suppressed"] += suppressed
+        row_count += count
+    
+    cur.execute(f"SELECT COUNT(DISTINCT flight_id) FROM {SQL_SOURCE_TABLE}")
+    flight_count = cur.fetchone()[0]
+    
+    return stats, row_count, flight_count
+
+
+def check_engine_equivalence(cur, max_report: int = 5) -> int:
+    """
+    Compare the staged SQL source with transform_rows() on the same rows.
+    
+    Checks flight_id, passenger_id, identity_confidence, both victim flags
+    and the normalized flight date.
+    
+    Returns:
+        int: Number of rows where the engines differ
+    """
+    cur.execute(f"""
+        SELECT
+            {", ".join(L0_COLUMNS)}, l0_row_hash,
+            flight_id, passenger_id, identity_confidence, potential_victim,
+            potential_victim OR identity_confidence < 0.3,
+            l1.parse_flight_date(date)
+        FROM {SQL_SOURCE_TABLE}
+        ORDER BY id
+    """)
+    n = len(L0_COLUMNS) + 1
+    columns = L0_COLUMNS + ["l0_row_hash"]
+    rows = cur.fetchall()
+    
+    python_rows = transform_rows([dict(zip(columns, r[:n])) for r in rows], new_stats())
+    
+    mismatches = 0
+    for r, (flight_row, passenger_row) in zip(rows, python_rows):
+        flight_id, passenger_id, confidence, victim, suppress, flight_date = r[n:]
+        sql_values = (
+            str(flight_id), str(passenger_id), float(confidence), victim, suppress,
+            flight_date.isoformat() if flight_date else None,
+        )
+        python_values = (
+            flight_row[0], passenger_row[0], passenger_row[9], passenger_row[11], passenger_row[12],
+            flight_row[1],
+        )
+        if sql_values != python_values:
+            mismatches += 1
+            if mismatches <= max_report:
+                print(f"    ✗ l0_id={r[0]}: sql={sql_values} python={python_values}")
+    
+    return mismatches
+
+
 # =============================================================================
 # Main Transform
 # =============================================================================
 
-def transform_flight_logs(dry_run: bool = False):
+@contextmanager
+def l1_connection(conn=None):
+    """
+    Yield (conn, owned).
+    
+    With no connection given, opens one and creates the L1 tables; the
+    engine commits it on success. A caller-supplied connection (benchmarks)
+    is used as-is and never committed, so the caller can roll back.
+    """
+    if conn is not None:
+        yield conn, False
+        return
+    
+    with get_connection() as owned_conn:
+        create_tables(owned_conn)
+        yield owned_conn, True
+
+
+def transform_flight_logs(
+    dry_run: bool = False,
+    incremental: bool = False,
+    conn=None,
+    source_table: str = L0_SOURCE_TABLE,
+):
     """
     Transform flight logs from core to L1.
+    
+    Full mode truncates both L1 tables and rebuilds them. Incremental mode
+    only transforms core rows whose content hash differs from the one stored
+    on their l1.flight_passengers row, upserts the results, and removes L1
+    rows whose core row no longer exists. Passenger and flight IDs are
+    deterministic, so both modes produce identical IDs for identical input.
+    
+    Args:
+        dry_run: Transform and report without writing
+        incremental: Only transform new/changed rows (see above)
+        conn: Existing connection; the caller owns the transaction
+        source_table: L0 table to read
     """
     print("Transforming flight logs to L1...")
     
-    with get_connection() as conn:
-        # Create tables
-        create_tables(conn)
-        
+    with l1_connection(conn) as (conn, owned):
         with conn.cursor() as cur:
             # Clear existing L1 data
-            if not dry_run:
+            if not dry_run and not incremental:
                 cur.execute("TRUNCATE l1.flight_passengers CASCADE")
                 cur.execute("TRUNCATE l1.flight_events CASCADE")
             
-            # Fetch all L0 records
-            cur.execute("""
-                SELECT 
-                    id, date, year, aircraft_model, aircraft_tail, aircraft_type,
-                    num_seats, dep_code, arr_code, dep_location, arr_location,
-                    flight_no, pass_position, unique_id, first_name, last_name,
-                    last_first, first_last, comment, initials, known, data_source
-                FROM core.flight_logs
-                ORDER BY id
-            """)
+            # Fetch L0 records (all, or only new/changed ones)
+            cur.execute(l0_select_sql(incremental, source_table) + " ORDER BY fl.id")
             
             rows = cur.fetchall()
             columns = [desc[0] for desc in cur.description]
             
-            print(f"  Processing {len(rows)} L0 records...")
+            if incremental:
+                print(f"  Processing {len(rows)} new or changed L0 records...")
+            else:
+                print(f"  Processing {len(rows)} L0 records...")
             
             # Track unique flights
-            flights_seen = {}  # flight_id -> flight_data
+            flights_seen = {}  # flight_id -> flight row
             passengers = []
+            stats = new_stats()
             
-            # Counters
-            stats = {
-                "confidence_1.0": 0,
-                "confidence_0.7": 0,
-                "confidence_0.3": 0,
-                "confidence_0.1": 0,
-                "confidence_0.0": 0,
-                "potential_victims": 0,
-                "suppressed": 0
-            }
-            
-            for row_tuple in rows:
-                row = dict(zip(columns, row_tuple))
-                
-                # Generate flight ID
-                flight_id = generate_flight_id(row)
-                
-                # Extract flight if not seen
-                if flight_id not in flights_seen:
-                    flights_seen[flight_id] = {
-                        "flight_id": flight_id,
-                        "flight_date": normalize_date(row["date"]),
-                        "flight_date_raw": row["date"],
-                        "year": row["year"],
-                        "aircraft_model": row["aircraft_model"],
-                        "aircraft_tail": row["aircraft_tail"],
-                        "aircraft_type": row["aircraft_type"],
-                        "num_seats": row["num_seats"],
-                        "dep_code": row["dep_code"],
-                        "arr_code": row["arr_code"],
-                        "dep_location": row["dep_location"],
-                        "arr_location": row["arr_location"],
-                        "flight_no": row["flight_no"],
-                        "data_source": row["data_source"]
-                    }
-                
-                # Compute transforms
-                confidence = compute_identity_confidence(row)
-                potential_victim, suppress = compute_victim_flags(row, confidence)
-                
-                # Track stats
-                stats[f"confidence_{confidence}"] += 1
-                if potential_victim:
-                    stats["potential_victims"] += 1
-                if suppress:
-                    stats["suppressed"] += 1
-                
-                # Generate passenger ID
-                passenger_id = str(uuid.uuid4())
-                
-                passengers.append({
-                    "passenger_id": passenger_id,
-                    "flight_id": flight_id,
-                    "l0_id": row["id"],
-                    "first_name": row["first_name"],
-                    "last_name": row["last_name"],
-                    "first_last": row["first_last"],
-                    "initials": row["initials"],
-                    "pass_position": row["pass_position"],
-                    "comment": row["comment"],
-                    "identity_confidence": confidence,
-                    "known": row["known"],
-                    "potential_victim": potential_victim,
-                    "suppress_from_public": suppress
-                })
+            row_dicts = [dict(zip(columns, row_tuple)) for row_tuple in rows]
+            for flight_row, passenger_row in transform_rows(row_dicts, stats):
+                flights_seen.setdefault(flight_row[0], flight_row)
+                passengers.append(passenger_row)
             
             print(f"  Extracted {len(flights_seen)} unique flights")
             print(f"  Extracted {len(passengers)} passenger records")
             
-            # Print stats
-            print("\n  Identity confidence distribution:")
-            print(f"    1.0 (verified):    {stats['confidence_1.0']:,}")
-            print(f"    0.7 (unverified):  {stats['confidence_0.7']:,}")
-            print(f"    0.3 (initials):    {stats['confidence_0.3']:,}")
-            print(f"    0.1 (descriptive): {stats['confidence_0.1']:,}")
-            print(f"    0.0 (unknown):     {stats['confidence_0.0']:,}")
-            print(f"\n  Victim protection:")
-            print(f"    Potential victims: {stats['potential_victims']}")
-            print(f"    Suppressed:        {stats['suppressed']}")
+            print_stats(stats)
             
             if dry_run:
+                print_scoring_check(check_scoring_equivalence(row_dicts), len(row_dicts))
                 print("\n  [DRY RUN] No data written")
                 return
             
             # Insert flights
+            # AI NOTE: Flight attributes are identical on every L0 row of a
+            # flight, so in incremental mode any changed row may refresh them.
             print("\n  Inserting flight events...")
-            flight_cols = [
-                "flight_id", "flight_date", "flight_date_raw", "year",
-                "aircraft_model", "aircraft_tail", "aircraft_type", "num_seats",
-                "dep_code", "arr_code", "dep_location", "arr_location",
-                "flight_no", "data_source"
-            ]
-            flight_placeholders = ", ".join(["%s"] * len(flight_cols))
-            flight_insert = f"""
-                INSERT INTO l1.flight_events ({", ".join(flight_cols)})
-                VALUES ({flight_placeholders})
-            """
-            
-            flight_rows = [
-                tuple(f[col] for col in flight_cols)
-                for f in flights_seen.values()
-            ]
-            cur.executemany(flight_insert, flight_rows)  # type: ignore[arg-type]
+            copy_rows(cur, "l1.flight_events", FLIGHT_COLS, flights_seen.values(),
+                      conflict_key="flight_id" if incremental else None)
             
             # Insert passengers
             print("  Inserting passenger records...")
-            pass_cols = [
-                "passenger_id", "flight_id", "l0_id", "first_name", "last_name",
-                "first_last", "initials", "pass_position", "comment",
-                "identity_confidence", "known", "potential_victim", "suppress_from_public"
-            ]
-            pass_placeholders = ", ".join(["%s"] * len(pass_cols))
-            pass_insert = f"""
-                INSERT INTO l1.flight_passengers ({", ".join(pass_cols)})
-                VALUES ({pass_placeholders})
-            """
-            
-            pass_rows = [
-                tuple(p[col] for col in pass_cols)
-                for p in passengers
-            ]
-            cur.executemany(pass_insert, pass_rows)  # type: ignore[arg-type]
-            
-            conn.commit()
-            
-            # Verify
-            cur.execute("SELECT COUNT(*) FROM l1.flight_events")
-            row = cur.fetchone()
-            event_count = row[0] if row else 0
-            
-            cur.execute("SELECT COUNT(*) FROM l1.flight_passengers")
-            row = cur.fetchone()
-            pass_count = row[0] if row else 0
-            
-            cur.execute("SELECT COUNT(*) FROM l1.flight_passengers_public")
-            row = cur.fetchone()
-            public_count = row[0] if row else 0
-            
-            print(f"\n  ✓ Inserted {event_count} flight events")
-            print(f"  ✓ Inserted {pass_count} passenger records")
-            print(f"  ✓ Public view contains {public_count} records ({pass_count - public_count} suppressed)")
+            copy_rows(cur, "l1.flight_passengers", PASSENGER_COLS, passengers,
+                      conflict_key="passenger_id" if incremental else None)
+            
+            if incremental:
+                _remove_stale_rows(cur, source_table)
+            
+            if owned:
+                conn.commit()
+            
+            print_l1_counts(cur, incremental)
+
+
+def transform_flight_logs_streaming(
+    dry_run: bool = False,
+    incremental: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    conn=None,
+    source_table: str = L0_SOURCE_TABLE,
+):
+    """
+    Transform flight logs from core to L1 in bounded-memory chunks.
+    
+    Reads core.flight_logs through a named (server-side) cursor and writes
+    each chunk before fetching the next: new flights first (FK target), then
+    passengers (both via l1_bulk_writer). Only the set of flight_ids already written is kept
+    across chunks. Full mode runs in a single transaction, so a failure
+    leaves the previous L1 contents in place.
+    
+    Args:
+        dry_run: Transform and report without writing
+        incremental: Same semantics as transform_flight_logs()
+        chunk_size: Rows fetched, transformed and written per round trip
+        conn: Existing connection; the caller owns the transaction
+        source_table: L0 table to read
+    """
+    print(f"Transforming flight logs to L1 (streaming, {chunk_size:,} rows/chunk)...")
+    
+    with l1_connection(conn) as (conn, owned):
+        with conn.cursor() as cur:
+            # Clear existing L1 data
+            if not dry_run and not incremental:
+                cur.execute("TRUNCATE l1.flight_passengers CASCADE")
+                cur.execute("TRUNCATE l1.flight_events CASCADE")
+            
+            flight_key = "flight_id" if incremental else None
+            passenger_key = "passenger_id" if incremental else None
+            
+            flights_written = set()
+            stats = new_stats()
+            total_rows = 0
+            scoring_mismatches = 0
+            
+            # AI NOTE: Named cursors are server-side and only live inside a
+            # transaction; writes on `cur` share that transaction, so nothing
+            # may commit until the read cursor is exhausted.
+            with conn.cursor(name="l1_flight_logs_stream") as src:
+                src.itersize = chunk_size
+                src.execute(l0_select_sql(incremental, source_table) + " ORDER BY fl.id")
+                
+                columns = None
+                while True:
+                    chunk = src.fetchmany(chunk_size)
+                    if not chunk:
+                        break
+                    if columns is None:
+                        columns = [desc[0] for desc in src.description]
+                    
+                    row_dicts = [dict(zip(columns, row_tuple)) for row_tuple in chunk]
+                    new_flights = []
+                    passengers = []
+                    for flight_row, passenger_row in transform_rows(row_dicts, stats):
+                        if flight_row[0] not in flights_written:
+                            flights_written.add(flight_row[0])
+                            new_flights.append(flight_row)
+                        passengers.append(passenger_row)
+                    
+                    total_rows += len(chunk)
+                    
+                    if dry_run:
+                        scoring_mismatches += check_scoring_equivalence(row_dicts)
+                    
+                    if not dry_run:
+                        if new_flights:
+                            copy_rows(cur, "l1.flight_events", FLIGHT_COLS, new_flights,
+                                      conflict_key=flight_key)
+                        copy_rows(cur, "l1.flight_passengers", PASSENGER_COLS, passengers,
+                                  conflict_key=passenger_key)
+                    
+                    print(f"    {total_rows:,} rows processed...", end="\r")
+            
+            print(f"  Processed {total_rows:,} L0 records" + (" (new or changed)" if incremental else ""))
+            print(f"  Extracted {len(flights_written)} unique flights")
+            
+            print_stats(stats)
+            
+            if dry_run:
+                print_scoring_check(scoring_mismatches, total_rows)
+                print("\n  [DRY RUN] No data written")
+                return
+            
+            if incremental:
+                _remove_stale_rows(cur, source_table)
+            
+            if owned:
+                conn.commit()
+            
+            print_l1_counts(cur, incremental)
+
+
+def transform_flight_logs_sql(
+    dry_run: bool = False,
+    incremental: bool = False,
+    conn=None,
+    source_table: str = L0_SOURCE_TABLE,
+):
+    """
+    Transform flight logs from core to L1 with set-based SQL.
+    
+    FL-1/FL-2/FL-3 and both IDs are computed inside PostgreSQL into a temp
+    table; flights are deduplicated with INSERT ... SELECT DISTINCT ON and
+    passengers inserted in one statement. No rows travel to Python except
+    in --dry-run, which checks the SQL results against the Python engine.
+    
+    Args:
+        dry_run: Stage and report without writing L1 tables
+        incremental: Same semantics as transform_flight_logs()
+        conn: Existing connection; the caller owns the transaction
+        source_table: L0 table to read
+    """
+    print("Transforming flight logs to L1 (SQL engine)...")
+    
+    with l1_connection(conn) as (conn, owned):
+        with conn.cursor() as cur:
+            cur.execute(PARSE_FLIGHT_DATE_DDL)
+            
+            # Clear existing L1 data
+            if not dry_run and not incremental:
+                cur.execute("TRUNCATE l1.flight_passengers CASCADE")
+                cur.execute("TRUNCATE l1.flight_events CASCADE")
+            
+            # Stage L0 rows with IDs, confidence and victim flag computed
+            cur.execute(SQL_SOURCE_DDL.format(base=l0_select_sql(incremental, source_table)))
+            
+            stats, row_count, flight_count = sql_engine_stats(cur)
+            
+            if incremental:
+                print(f"  Processed {row_count:,} new or changed L0 records")
+            else:
+                print(f"  Processed {row_count:,} L0 records")
+            print(f"  Extracted {flight_count} unique flights")
+            
+            print_stats(stats, date_cache=False)
+            
+            if dry_run:
+                mismatches = check_engine_equivalence(cur)
+                print(f"\n  SQL vs Python engine check:")
+                if mismatches:
+                    print(f"    ✗ {mismatches:,} of {row_count:,} rows differ")
+                else:
+                    print(f"    ✓ All {row_count:,} rows match")
+                cur.execute(f"DROP TABLE {SQL_SOURCE_TABLE}")
+                print("\n  [DRY RUN] No data written")
+                return
+            
+            print("\n  Inserting flight events...")
+            flight_insert = SQL_FLIGHT_EVENTS_INSERT
+            if incremental:
+                flight_insert += on_conflict_clause("flight_id", FLIGHT_COLS)
+            cur.execute(flight_insert)
+            
+            print("  Inserting passenger records...")
+            passenger_insert = SQL_FLIGHT_PASSENGERS_INSERT
+            if incremental:
+                passenger_insert += on_conflict_clause("passenger_id", PASSENGER_COLS)
+            cur.execute(passenger_insert)
+            
+            # Dropped explicitly so several runs can share one transaction
+            cur.execute(f"DROP TABLE {SQL_SOURCE_TABLE}")
+            
+            if incremental:
+                _remove_stale_rows(cur, source_table)
+            
+            if owned:
+                conn.commit()
+            
+            print_l1_counts(cur, incremental)
+
+
+def print_l1_counts(cur, incremental: bool = False):
+    """Print post-commit L1 row counts."""
+    cur.execute("SELECT COUNT(*) FROM l1.flight_events")
+    row = cur.fetchone()
+    event_count = row[0] if row else 0
+    
+    cur.execute("SELECT COUNT(*) FROM l1.flight_passengers")
+    row = cur.fetchone()
+    pass_count = row[0] if row else 0
+    
+    cur.execute("SELECT COUNT(*) FROM l1.flight_passengers_public")
+    row = cur.fetchone()
+    public_count = row[0] if row else 0
+    
+    verb = "L1 now has" if incremental else "Inserted"
+    print(f"\n  ✓ {verb} {event_count} flight events")
+    print(f"  ✓ {verb} {pass_count} passenger records")
+    print(f"  ✓ Public view contains {public_count} records ({pass_count - public_count} suppressed)")
+
+
+def _remove_stale_rows(cur, source_table: str = L0_SOURCE_TABLE):
+    """
+    Incremental mode cleanup after upserts.
+    
+    Deletes passengers whose core row is gone, then flights that no longer
+    have any passenger (e.g. a row's date or route was corrected, moving it
+    to a different flight_id).
+    """
+    cur.execute(f"""
+        DELETE FROM l1.flight_passengers fp
+        WHERE NOT EXISTS (SELECT 1 FROM {source_table} fl WHERE fl.id = fp.l0_id)
+    """)
+    removed_passengers = cur.rowcount
+    
+    cur.execute("""
+        DELETE FROM l1.flight_events fe
+        WHERE NOT EXISTS (SELECT 1 FROM l1.flight_passengers fp WHERE fp.flight_id = fe.flight_id)
+    """)
+    removed_flights = cur.rowcount
+    
+    print(f"  Removed {removed_passengers} stale passenger records, {removed_flights} empty flights")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Transform flight logs to L1")
     parser.add_argument("--dry-run", action="store_true",
                         help="Process without writing to database")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only transform new/changed L0 rows and upsert them (no TRUNCATE)")
+    parser.add_argument("--engine", choices=ENGINES, default="python",
+                        help="python: transform rows client-side; sql: set-based transform inside PostgreSQL")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read core via a server-side cursor and write in chunks (bounded memory)")
+    parser.add_argument("--chunk-size", type=int, default=STREAM_CHUNK_SIZE,
+                        help=f"Rows per chunk in --stream mode (default: {STREAM_CHUNK_SIZE})")
     args = parser.parse_args()
     
     print("=" * 60)
     print("Epstein Files ARD - Flight Logs L1 Transform")
     print("=" * 60)
     
+    if args.stream and args.engine == "sql":
+        parser.error("--stream only applies to --engine python")
+    
     try:
-        transform_flight_logs(dry_run=args.dry_run)
+        if args.engine == "sql":
+            transform_flight_logs_sql(dry_run=args.dry_run, incremental=args.incremental)
+        elif args.stream:
+            transform_flight_logs_streaming(
+                dry_run=args.dry_run,
+                incremental=args.incremental,
+                chunk_size=args.chunk_size
+            )
+        else:
+            transform_flight_logs(dry_run=args.dry_run, incremental=args.incremental)
         print("\n✓ Transform completed successfully")
         return 0
     except Exception as e:
@@ -24,6 +24,10 @@ from collections import Counter, defaultdict
 
 from datetime import datetime
 
+# Shared FL-3 date parser lives with the processing scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "processing"))
+from date_normalization import date_cache_stats, parse_flight_date  # noqa: E402
+
 # Paths relative to repo root
 REPO_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = REPO_ROOT / "data" / "layer-0-canonical"
@@ -117,6 +121,29 @@ def audit_flight_logs(rows: list[dict]) -> dict:
         "samples": date_issues[:5]
     }
     
+    # Calendar validity and range (FL-3 parser, shared memoized cache)
+    invalid_dates = []
+    parsed_dates = []
+    for i, r in enumerate(rows):
+        date_val = r.get("Date", "")
+        if not date_val or not date_pattern.match(date_val):
+            continue
+        parsed = parse_flight_date(date_val)
+        if parsed is None:
+            invalid_dates.append({"row": i+2, "value": date_val})
+        else:
+            parsed_dates.append(parsed)
+    metrics["patterns"]["invalid_calendar_dates"] = {
+        "count": len(invalid_dates),
+        "samples": invalid_dates[:5]
+    }
+    if parsed_dates:
+        metrics["patterns"]["date_range"] = {
+            "min": min(parsed_dates).isoformat(),
+            "max": max(parsed_dates).isoformat()
+        }
+    metrics["patterns"]["date_cache"] = date_cache_stats()
+    
     # Tail number check (should be N-number)
     tail_pattern = re.compile(r'^N[0-9A-Z]+$')
     tail_issues = []
@@ -361,12 +388,18 @@ def print_summary(flight_metrics: dict, book_metrics: dict):
     
     print("\nPattern Issues:")
     print(f"  Date format issues: {flight_metrics['patterns']['date_format_issues']['count']}")
+    print(f"  Invalid calendar dates: {flight_metrics['patterns']['invalid_calendar_dates']['count']}")
     print(f"  Tail number issues: {flight_metrics['patterns']['tail_number_issues']['count']}")
     print(f"  Pass # issues: {flight_metrics['patterns']['pass_number_issues']['count']}")
     
     if flight_metrics['patterns'].get('year_range'):
         yr = flight_metrics['patterns']['year_range']
         print(f"  Year range: {yr['min']} - {yr['max']}")
+    if flight_metrics['patterns'].get('date_range'):
+        dr = flight_metrics['patterns']['date_range']
+        print(f"  Date range: {dr['min']} - {dr['max']}")
+    dc = flight_metrics['patterns']['date_cache']
+    print(f"  Date cache: {dc['size']:,} distinct, {dc['hits']:,} hits / {dc['misses']:,} misses")
     
     dup = flight_metrics['anomalies']['duplicate_unique_ids']
     print(f"  Duplicate Unique IDs: {dup['count']} ({dup['total_duplicate_rows']} extra rows)")
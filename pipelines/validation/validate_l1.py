@@ -5,7 +5,7 @@ Validate Layer 1 Data Quality
 Runs comprehensive validation checks:
 1. L0 → L1 completeness (no orphans)
 2. Foreign key integrity
-3. Phone normalization success rate
+3. Phone normalization success rate (and re-check via the phone cache)
 4. Name parse success rate
 5. Identity confidence distribution
 6. Entity type distribution
@@ -34,6 +34,10 @@ from dotenv import load_dotenv
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
+# BB-2 normalization (and its persistent result cache) lives with the transform
+sys.path.insert(0, str(PROJECT_ROOT / "pipelines" / "processing"))
+import transform_black_book_l1 as black_book_l1  # noqa: E402
+
 # Configuration
 PGSQL_HOST = os.getenv("PGSQL_HOST")
 PGSQL_PORT = os.getenv("PGSQL_PORT", "5432")
@@ -264,6 +268,27 @@ def validate_l1():
                 "by_type": phone_by_type
             }
             
+            # Re-derive stored results; numbers the transform already parsed
+            # come from the shared on-disk phone cache
+            if black_book_l1.PHONENUMBERS_AVAILABLE:
+                cache = black_book_l1.configure_phone_cache()
+                cur.execute("""
+                    SELECT raw_value, parse_region, e164_format
+                    FROM l1.phone_numbers
+                    WHERE raw_value IS NOT NULL AND parse_region IS NOT NULL
+                """)
+                recheck_mismatches = sum(
+                    1 for raw, region, e164 in cur.fetchall()
+                    if black_book_l1.normalize_phone_in_region(raw, region)["e164_format"] != e164
+                )
+                cache_stats = cache.stats()
+                cache.close()
+                
+                print(f"\n  Re-check vs phonenumbers: {recheck_mismatches:,} mismatches "
+                      f"(cache hit rate {cache_stats['hit_rate']:.1%})")
+                metrics["phone_numbers"]["recheck_mismatches"] = recheck_mismatches
+                metrics["phone_numbers"]["recheck_cache"] = cache_stats
+            
             # =================================================================
             # 6. Identity Mentions Analysis
             # =================================================================
@@ -420,6 +445,10 @@ def validate_l1():
                 print(f"⚠ Phone normalization: {metrics['phone_numbers']['valid_percent']:.1f}% valid (low)")
                 issues.append(f"WARN: Phone normalization rate below 40%")
             
+            if metrics["phone_numbers"].get("recheck_mismatches"):
+                print(f"⚠ Phone re-check: {metrics['phone_numbers']['recheck_mismatches']:,} stored E.164 values differ")
+                issues.append("WARN: Stored phone normalization differs from current phonenumbers output")
+            
             # Check identity mentions coverage
             total_expected = counts["l1.flight_passengers"] + counts["l1.contact_persons"]
             # Note: flight passengers filtered by confidence, contacts filtered by entity type